@@ -0,0 +1,112 @@
+# :coding: utf-8
+""" Compares the size and load time of a 100k key clip saved as .kclip, JSON and a Python repr.
+
+The JSON and repr files hold the nested lists animMod.getAnimData returns, the repr is read back with eval like
+the aTools persistence helpers do.
+
+Usage:
+    python benchmarks/bench_clip.py
+"""
+
+# Python Modules
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Project Modules
+from kid.core import KAnimCurve
+from kid.io import Kclip, Kjson
+
+CURVES = 1000
+KEYS = 100
+
+
+def build_curves():
+    curves = dict()
+
+    for index in range(CURVES):
+        times = [float(frame) for frame in range(KEYS)]
+        values = [((frame * (index + 1)) % 17) * 0.5 for frame in range(KEYS)]
+        curves["node{}.attribute{}".format(index // 10, index % 10)] = KAnimCurve.from_keys(times, values)
+
+    return curves
+
+
+def to_anim_data(curves):
+    """ Returns the curves in the animMod.getAnimData layout.
+    """
+    objects = sorted(set(target.split(".")[0] for target in curves))
+    anim_data = {"objects": objects, "animData": list()}
+
+    for target, curve in curves.items():
+        columns = curve.columns()
+        keyframes = [[time, value, False] for time, value in zip(columns["times"], columns["values"])]
+        tangents = [["auto", "auto", 1.0, in_slope, 1.0, out_slope, True, True]
+                    for in_slope, out_slope in zip(columns["in_slopes"], columns["out_slopes"])]
+        anim_data["animData"].append({"objAttr": target, "curveData": [False, [u"constant", u"constant"]],
+                                      "keyframeData": keyframes, "tangentData": tangents})
+
+    return anim_data
+
+
+def measure(function, repeat=3):
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def read_repr(path):
+    with open(path, "r") as stream:
+        return eval(stream.read())
+
+
+def read_clip(path):
+    with Kclip.read(path).data as curves:
+        return curves
+
+
+def read_clip_curve(path):
+    with Kclip.read(path).data as curves:
+        return curves["node0.attribute0"]
+
+
+def read_clip_all(path):
+    with Kclip.read(path).data as curves:
+        curves.load_all()
+        return curves
+
+
+if __name__ == '__main__':
+    _curves = build_curves()
+    _anim_data = to_anim_data(_curves)
+    _directory = tempfile.mkdtemp()
+    _clip_path = os.path.join(_directory, "clip.kclip")
+    _json_path = os.path.join(_directory, "clip.json")
+    _repr_path = os.path.join(_directory, "clip.txt")
+
+    Kclip.write(_clip_path, _curves)
+    Kjson.write(_json_path, _anim_data)
+
+    with open(_repr_path, "w") as _stream:
+        _stream.write(repr(_anim_data))
+
+    print("keys: {}".format(CURVES * KEYS))
+    print("{:<14}{:>12}{:>12}".format("format", "size (KB)", "load (s)"))
+
+    # kclip only reads the index, kclip 1 curve loads one curve and kclip all every curve like json and repr.
+    for _name, _path, _function in (("kclip", _clip_path, read_clip),
+                                    ("kclip 1 curve", _clip_path, read_clip_curve),
+                                    ("kclip all", _clip_path, read_clip_all),
+                                    ("json", _json_path, Kjson.read),
+                                    ("repr", _repr_path, read_repr)):
+        _elapsed = measure(lambda: _function(_path))
+        print("{:<14}{:>12.1f}{:>12.4f}".format(_name, os.path.getsize(_path) / 1024.0, _elapsed))
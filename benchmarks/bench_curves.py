@@ -0,0 +1,67 @@
+# :coding: utf-8
+""" Times copying and pasting a 10k key clip with KCurveExtractor and KCurveApplier.
+
+The clip is 20 transforms with 5 keyed channels of 100 keys each. It is read from the source transforms and
+pasted onto copies of them as one undoable operation.
+
+Usage:
+    mayapy benchmarks/bench_curves.py
+"""
+
+# Python Modules
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+# Maya Modules
+import maya.standalone
+
+maya.standalone.initialize()
+
+import maya.cmds as cmds
+
+# Project Modules
+from kid.core import KCurveExtractor, KCurveApplier
+
+TRANSFORMS = 20
+CHANNELS = ["translateX", "translateY", "translateZ", "rotateX", "rotateY"]
+KEYS = 100
+
+
+def build_rig():
+    sources = list()
+    targets = dict()
+
+    for index in range(TRANSFORMS):
+        source = cmds.createNode("transform", name="source{}".format(index))
+        targets[source] = cmds.createNode("transform", name="target{}".format(index))
+
+        for channel_index, channel in enumerate(CHANNELS):
+            for frame in range(KEYS):
+                cmds.setKeyframe(source, attribute=channel, time=frame, value=(frame * (channel_index + 1)) % 11)
+
+        sources.append(source)
+
+    return sources, targets
+
+
+if __name__ == '__main__':
+    try:
+        cmds.loadPlugin(os.path.join(ROOT, "plug-ins", "plugin_kid.py"), quiet=True)
+    except RuntimeError:
+        pass
+
+    _sources, _targets = build_rig()
+
+    _start = time.perf_counter()
+    _curves = KCurveExtractor().extract(_sources)
+    _extracted = time.perf_counter()
+    KCurveApplier().apply(_curves, mapping=_targets)
+    _applied = time.perf_counter()
+
+    print("keys: {}".format(sum(len(curve) for curve in _curves.values())))
+    print("extract: {:.4f}s".format(_extracted - _start))
+    print("apply:   {:.4f}s".format(_applied - _extracted))
@@ -0,0 +1,83 @@
+# :coding: utf-8
+""" Compares the cmds inbetween with the API engine on a rig of 500 animated curves.
+
+The rig is 50 transforms with 10 keyed channels each, keyed every 4 frames from frame 1 to 100. Both versions key
+every curve at frame 50 halfway between its neighbour keys.
+
+Usage:
+    mayapy benchmarks/bench_inbetween.py
+"""
+
+# Python Modules
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+# Maya Modules
+import maya.standalone
+
+maya.standalone.initialize()
+
+import maya.cmds as cmds
+
+# Project Modules
+from kidmaya.tools.inbetween import Inbetween
+
+TRANSFORMS = 50
+CHANNELS = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ",
+            "scaleX", "scaleY", "scaleZ", "visibility"]
+FRAMES = range(1, 101, 4)
+FRAME = 50
+REPEAT = 5
+
+
+def build_rig():
+    transforms = list()
+
+    for index in range(TRANSFORMS):
+        transform = cmds.createNode("transform", name="inbetween{}".format(index))
+
+        for channel_index, channel in enumerate(CHANNELS):
+            for frame in FRAMES:
+                cmds.setKeyframe(transform, attribute=channel, time=frame, value=(frame + channel_index) % 7)
+
+        transforms.append(transform)
+
+    return transforms
+
+
+def favor_cmds(transforms, weight):
+    for transform in transforms:
+        for channel in CHANNELS:
+            Inbetween.favor(transform, channel, weight)
+
+
+def measure(function):
+    best = None
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+if __name__ == '__main__':
+    try:
+        cmds.loadPlugin(os.path.join(ROOT, "plug-ins", "plugin_kid.py"), quiet=True)
+    except RuntimeError:
+        pass
+
+    _transforms = build_rig()
+    cmds.currentTime(FRAME)
+
+    _cmds = measure(lambda: favor_cmds(_transforms, 0.5))
+    _api = measure(lambda: Inbetween.favor_curves(_transforms, 0.5, FRAME))
+    print("curves: {}".format(len(_transforms) * len(CHANNELS)))
+    print("cmds: {:.4f}s".format(_cmds))
+    print("api:  {:.4f}s ({:.1f}x)".format(_api, _cmds / _api))
@@ -0,0 +1,73 @@
+# :coding: utf-8
+""" Micro-benchmark of a 3 matrix product, the offset * parent * parent inverse chain of KDummyConstraint.
+
+Usage:
+    python benchmarks/bench_kmatrix4_chain.py
+"""
+
+# Python Modules
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Project Modules
+from kid.core.kmatrix import KMatrix
+from kid.core.kmatrix4 import KMatrix4
+
+
+def random_matrix(seed):
+    rng = random.Random(seed)
+    return KMatrix4.from_xform([rng.uniform(-1.0, 1.0) for _ in range(16)])
+
+
+def run(number=20000):
+    a = random_matrix(0)
+    b = random_matrix(1)
+    c = random_matrix(2)
+    out = KMatrix4()
+    rows_a, rows_b, rows_c = a.as_list(), b.as_list(), c.as_list()
+
+    def original():
+        # The triple loop over lists of rows, what a * b * c ran before the flat storage.
+        KMatrix.multiply_matrix(KMatrix.multiply_matrix(rows_a, rows_b), rows_c)
+
+    def generic():
+        # The NxN KMatrix product over the flat storage, with an intermediate matrix.
+        KMatrix.__mul__(KMatrix.__mul__(a, b), c)
+
+    def operators():
+        a * b * c
+
+    def chain():
+        KMatrix4.chain(a, b, c)
+
+    def chain_out():
+        KMatrix4.chain(a, b, c, out=out)
+
+    def in_place():
+        a.multiply_into(b, out)
+        out.multiply_into(c, out)
+
+    results = list()
+
+    for name, function in (("list of rows (original)", original),
+                           ("generic KMatrix.__mul__", generic),
+                           ("a * b * c", operators),
+                           ("KMatrix4.chain", chain),
+                           ("KMatrix4.chain(out=)", chain_out),
+                           ("multiply_into x2", in_place)):
+        best = min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+        results.append((name, best))
+
+    baseline = results[0][1]
+
+    for name, best in results:
+        print("{:<26}{:>10.2f} us{:>8.1f}x".format(name, best, baseline / best))
+    return
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,108 @@
+# :coding: utf-8
+""" Compares the LU determinant/inverse of KMatrix against the previous cofactor expansion.
+
+Usage:
+    python benchmarks/bench_kmatrix_lu.py
+"""
+
+# Python Modules
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Project Modules
+from kid.core.kmatrix import KMatrix
+
+
+def cofactor_minor(matrix, row_index, column_index):
+    return [row[:column_index] + row[column_index + 1:] for row in (matrix[:row_index] + matrix[row_index + 1:])]
+
+
+def cofactor_determinant(matrix):
+    """ Reference implementation, the recursive cofactor expansion KMatrix used before KMatrixLU.
+    """
+    if len(matrix) == 2:
+        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+
+    determinant = 0
+
+    for c in range(len(matrix)):
+        determinant += ((-1) ** c) * matrix[0][c] * cofactor_determinant(cofactor_minor(matrix, 0, c))
+    return determinant
+
+
+def cofactor_inverse(matrix):
+    """ Reference implementation, the adjugate inverse KMatrix used before KMatrixLU.
+    """
+    determinant = cofactor_determinant(matrix)
+    cofactors = list()
+
+    for row in range(len(matrix)):
+        cofactor_row = list()
+
+        for column in range(len(matrix)):
+            minor = cofactor_minor(matrix, row, column)
+            cofactor_row.append(((-1) ** (row + column)) * cofactor_determinant(minor))
+        cofactors.append(cofactor_row)
+
+    cofactors = list(map(list, zip(*cofactors)))
+
+    for row in range(len(cofactors)):
+        for column in range(len(cofactors)):
+            cofactors[row][column] = cofactors[row][column] / determinant
+
+    return cofactors
+
+
+def random_matrix(size, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1.0, 1.0) for _ in range(size)] for _ in range(size)]
+
+
+def measure(function, number):
+    """ Returns the best time per call in microseconds.
+    """
+    times = timeit.repeat(function, number=number, repeat=3)
+    return min(times) / number * 1e6
+
+
+def run():
+    print("{:<6}{:<14}{:>16}{:>16}{:>10}".format("size", "operation", "cofactor (us)", "lu (us)", "speedup"))
+
+    for size, number in ((3, 2000), (4, 1000), (8, 2)):
+        matrix = random_matrix(size)
+
+        # Sanity check, both paths should agree before timing them.
+        expected = cofactor_inverse(matrix)
+        result = KMatrix.get_matrix_inverse(matrix)
+        error = max(abs(expected[i][j] - result[i][j]) for i in range(size) for j in range(size))
+        assert error < 1e-8, "Inverse mismatch {}".format(error)
+
+        for name, legacy, current in (
+                ("determinant", cofactor_determinant, KMatrix.get_matrix_deternminant),
+                ("inverse", cofactor_inverse, KMatrix.get_matrix_inverse),
+                ):
+            legacy_time = measure(lambda: legacy(matrix), number)
+            current_time = measure(lambda: current(matrix), number * 10)
+            print("{:<6}{:<14}{:>16.2f}{:>16.2f}{:>9.1f}x".format(
+                "{0}x{0}".format(size), name, legacy_time, current_time, legacy_time / current_time))
+
+    # Reusing one factorization for a determinant, an inverse and a solve.
+    matrix = random_matrix(4)
+    b = [1.0, 2.0, 3.0, 4.0]
+
+    def reuse():
+        lu = KMatrix.get_matrix_lu(matrix)
+        lu.determinant()
+        lu.inverse()
+        lu.solve(b)
+
+    print("4x4 det + inverse + solve, one factorization: {:.2f} us".format(measure(reuse, 10000)))
+    return
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,109 @@
+# :coding: utf-8
+""" Compares 1M vector additions with the previous property based KVector3, the slotted one and KVector3Array.
+
+Usage:
+    python benchmarks/bench_kvector3.py
+"""
+
+# Python Modules
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Project Modules
+from kid.core.kvector3 import KVector3
+from kid.core.kvector3array import KVector3Array
+
+COUNT = 1000000
+
+
+class PropertyVector3(object):
+    """ Reference implementation, the property based KVector3 before it used __slots__.
+    """
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
+
+    @property
+    def x(self):
+        return self._x
+
+    @property
+    def y(self):
+        return self._y
+
+    @property
+    def z(self):
+        return self._z
+
+    def __add__(self, other):
+        if isinstance(other, float):
+            return PropertyVector3(self.x + other, self.y + other, self.z + other)
+
+        elif isinstance(other, int):
+            other = float(other)
+            return PropertyVector3(self.x + other, self.y + other, self.z + other)
+
+        elif isinstance(other, (tuple, list)):
+            return PropertyVector3(self.x + other[0], self.y + other[1], self.z + other[2])
+
+        elif isinstance(other, PropertyVector3):
+            return PropertyVector3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+        raise ArithmeticError("Invalid type.")
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run():
+    property_a = [PropertyVector3(i, i, i) for i in range(COUNT)]
+    property_b = [PropertyVector3(1.0, 2.0, 3.0) for _ in range(COUNT)]
+    slotted_a = [KVector3(i, i, i) for i in range(COUNT)]
+    slotted_b = [KVector3(1.0, 2.0, 3.0) for _ in range(COUNT)]
+
+    def property_add():
+        [a + b for a, b in zip(property_a, property_b)]
+
+    def slotted_add():
+        [a + b for a, b in zip(slotted_a, slotted_b)]
+
+    def slotted_iadd():
+        for a, b in zip(slotted_a, slotted_b):
+            a += b
+
+    results = [("property KVector3 a + b", timed(property_add)),
+               ("slotted KVector3 a + b", timed(slotted_add)),
+               ("slotted KVector3 a += b", timed(slotted_iadd))]
+
+    for has_numpy in (False, True):
+        if has_numpy and not KVector3Array.HAS_NUMPY:
+            continue
+
+        previous = KVector3Array.HAS_NUMPY
+        KVector3Array.HAS_NUMPY = has_numpy
+
+        try:
+            array_a = KVector3Array.from_values([float(i) for i in range(COUNT) for _ in range(3)])
+            array_b = KVector3Array.from_values([1.0, 2.0, 3.0] * COUNT)
+            label = "numpy" if has_numpy else "python"
+            results.append(("KVector3Array a + b ({})".format(label), timed(lambda: array_a + array_b)))
+            results.append(("KVector3Array a += b ({})".format(label), timed(lambda: array_a.__iadd__(array_b))))
+        finally:
+            KVector3Array.HAS_NUMPY = previous
+
+    baseline = results[0][1]
+
+    for name, seconds in results:
+        print("{:<34}{:>10.4f} s{:>9.1f}x".format(name, seconds, baseline / seconds))
+    return
+
+
+if __name__ == '__main__':
+    run()
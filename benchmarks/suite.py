@@ -0,0 +1,299 @@
+# :coding: utf-8
+""" Benchmark suite of the kid.core math, runs without Maya.
+
+Every case reports the operations per second and the memory one operation allocates, measured with tracemalloc:
+
+    * alloc_blocks/alloc_bytes: blocks and bytes still alive after one call, what the returned objects cost.
+    * peak_bytes: the highest memory used during one call, temporaries included.
+
+Results can be saved to JSON and compared with a previous run, for example between two commits:
+
+    python benchmarks/suite.py --output before.json
+    git checkout other-branch
+    python benchmarks/suite.py --output after.json --compare before.json
+
+Usage:
+    python benchmarks/suite.py [--filter kmatrix4] [--number 10000] [--output results.json]
+                               [--compare baseline.json] [--threshold 0.1]
+"""
+
+# Python Modules
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+# Project Modules
+from kid.core.keuler import KEuler
+from kid.core.kmath import KMath
+from kid.core.kmatrix import KMatrix
+from kid.core.kmatrix4 import KMatrix4
+from kid.core.kpath import KPath
+from kid.core.kvector3 import KVector3
+
+VERSION = 1
+DEFAULT_NUMBER = 10000
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+
+
+# Fixtures
+def random_xform(rng, scale=1.0):
+    """ Returns a random translate, rotate, scale matrix as 16 floats.
+    """
+    rotation = KEuler(rng.uniform(-80.0, 80.0), rng.uniform(-80.0, 80.0), rng.uniform(-80.0, 80.0))
+    axes = rotation.as_axes()
+    xform = list()
+
+    for axis in axes:
+        length = rng.uniform(0.5, 2.0) * scale
+        xform.extend((axis[0] * length, axis[1] * length, axis[2] * length, 0.0))
+
+    xform.extend((rng.uniform(-10.0, 10.0), rng.uniform(-10.0, 10.0), rng.uniform(-10.0, 10.0), 1.0))
+    return xform
+
+
+def get_cases():
+    """ Returns the benchmark cases as a list of (name, callable) sorted by module.
+
+    Returns:
+        list
+    """
+    rng = random.Random(0)
+
+    # KMatrix
+    generic_a = KMatrix(4, 4)
+    generic_a.set_data([random_xform(rng)[row * 4:row * 4 + 4] for row in range(4)])
+    generic_b = KMatrix(4, 4)
+    generic_b.set_data([random_xform(rng)[row * 4:row * 4 + 4] for row in range(4)])
+    nested = generic_a.as_list()
+
+    # KMatrix4
+    a = KMatrix4.from_xform(random_xform(rng))
+    b = KMatrix4.from_xform(random_xform(rng))
+    c = KMatrix4.from_xform(random_xform(rng))
+    out = KMatrix4()
+    values = [0.0] * 12
+
+    # KVector3
+    u = KVector3(1.0, 2.0, 3.0)
+    v = KVector3(-3.0, 0.5, 2.0)
+
+    # KEuler
+    euler = KEuler(30.0, -45.0, 60.0)
+    xforms = [value for _ in range(100) for value in random_xform(rng)]
+
+    # KPath
+    path = KPath(os.path.join(ROOT, "src", "kid", "core", "kmatrix4.py"))
+
+    return [
+        ("kmatrix.add", lambda: generic_a + generic_b),
+        ("kmatrix.multiply", lambda: generic_a * generic_b),
+        ("kmatrix.multiply_matrix", lambda: KMatrix.multiply_matrix(nested, nested)),
+        ("kmatrix.determinant", lambda: generic_a.determinant()),
+        ("kmatrix.inverse", lambda: KMatrix.get_matrix_inverse(nested)),
+        ("kmatrix4.multiply", lambda: a * b),
+        ("kmatrix4.multiply_into", lambda: a.multiply_into(b, out)),
+        ("kmatrix4.chain", lambda: KMatrix4.chain(a, b, c)),
+        ("kmatrix4.chain_out", lambda: KMatrix4.chain(a, b, c, out=out)),
+        ("kmatrix4.inverse_auto", lambda: a.inverse()),
+        ("kmatrix4.inverse_general", lambda: a.inverse(KMatrix4.INVERSE_GENERAL)),
+        ("kmatrix4.inverse_affine_out", lambda: a.inverse(KMatrix4.INVERSE_AFFINE, out)),
+        ("kmatrix4.decompose", lambda: a.decompose()),
+        ("kmatrix4.decompose_values_out", lambda: a.decompose_values(out=values)),
+        ("kvector3.add", lambda: u + v),
+        ("kvector3.iadd", lambda: u.__iadd__(v)),
+        ("kvector3.dot", lambda: u.dot(v)),
+        ("kvector3.cross", lambda: u.cross(v)),
+        ("kvector3.length", lambda: u.length()),
+        ("kvector3.normal", lambda: v.normal()),
+        ("keuler.from_matrix", lambda: KEuler.from_matrix(a)),
+        ("keuler.to_matrix", lambda: euler.to_matrix()),
+        ("keuler.reorder", lambda: euler.reorder(5)),
+        ("keuler.xforms_to_rotations_x100", lambda: KEuler.xforms_to_rotations(xforms)),
+        ("kmath.clamp", lambda: KMath.clamp(1.5, 0.0, 1.0)),
+        ("kmath.set_range", lambda: KMath.set_range(0.25, 0.0, 1.0, -10.0, 10.0)),
+        ("kpath.new", lambda: KPath("kid/core")),
+        ("kpath.add", lambda: path + "other"),
+        ("kpath.split", lambda: path.split()),
+        ("kpath.filename", lambda: path.filename()),
+    ]
+
+
+# Measurements
+def measure_time(function, number, repeat):
+    """ Returns the best seconds per call out of repeat runs of number calls.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def measure_memory(function, number):
+    """ Returns the blocks and bytes one call leaves allocated and the peak bytes of one call.
+
+    The results of every call are kept alive until the snapshot so what they allocated is counted.
+    """
+    results = [None] * number
+    function()
+
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+
+        for index in range(number):
+            results[index] = function()
+
+        after = tracemalloc.take_snapshot()
+
+        # The peak of a single call, tracemalloc.reset_peak() is only available from Python 3.9.
+        tracemalloc.stop()
+        tracemalloc.start()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    statistics = after.compare_to(before, "filename")
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    size = sum(statistic.size_diff for statistic in statistics)
+    del results
+    return max(blocks, 0) / float(number), max(size, 0) / float(number), peak
+
+
+def run(pattern=None, number=DEFAULT_NUMBER, repeat=DEFAULT_REPEAT):
+    """ Runs the cases whose name contains pattern and returns the results.
+
+    Args:
+        pattern(str)
+        number(int): Calls per timing run.
+        repeat(int): Timing runs, the fastest one is kept.
+
+    Returns:
+        dict
+    """
+    results = dict()
+
+    for name, function in get_cases():
+        if pattern and pattern not in name:
+            continue
+
+        seconds = measure_time(function, number, repeat)
+        blocks, size, peak = measure_memory(function, min(number, 1000))
+        results[name] = {
+            "ops_per_sec": 1.0 / seconds if seconds else float("inf"),
+            "us_per_op": seconds * 1e6,
+            "alloc_blocks": blocks,
+            "alloc_bytes": size,
+            "peak_bytes": peak,
+            }
+
+    return {"version": VERSION, "meta": get_meta(number, repeat), "results": results}
+
+
+def get_meta(number, repeat):
+    """ Returns where the results come from, so two files can be told apart.
+    """
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                         stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "number": number,
+        "repeat": repeat,
+        }
+
+
+# Reports
+def print_results(data):
+    print("commit {commit}, Python {python} ({platform})".format(**data["meta"]))
+    print("{:<36}{:>14}{:>11}{:>10}{:>12}{:>12}".format("case", "ops/sec", "us/op", "blocks", "bytes", "peak"))
+
+    for name, result in sorted(data["results"].items()):
+        print("{:<36}{:>14,.0f}{:>11.3f}{:>10.1f}{:>12.1f}{:>12}".format(
+            name, result["ops_per_sec"], result["us_per_op"], result["alloc_blocks"], result["alloc_bytes"],
+            result["peak_bytes"]))
+    return
+
+
+def compare(data, baseline, threshold=DEFAULT_THRESHOLD):
+    """ Prints the speed and allocation changes against a baseline and returns the regressed case names.
+
+    A case regresses when it runs threshold slower, or when one call leaves more blocks allocated.
+
+    Args:
+        data(dict): Current results.
+        baseline(dict): Results loaded from a previous run.
+        threshold(float): Relative slowdown allowed, 0.1 is 10%.
+
+    Returns:
+        list
+    """
+    regressions = list()
+    print("\ncompared with commit {}".format(baseline["meta"].get("commit")))
+    print("{:<36}{:>10}{:>12}  {}".format("case", "speed", "blocks", "status"))
+
+    for name, result in sorted(data["results"].items()):
+        previous = baseline["results"].get(name)
+
+        if previous is None:
+            print("{:<36}{:>10}{:>12}  new".format(name, "-", "-"))
+            continue
+
+        speed = result["ops_per_sec"] / previous["ops_per_sec"]
+        blocks = result["alloc_blocks"] - previous["alloc_blocks"]
+        regressed = speed < 1.0 - threshold or blocks > 0.5
+
+        if regressed:
+            regressions.append(name)
+
+        print("{:<36}{:>9.2f}x{:>+12.1f}  {}".format(name, speed, blocks, "REGRESSION" if regressed else "ok"))
+
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the kid.core math.")
+    parser.add_argument("--filter", dest="pattern", help="Only run the cases containing this text.")
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER, help="Calls per timing run.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timing runs, the best one is kept.")
+    parser.add_argument("--output", help="Saves the results to this JSON file.")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown.")
+    options = parser.parse_args(args)
+
+    data = run(options.pattern, options.number, options.repeat)
+    print_results(data)
+
+    if options.output:
+        with open(options.output, "w") as stream:
+            json.dump(data, stream, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare, "r") as stream:
+            baseline = json.load(stream)
+
+        if baseline.get("version") != VERSION:
+            raise ValueError("Unsupported results version {}.".format(baseline.get("version")))
+
+        if compare(data, baseline, options.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
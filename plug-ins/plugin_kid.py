@@ -2,6 +2,7 @@
 
 # Project Modules
 from kid.core.kglobals import MAYA_WINDOW_NAME
+from kid.core.kmodifier import KModifier
 from kidui import Toolbar
 
 # Python Modules
@@ -60,11 +61,39 @@ class KidCmd(OpenMayaMPx.MPxCommand):
         OpenMayaMPx.MPxCommand.__init__(self)
 
 
+class KidApplyModifierCmd(OpenMayaMPx.MPxCommand):
+    """ Applies the batch queued by KModifier.do_it() and keeps it to undo and redo it.
+    """
+    NAME = KModifier.COMMAND
+
+    @staticmethod
+    def creator():
+        return OpenMayaMPx.asMPxPtr(KidApplyModifierCmd())
+
+    def __init__(self):
+        OpenMayaMPx.MPxCommand.__init__(self)
+        self._modifier = None
+
+    def doIt(self, args):
+        self._modifier = KModifier.pop_pending()
+        self.redoIt()
+
+    def redoIt(self):
+        self._modifier.redo_it()
+
+    def undoIt(self):
+        self._modifier.undo_it()
+
+    def isUndoable(self):
+        return True
+
+
 def initializePlugin(obj):
     plugin = OpenMayaMPx.MFnPlugin(obj, "Justin Tirado", "1.0.0", "Any")
 
     try:
         plugin.registerCommand(KidCmd.NAME, KidCmd.creator, KidCmd.new_syntax)
+        plugin.registerCommand(KidApplyModifierCmd.NAME, KidApplyModifierCmd.creator)
         plugin.registerUI(KidCmd.create_ui, KidCmd.delete_ui)
         KidCmd.PLUGIN_PATH = os.path.split(plugin.loadPath())[0]
     except Exception:
@@ -77,6 +106,7 @@ def uninitializePlugin(mobject):
     plugin = OpenMayaMPx.MFnPlugin(mobject)
     try:
         plugin.deregisterCommand(KidCmd.NAME)
+        plugin.deregisterCommand(KidApplyModifierCmd.NAME)
     except Exception:
         sys.stderr.write("Failed to unregister command {}\n".format(KidCmd.NAME))
         raise
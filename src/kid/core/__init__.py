@@ -1,11 +1,36 @@
 from kid.core.keuler import KEuler
 from kid.core.kmatrix import KMatrix
+from kid.core.kmatrixlu import KMatrixLU
 from kid.core.kmatrix4 import KMatrix4
+from kid.core.kmatrix4array import KMatrix4Array
 from kid.core.kobject import KObject
-from kid.core.ktransform import KTransform
 from kid.core.kvector3 import KVector3
+from kid.core.kvector3array import KVector3Array
 from kid.core.kmath import KMath
-from kid.core.kanim import KAnim, KKeyFrame, KKeyTangent, KAnimCurve
-from kid.core.kattribute import KAttribute
+from kid.core.kquaternion import KQuaternion
 from kid.core.kdebug import KDebug
 from kid.core.kpath import KPath
+from kid.core.ksampler import KMatrixSampler, KSamplerEvaluator, KMayaSamplerEvaluator
+from kid.core.kdagcache import KDagCache, KDagCacheEvents, KMayaDagCacheEvents
+from kid.core.kinbetween import KInbetween
+from kid.core.kkeyframe import KKeyFrame, KKeyTangent
+from kid.core.kanimcurve import KAnimCurve
+from kid.core.kcurveextractor import KCurveExtractor, KCurveReader, KMayaCurveReader
+from kid.core.kcurveapplier import KCurveApplier, KCurveWriter, KMayaCurveWriter
+from kid.core.kkeyreducer import KKeyReducer
+from kid.core.kinbetweenprofile import (KInbetweenProfile, KOvershootProfile, KEaseProfile, KSpringProfile,
+                                       KTangentProfile)
+
+# Maya Modules, the modules above also work outside of Maya.
+try:
+    import maya.OpenMaya
+except ImportError:
+    HAS_MAYA = False
+else:
+    HAS_MAYA = True
+
+if HAS_MAYA:
+    from kid.core.kmodifier import KModifier
+    from kid.core.ktransform import KTransform
+    from kid.core.kanim import KAnim
+    from kid.core.kattribute import KAttribute
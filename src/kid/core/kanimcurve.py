@@ -5,17 +5,909 @@ from kid.core.kobject import KObject
 from kid.core.kkeyframe import KKeyTangent, KKeyFrame
 
 # Python Modules
+from array import array
+from bisect import bisect_left, bisect_right
+import math
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class KAnimCurve(KObject):
-    """
+    """ Class that holds and evaluates an animation curve outside of Maya.
+
+    The keys are stored in parallel columns, one entry per key: times, values, in and out slopes, in and out
+    weights are array('d'), in and out tangent types, breakdowns, tangent and weight locks are array('b'). Times
+    are frames, slopes are value per frame.
+
+    A segment is a cubic Bezier between two keys, like Maya: the control points are a third of the tangent weight
+    away from the keys along their tangents. Unweighted curves use the time between the keys as the weight, which
+    makes the segment a cubic Hermite. Step tangents hold the value of the key until the next one, step next jumps
+    to the next value right after the key.
 
+    With NumPy evaluate_times() is vectorized, without NumPy it loops over evaluate().
+
+    References:
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_anim_1_1_m_fn_anim_curve_html
+        * https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+
+    Args:
+        fps(float): Frames per second of the curve times.
     """
-    def __init__(self):
-        self._keys = list()
-        self._fps = 24.0
+    HAS_NUMPY = numpy is not None
 
+    # Tangent types, same values as OpenMayaAnim.MFnAnimCurve.
+    TANGENT_GLOBAL = 0
+    TANGENT_FIXED = 1
+    TANGENT_LINEAR = 2
+    TANGENT_FLAT = 3
+    TANGENT_SMOOTH = 4
+    TANGENT_STEP = 5
+    TANGENT_SLOW = 6
+    TANGENT_FAST = 7
+    TANGENT_CLAMPED = 8
+    TANGENT_PLATEAU = 9
+    TANGENT_STEP_NEXT = 10
+    TANGENT_AUTO = 11
 
-if __name__ == '__main__':
-    pass
+    # Infinity types, same values as OpenMayaAnim.MFnAnimCurve.
+    INFINITY_CONSTANT = 0
+    INFINITY_LINEAR = 1
+    INFINITY_CYCLE = 3
+    INFINITY_CYCLE_RELATIVE = 4
+    INFINITY_OSCILLATE = 5
+
+    # Newton iterations solving the time of weighted segments.
+    ITERATIONS = 8
+
+    # Name, array type code and default value of every column.
+    COLUMNS = (("times", "d", 0.0),
+               ("values", "d", 0.0),
+               ("in_slopes", "d", 0.0),
+               ("out_slopes", "d", 0.0),
+               ("in_weights", "d", 0.0),
+               ("out_weights", "d", 0.0),
+               ("in_types", "b", TANGENT_AUTO),
+               ("out_types", "b", TANGENT_AUTO),
+               ("breakdowns", "b", 0),
+               ("tangent_locks", "b", 1),
+               ("weight_locks", "b", 1))
+
+    # Static Methods
+    @staticmethod
+    def get_bezier(p0, p1, p2, p3, u):
+        """ Returns a cubic Bezier at u.
+
+        Args:
+            p0(float)
+            p1(float)
+            p2(float)
+            p3(float)
+            u(float): 0.0 to 1.0
+
+        Returns:
+            float
+        """
+        v = 1.0 - u
+        return v * v * v * p0 + 3.0 * v * v * u * p1 + 3.0 * v * u * u * p2 + u * u * u * p3
+
+    @staticmethod
+    def solve_bezier(x0, x1, x2, x3, x, iterations=8):
+        """ Returns the u of a monotonic cubic Bezier at x, with Newton iterations.
+
+        Args:
+            x0(float)
+            x1(float)
+            x2(float)
+            x3(float)
+            x(float)
+            iterations(int)
+
+        Returns:
+            float
+        """
+        span = x3 - x0
+
+        if span <= 0.0:
+            return 0.0
+
+        u = (x - x0) / span
+
+        for _ in range(iterations):
+            v = 1.0 - u
+            error = v * v * v * x0 + 3.0 * v * v * u * x1 + 3.0 * v * u * u * x2 + u * u * u * x3 - x
+            slope = 3.0 * (v * v * (x1 - x0) + 2.0 * v * u * (x2 - x1) + u * u * (x3 - x2))
+
+            if not slope:
+                break
+
+            u = min(max(u - error / slope, 0.0), 1.0)
+
+        return u
+
+    @staticmethod
+    def get_segment_points(t0, v0, t1, v1, out_slope, in_slope, out_weight=0.0, in_weight=0.0):
+        """ Returns the Bezier control points of a segment between two keys.
+
+        Args:
+            t0(float): Time of the first key.
+            v0(float): Value of the first key.
+            t1(float): Time of the second key.
+            v1(float): Value of the second key.
+            out_slope(float): Out slope of the first key.
+            in_slope(float): In slope of the second key.
+            out_weight(float): Out weight of the first key, the time between the keys if 0.0.
+            in_weight(float): In weight of the second key, the time between the keys if 0.0.
+
+        Returns:
+            tuple: (x0, y0, x1, y1, x2, y2, x3, y3)
+        """
+        span = t1 - t0
+        out_weight = (out_weight or span) / 3.0
+        in_weight = (in_weight or span) / 3.0
+        return (t0, v0,
+                t0 + out_weight, v0 + out_slope * out_weight,
+                t1 - in_weight, v1 - in_slope * in_weight,
+                t1, v1)
+
+    @staticmethod
+    def get_segment_value(points, time, weighted=False):
+        """ Returns the value of a segment at time from its control points.
+
+        Args:
+            points(tuple): Returned by get_segment_points().
+            time(float): Between the times of the keys.
+            weighted(bool): Solves the Bezier parameter of the time, unweighted segments are linear in time.
+
+        Returns:
+            float
+        """
+        x0, y0, x1, y1, x2, y2, x3, y3 = points
+
+        if weighted:
+            u = KAnimCurve.solve_bezier(x0, x1, x2, x3, time, KAnimCurve.ITERATIONS)
+        else:
+            u = (time - x0) / (x3 - x0)
+
+        return KAnimCurve.get_bezier(y0, y1, y2, y3, u)
+
+    # Class Methods
+    @classmethod
+    def from_keys(cls, times, values, tangent_type=TANGENT_AUTO, fps=24.0):
+        """ Returns a new KAnimCurve with keys whose tangents are computed from their type.
+
+        Args:
+            times(list)
+            values(list)
+            tangent_type(int)
+            fps(float)
+
+        Returns:
+            KAnimCurve
+        """
+        obj = cls(fps)
+        obj.add_keys(times, values, in_types=tangent_type, out_types=tangent_type)
+        return obj
+
+    @classmethod
+    def from_columns(cls, columns, fps=24.0, weighted=False, pre_infinity=0, post_infinity=0):
+        """ Returns a new KAnimCurve from columns of keys already sorted by time, the slopes are kept as they are.
+
+        Columns that already are arrays of the right type are owned by the curve instead of being copied.
+
+        Args:
+            columns(dict): Column name to values, see COLUMNS, missing columns are filled with their default.
+            fps(float)
+            weighted(bool)
+            pre_infinity(int)
+            post_infinity(int)
+
+        Returns:
+            KAnimCurve
+        """
+        obj = cls(fps)
+        count = len(columns["times"])
+
+        for name, code, default in cls.COLUMNS:
+            data = columns.get(name)
+
+            if data is None:
+                data = array(code, [default]) * count
+            elif not isinstance(data, array) or data.typecode != code:
+                data = array(code, data)
+
+            if len(data) != count:
+                raise ValueError("Column {} and times are NOT the same size.".format(name))
+
+            setattr(obj, "_" + name, data)
+
+        obj.set_weighted(weighted)
+        obj.set_infinity(pre_infinity, post_infinity)
+        return obj
+
+    # Object Methods
+    def __init__(self, fps=24.0):
+        self._fps = float(fps)
+        self._times = array("d")
+        self._values = array("d")
+        self._in_slopes = array("d")
+        self._out_slopes = array("d")
+        self._in_weights = array("d")
+        self._out_weights = array("d")
+        self._in_types = array("b")
+        self._out_types = array("b")
+        self._breakdowns = array("b")
+        self._tangent_locks = array("b")
+        self._weight_locks = array("b")
+        self._weighted = False
+        self._pre_infinity = self.INFINITY_CONSTANT
+        self._post_infinity = self.INFINITY_CONSTANT
+
+    def __str__(self):
+        return self.str_formatter(len(self), fps=self._fps, weighted=self._weighted)
+
+    def __len__(self):
+        return len(self._times)
+
+    def __getitem__(self, index):
+        return self.key(index)
+
+    def __iter__(self):
+        for index in range(len(self._times)):
+            yield self.key(index)
+
+    def is_valid(self):
+        """ Returns True if the curve has keys.
+
+        Returns:
+            bool
+        """
+        return len(self._times) > 0
+
+    def fps(self):
+        """ Returns the frames per second of the curve times.
+
+        Returns:
+            float
+        """
+        return self._fps
+
+    def set_fps(self, fps):
+        """ Sets the frames per second of the curve times, the keys don't move.
+
+        Args:
+            fps(float)
+
+        Returns:
+            None
+        """
+        self._fps = float(fps)
+        return
+
+    def is_weighted(self):
+        """ Returns True if the tangent weights are used.
+
+        Returns:
+            bool
+        """
+        return self._weighted
+
+    def set_weighted(self, weighted):
+        """ Sets if the tangent weights are used.
+
+        Args:
+            weighted(bool)
+
+        Returns:
+            None
+        """
+        self._weighted = bool(weighted)
+        return
+
+    def pre_infinity(self):
+        """ Returns how the curve continues before its first key.
+
+        Returns:
+            int
+        """
+        return self._pre_infinity
+
+    def post_infinity(self):
+        """ Returns how the curve continues after its last key.
+
+        Returns:
+            int
+        """
+        return self._post_infinity
+
+    def set_infinity(self, pre=None, post=None):
+        """ Sets how the curve continues before its first key and after its last key.
+
+        Args:
+            pre(int): INFINITY type, unchanged if None.
+            post(int): INFINITY type, unchanged if None.
+
+        Returns:
+            None
+        """
+        infinities = (self.INFINITY_CONSTANT, self.INFINITY_LINEAR, self.INFINITY_CYCLE,
+                      self.INFINITY_CYCLE_RELATIVE, self.INFINITY_OSCILLATE)
+
+        for infinity in (pre, post):
+            if infinity is not None and infinity not in infinities:
+                raise ValueError("Invalid infinity type: {}.".format(infinity))
+
+        self._pre_infinity = self._pre_infinity if pre is None else pre
+        self._post_infinity = self._post_infinity if post is None else post
+        return
+
+    def times(self):
+        """ Returns the key times.
+
+        Returns:
+            array.array
+        """
+        return self._times
+
+    def values(self):
+        """ Returns the key values.
+
+        Returns:
+            array.array
+        """
+        return self._values
+
+    def columns(self):
+        """ Returns every column of the curve, the arrays are not copied.
+
+        Returns:
+            dict
+        """
+        return dict((name, getattr(self, "_" + name)) for name, _, _ in self.COLUMNS)
+
+    def key(self, index):
+        """ Returns a copy of a key.
+
+        Args:
+            index(int)
+
+        Returns:
+            KKeyFrame
+        """
+        tangent = KKeyTangent(self._in_slopes[index], self._out_slopes[index],
+                              self._in_types[index], self._out_types[index],
+                              self._in_weights[index], self._out_weights[index])
+        return KKeyFrame(self._times[index], self._values[index], tangent)
+
+    def keys(self):
+        """ Returns a copy of every key.
+
+        Returns:
+            list: list of KKeyFrame
+        """
+        return list(self)
+
+    def find(self, time, tolerance=1e-6):
+        """ Returns the index of the key at time with a binary search, -1 if there is none.
+
+        Args:
+            time(float)
+            tolerance(float)
+
+        Returns:
+            int
+        """
+        times = self._times
+        index = bisect_left(times, time - tolerance)
+
+        if index < len(times) and abs(times[index] - time) <= tolerance:
+            return index
+
+        return -1
+
+    def find_closest(self, time):
+        """ Returns the index of the key closest to time, -1 if there are no keys.
+
+        Args:
+            time(float)
+
+        Returns:
+            int
+        """
+        times = self._times
+
+        if not times:
+            return -1
+
+        index = bisect_left(times, time)
+
+        if index == 0:
+            return 0
+
+        if index == len(times):
+            return index - 1
+
+        return index if times[index] - time < time - times[index - 1] else index - 1
+
+    def find_segment(self, time):
+        """ Returns the index of the key starting the segment time is in, -1 before the first key.
+
+        Args:
+            time(float)
+
+        Returns:
+            int
+        """
+        return bisect_right(self._times, time) - 1
+
+    def add_key(self, time, value, tangent=None):
+        """ Adds a key, replacing the key at the same time.
+
+        Args:
+            time(float)
+            value(float)
+            tangent(KKeyTangent): The tangents are computed from KAnimCurve.TANGENT_AUTO if None.
+
+        Returns:
+            int: Index of the key.
+        """
+        if tangent is None:
+            self.add_keys([time], [value])
+        else:
+            self.add_keys([time], [value], [tangent.in_slope], [tangent.out_slope], tangent.in_type,
+                          tangent.out_type, [tangent.in_weight], [tangent.out_weight])
+
+        return self.find(time)
+
+    def add_keyframe(self, keyframe):
+        """ Adds a copy of a KKeyFrame, replacing the key at the same time.
+
+        Args:
+            keyframe(KKeyFrame)
+
+        Returns:
+            int: Index of the key.
+        """
+        tangent = keyframe.tangent if keyframe.has_tangent() else None
+        return self.add_key(keyframe.time, keyframe.value, tangent)
+
+    def add_keys(self, times, values, in_slopes=None, out_slopes=None, in_types=None, out_types=None,
+                 in_weights=None, out_weights=None, breakdowns=None, tangent_locks=None, weight_locks=None):
+        """ Adds many keys at once, replacing the keys at the same times.
+
+        When the slopes are None they are computed from the tangent types, for the new keys and their neighbours.
+
+        Args:
+            times(list)
+            values(list)
+            in_slopes(list)
+            out_slopes(list)
+            in_types(int, list): One type for every key or one per key, TANGENT_AUTO if None, TANGENT_FIXED if
+                None and the slopes are given.
+            out_types(int, list): Same as in_types.
+            in_weights(list)
+            out_weights(list)
+            breakdowns(list): True for breakdown keys.
+            tangent_locks(list): True if the in and out tangents are locked together, the default.
+            weight_locks(list): True if the tangent weights are locked, the default.
+
+        Returns:
+            None
+        """
+        count = len(times)
 
+        if len(values) != count:
+            raise ValueError("Times and values are NOT the same size.")
+
+        if not count:
+            return
+
+        def column(data, default):
+            if data is None:
+                return [default] * count
+
+            if isinstance(data, (int, float)):
+                return [data] * count
+
+            if len(data) != count:
+                raise ValueError("Tangent data and times are NOT the same size.")
+
+            return data
+
+        # Keys given with their slopes keep them unless they have a type to compute them from.
+        compute = in_slopes is None or out_slopes is None
+        default_type = self.TANGENT_AUTO if compute else self.TANGENT_FIXED
+        new_rows = zip(times, values,
+                       column(in_slopes, 0.0), column(out_slopes, 0.0),
+                       column(in_weights, 0.0), column(out_weights, 0.0),
+                       column(in_types, default_type), column(out_types, default_type),
+                       column(breakdowns, 0), column(tangent_locks, 1), column(weight_locks, 1))
+
+        if count == 1:
+            # A single key is inserted in place, only bulk merges rebuild the columns.
+            index = self._set_row(next(iter(new_rows)))
+            indices = set((index - 1, index, index + 1))
+        else:
+            rows = dict()
+
+            for row in zip(*[getattr(self, "_" + name) for name, _, _ in self.COLUMNS]):
+                rows[row[0]] = row
+
+            added = set()
+
+            for row in new_rows:
+                time = float(row[0])
+                index = self.find(time)
+                time = self._times[index] if index >= 0 else time
+                rows[time] = (time,) + tuple(row[1:])
+                added.add(time)
+
+            self._set_rows([rows[time] for time in sorted(rows)])
+            indices = set()
+
+            for index, time in enumerate(self._times):
+                if time in added:
+                    indices.update((index - 1, index, index + 1))
+
+        if compute:
+            self.update_tangents(sorted(index for index in indices if 0 <= index < len(self._times)))
+
+        return
+
+    def _set_row(self, row):
+        """ Replaces the key at the time of a row, or inserts it with a binary search, returns its index.
+        """
+        time = float(row[0])
+        index = self.find(time)
+
+        if index >= 0:
+            for (name, _, _), value in zip(self.COLUMNS[1:], row[1:]):
+                getattr(self, "_" + name)[index] = value
+        else:
+            index = bisect_left(self._times, time)
+
+            for (name, _, _), value in zip(self.COLUMNS, (time,) + tuple(row[1:])):
+                getattr(self, "_" + name).insert(index, value)
+
+        return index
+
+    def _set_rows(self, rows):
+        """ Rebuilds every column from rows sorted by time.
+        """
+        columns = list(zip(*rows)) if rows else [list()] * len(self.COLUMNS)
+
+        for (name, code, _), data in zip(self.COLUMNS, columns):
+            setattr(self, "_" + name, array(code, data))
+
+        return
+
+    def remove_key(self, index):
+        """ Removes a key, the tangents of its neighbours are computed again from their type.
+
+        Args:
+            index(int)
+
+        Returns:
+            None
+        """
+        for column in self.columns().values():
+            del column[index]
+
+        self.update_tangents([neighbour for neighbour in (index - 1, index) if 0 <= neighbour < len(self._times)])
+        return
+
+    def set_value(self, index, value):
+        """ Sets the value of a key, the tangents around it are computed again from their type.
+
+        Args:
+            index(int)
+            value(float)
+
+        Returns:
+            None
+        """
+        self._values[index] = float(value)
+        self.update_tangents([neighbour for neighbour in (index - 1, index, index + 1)
+                              if 0 <= neighbour < len(self._times)])
+        return
+
+    def get_slope(self, index, tangent_type, in_tangent):
+        """ Returns the slope of a tangent of a key computed from a tangent type.
+
+        Smooth is a Catmull-Rom slope, auto, clamped and plateau are the same but flat on extremes and on the first
+        and last keys, slow, fast and global fall back to smooth. Fixed tangents keep their slope.
+
+        Args:
+            index(int)
+            tangent_type(int)
+            in_tangent(bool)
+
+        Returns:
+            float
+        """
+        times = self._times
+        values = self._values
+        last = len(times) - 1
+
+        if tangent_type == self.TANGENT_FIXED:
+            return self._in_slopes[index] if in_tangent else self._out_slopes[index]
+
+        if last < 1 or tangent_type in (self.TANGENT_FLAT, self.TANGENT_STEP, self.TANGENT_STEP_NEXT):
+            return 0.0
+
+        if tangent_type == self.TANGENT_LINEAR:
+            if (in_tangent and index > 0) or index == last:
+                return (values[index] - values[index - 1]) / (times[index] - times[index - 1])
+
+            return (values[index + 1] - values[index]) / (times[index + 1] - times[index])
+
+        if tangent_type in (self.TANGENT_AUTO, self.TANGENT_CLAMPED, self.TANGENT_PLATEAU):
+            if index in (0, last):
+                return 0.0
+
+            before = values[index] - values[index - 1]
+            after = values[index + 1] - values[index]
+
+            if before * after <= 0.0:
+                return 0.0
+
+        if index == 0:
+            return (values[1] - values[0]) / (times[1] - times[0])
+
+        if index == last:
+            return (values[last] - values[last - 1]) / (times[last] - times[last - 1])
+
+        return (values[index + 1] - values[index - 1]) / (times[index + 1] - times[index - 1])
+
+    def update_tangents(self, indices=None):
+        """ Computes the slopes of keys from their tangent types.
+
+        Args:
+            indices(list): Indices of the keys, every key if None.
+
+        Returns:
+            None
+        """
+        indices = range(len(self._times)) if indices is None else indices
+
+        # Computed first so a key doesn't read the updated slope of its neighbour.
+        slopes = [(index, self.get_slope(index, self._in_types[index], True),
+                   self.get_slope(index, self._out_types[index], False)) for index in indices]
+
+        for index, in_slope, out_slope in slopes:
+            self._in_slopes[index] = in_slope
+            self._out_slopes[index] = out_slope
+
+        return
+
+    def get_control_points(self, index):
+        """ Returns the Bezier control points of the segment starting at a key.
+
+        Args:
+            index(int)
+
+        Returns:
+            tuple: (x0, y0, x1, y1, x2, y2, x3, y3)
+        """
+        out_weight = self._out_weights[index] if self._weighted else 0.0
+        in_weight = self._in_weights[index + 1] if self._weighted else 0.0
+        return self.get_segment_points(self._times[index], self._values[index],
+                                       self._times[index + 1], self._values[index + 1],
+                                       self._out_slopes[index], self._in_slopes[index + 1], out_weight, in_weight)
+
+    def evaluate_segment(self, index, time):
+        """ Returns the value of the segment starting at a key at time.
+
+        Args:
+            index(int)
+            time(float): Between the time of the key and the next one.
+
+        Returns:
+            float
+        """
+        out_type = self._out_types[index]
+
+        if out_type == self.TANGENT_STEP:
+            return self._values[index]
+
+        if out_type == self.TANGENT_STEP_NEXT:
+            return self._values[index + 1] if time > self._times[index] else self._values[index]
+
+        return self.get_segment_value(self.get_control_points(index), time, self._weighted)
+
+    def get_infinity_time(self, time):
+        """ Returns the time within the keys a cycle, cycle relative or oscillate infinity maps time to, and the
+        value offset of cycle relative.
+
+        Args:
+            time(float): Before the first key or after the last one.
+
+        Returns:
+            tuple: (time, offset)
+        """
+        first = self._times[0]
+        last = self._times[-1]
+        span = last - first
+        infinity = self._pre_infinity if time < first else self._post_infinity
+
+        if span <= 0.0:
+            return first, 0.0
+
+        cycle = math.floor((time - first) / span)
+        local = time - cycle * span
+        offset = 0.0
+
+        if infinity == self.INFINITY_CYCLE_RELATIVE:
+            offset = cycle * (self._values[-1] - self._values[0])
+        elif infinity == self.INFINITY_OSCILLATE and cycle % 2:
+            local = first + last - local
+
+        return local, offset
+
+    def evaluate(self, time):
+        """ Returns the value of the curve at time.
+
+        Args:
+            time(float): Frame.
+
+        Returns:
+            float
+        """
+        times = self._times
+        count = len(times)
+
+        if not count:
+            return 0.0
+
+        time = float(time)
+        first = times[0]
+        last = times[-1]
+        offset = 0.0
+
+        if time < first or time > last:
+            infinity = self._pre_infinity if time < first else self._post_infinity
+
+            if infinity == self.INFINITY_CONSTANT or count == 1:
+                if infinity == self.INFINITY_LINEAR:
+                    slope = self._in_slopes[0] if time < first else self._out_slopes[0]
+                    return self._values[0] + slope * (time - first)
+
+                return self._values[0] if time < first else self._values[-1]
+
+            if infinity == self.INFINITY_LINEAR:
+                if time < first:
+                    return self._values[0] + self._in_slopes[0] * (time - first)
+
+                return self._values[-1] + self._out_slopes[-1] * (time - last)
+
+            time, offset = self.get_infinity_time(time)
+
+        index = bisect_right(times, time) - 1
+
+        if index >= count - 1:
+            return self._values[-1] + offset
+
+        return self.evaluate_segment(max(index, 0), time) + offset
+
+    def evaluate_times(self, times, out=None):
+        """ Returns the value of the curve at many times.
+
+        Args:
+            times(list): Frames, in any order.
+            out(numpy.ndarray, array.array): Optional buffer to write the values into.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        if not self.HAS_NUMPY:
+            if out is None:
+                return array("d", [self.evaluate(time) for time in times])
+
+            for index, time in enumerate(times):
+                out[index] = self.evaluate(time)
+
+            return out
+
+        result = self._evaluate_numpy(numpy.asarray(times, dtype=numpy.float64))
+
+        if out is None:
+            return result
+
+        out[:] = result
+        return out
+
+    def _evaluate_numpy(self, samples):
+        """ Vectorized evaluate(), every step is done for all the samples at once.
+        """
+        count = len(self._times)
+
+        if not count:
+            return numpy.zeros(len(samples))
+
+        times = numpy.frombuffer(self._times, dtype=numpy.float64)
+        values = numpy.frombuffer(self._values, dtype=numpy.float64)
+        in_slopes = numpy.frombuffer(self._in_slopes, dtype=numpy.float64)
+        out_slopes = numpy.frombuffer(self._out_slopes, dtype=numpy.float64)
+        first = times[0]
+        last = times[-1]
+
+        local = samples.copy()
+        offset = numpy.zeros(len(samples))
+        linear = numpy.full(len(samples), numpy.nan)
+
+        for mask, infinity, edge in ((samples < first, self._pre_infinity, 0),
+                                     (samples > last, self._post_infinity, -1)):
+            if not mask.any():
+                continue
+
+            if infinity == self.INFINITY_LINEAR:
+                slope = in_slopes[0] if edge == 0 else out_slopes[-1]
+                linear[mask] = values[edge] + slope * (samples[mask] - times[edge])
+            elif infinity == self.INFINITY_CONSTANT or count == 1 or last <= first:
+                local[mask] = times[edge]
+            else:
+                span = last - first
+                cycle = numpy.floor((samples[mask] - first) / span)
+                cycled = samples[mask] - cycle * span
+
+                if infinity == self.INFINITY_CYCLE_RELATIVE:
+                    offset[mask] = cycle * (values[-1] - values[0])
+                elif infinity == self.INFINITY_OSCILLATE:
+                    cycled = numpy.where(cycle % 2, first + last - cycled, cycled)
+
+                local[mask] = cycled
+
+        if count == 1:
+            result = numpy.full(len(samples), values[0])
+            return numpy.where(numpy.isnan(linear), result, linear)
+
+        index = numpy.clip(numpy.searchsorted(times, local, side="right") - 1, 0, count - 2)
+        t0 = times[index]
+        t1 = times[index + 1]
+        v0 = values[index]
+        v1 = values[index + 1]
+        span = t1 - t0
+        out_weight = span
+        in_weight = span
+
+        if self._weighted:
+            out_weights = numpy.frombuffer(self._out_weights, dtype=numpy.float64)[index]
+            in_weights = numpy.frombuffer(self._in_weights, dtype=numpy.float64)[index + 1]
+            out_weight = numpy.where(out_weights > 0.0, out_weights, span)
+            in_weight = numpy.where(in_weights > 0.0, in_weights, span)
+
+        out_weight = out_weight / 3.0
+        in_weight = in_weight / 3.0
+        y1 = v0 + out_slopes[index] * out_weight
+        y2 = v1 - in_slopes[index + 1] * in_weight
+        u = numpy.clip((local - t0) / span, 0.0, 1.0)
+
+        if self._weighted:
+            x1 = t0 + out_weight
+            x2 = t1 - in_weight
+
+            for _ in range(self.ITERATIONS):
+                w = 1.0 - u
+                error = w * w * w * t0 + 3.0 * w * w * u * x1 + 3.0 * w * u * u * x2 + u * u * u * t1 - local
+                slope = 3.0 * (w * w * (x1 - t0) + 2.0 * w * u * (x2 - x1) + u * u * (t1 - x2))
+                step = numpy.divide(error, slope, out=numpy.zeros_like(error), where=slope != 0.0)
+                u = numpy.clip(u - step, 0.0, 1.0)
+
+        w = 1.0 - u
+        result = w * w * w * v0 + 3.0 * w * w * u * y1 + 3.0 * w * u * u * y2 + u * u * u * v1
+
+        out_types = numpy.frombuffer(self._out_types, dtype=numpy.int8)[index]
+        result = numpy.where(out_types == self.TANGENT_STEP, v0, result)
+        result = numpy.where((out_types == self.TANGENT_STEP_NEXT) & (local > t0), v1, result)
+        result = numpy.where((out_types == self.TANGENT_STEP_NEXT) & (local <= t0), v0, result)
+        result = numpy.where(local >= last, values[-1], result)
+        result += offset
+        return numpy.where(numpy.isnan(linear), result, linear)
+
+
+if __name__ == '__main__':
+    _curve = KAnimCurve.from_keys([1.0, 10.0, 20.0], [0.0, 5.0, 0.0])
+    print(_curve, list(_curve.evaluate_times([0.0, 5.0, 10.0, 15.0, 25.0])))
@@ -0,0 +1,211 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kdebug import KDebug
+
+# Python Modules
+import time
+from abc import ABC, abstractmethod
+
+
+class KCurveWriter(KObject, ABC):
+    """ Abstract base class of what KCurveApplier writes the anim curves with, KCurveReader is the reading half.
+
+    Writing queues every curve with add_curve() and applies them all at once with apply().
+    Subclass it to write curves to something else than Maya, for example a stub in tests.
+    """
+
+    @abstractmethod
+    def get_plugs(self, targets):
+        """ Returns the plugs to write curves to.
+
+        Args:
+            targets(list): Plug names.
+
+        Returns:
+            list: One plug per target, None if it doesn't exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_curve(self, plug, curve, keep_existing=False):
+        """ Queues writing a curve to a plug.
+
+        Args:
+            plug(object): Plug returned by get_plugs().
+            curve(KAnimCurve)
+            keep_existing(bool): Keeps the keys of the plug that aren't replaced.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply(self, undoable=True, progress=None):
+        """ Writes every queued curve as one operation.
+
+        Args:
+            undoable(bool)
+            progress(callable): Called with (done, total) curves after each curve is written.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+
+class KMayaCurveWriter(KCurveWriter):
+    """ Writer adding the keys of every curve with one MFnAnimCurve.addKeys() call through one KModifier, Maya is
+    only imported when used.
+    """
+
+    def __init__(self):
+        import maya.OpenMaya as OpenMaya
+        from kid.core.kmodifier import KModifier
+
+        self._api = OpenMaya
+        self._modifier = KModifier()
+
+    def get_plugs(self, targets):
+        OpenMaya = self._api
+        result = list()
+
+        for target in targets:
+            selection = OpenMaya.MSelectionList()
+            plug = OpenMaya.MPlug()
+
+            try:
+                selection.add(target)
+                selection.getPlug(0, plug)
+            except RuntimeError:
+                plug = None
+
+            result.append(plug)
+
+        return result
+
+    def add_curve(self, plug, curve, keep_existing=False):
+        self._modifier.add_curve(plug, curve, keep_existing)
+        return
+
+    def apply(self, undoable=True, progress=None):
+        self._modifier.do_it(undoable, progress)
+        return
+
+
+class KCurveApplier(KObject):
+    """ Class that writes many KAnimCurve to their plugs as one undoable operation.
+
+    Every curve is looked up by its target in a dict, optionally renamed through a mapping, queued on the
+    KCurveWriter and written with a single apply(). KMayaCurveWriter adds the keys of a curve with one
+    MFnAnimCurve.addKeys() call and goes through one KModifier, so the paste is one undo step. Progress is reported
+    by the adapter as the curves are written, at most once per PROGRESS_INTERVAL seconds instead of for every curve.
+
+    Args:
+        adapter(KCurveWriter): KMayaCurveWriter if None.
+    """
+    PROGRESS_INTERVAL = 0.1
+
+    # Static Methods
+    @staticmethod
+    def get_target(target, mapping):
+        """ Returns where a curve goes, mapped by plug name first, then by node name.
+
+        Args:
+            target(str): Plug name, node.attribute.
+            mapping(dict): Old to new plug or node names.
+
+        Returns:
+            str
+        """
+        if not mapping:
+            return target
+
+        if target in mapping:
+            return mapping[target]
+
+        node, _, attribute = target.partition(".")
+
+        if attribute and node in mapping:
+            return "{}.{}".format(mapping[node], attribute)
+
+        return target
+
+    # Object Methods
+    def __init__(self, adapter=None):
+        self._adapter = adapter if adapter is not None else KMayaCurveWriter()
+        self._progress = None
+        self._last_report = 0.0
+
+    def __str__(self):
+        return self.str_formatter(self._adapter)
+
+    def is_valid(self):
+        return self._adapter is not None
+
+    def adapter(self):
+        """ Returns the adapter writing the curves.
+
+        Returns:
+            KCurveWriter
+        """
+        return self._adapter
+
+    def apply(self, curves, mapping=None, keep_existing=False, progress=None, undoable=True):
+        """ Writes curves to their plugs, the ones that don't exist are skipped.
+
+        Args:
+            curves(dict): Target name to KAnimCurve, as returned by KCurveExtractor.extract().
+            mapping(dict): Old to new plug or node names, to paste onto other nodes.
+            keep_existing(bool): Keeps the keys of the plugs that aren't replaced.
+            progress(callable): Called with (done, total) written curves, throttled to PROGRESS_INTERVAL.
+            undoable(bool)
+
+        Returns:
+            list: Targets that were written.
+        """
+        targets = [self.get_target(target, mapping) for target in curves]
+        plugs = self._adapter.get_plugs(targets)
+        applied = list()
+
+        # Queuing is cheap, the curves are written by the adapter apply().
+        for target, plug, curve in zip(targets, plugs, curves.values()):
+            if plug is None:
+                KDebug.warning("""KCurveApplier: Unable to find "{}".""".format(target))
+                continue
+
+            self._adapter.add_curve(plug, curve, keep_existing)
+            applied.append(target)
+
+        if applied:
+            self._progress = progress
+            self._last_report = time.time()
+
+            try:
+                self._adapter.apply(undoable, self._report if progress is not None else None)
+            finally:
+                self._progress = None
+
+        if progress is not None:
+            progress(len(applied), len(applied))
+
+        return applied
+
+    def _report(self, done, total):
+        """ Calls the progress of apply() at most once per PROGRESS_INTERVAL seconds.
+        """
+        now = time.time()
+
+        if now - self._last_report >= self.PROGRESS_INTERVAL:
+            self._last_report = now
+            self._progress(done, total)
+        return
+
+
+if __name__ == '__main__':
+    from kid.core.kcurveextractor import KCurveExtractor
+
+    _curves = KCurveExtractor().extract(["pCube1"])
+    KCurveApplier().apply(_curves, mapping={"pCube1": "pCube2"})
@@ -0,0 +1,329 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kanimcurve import KAnimCurve
+
+# Python Modules
+from array import array
+from abc import ABC, abstractmethod
+
+
+class KCurveReader(KObject, ABC):
+    """ Abstract base class of what KCurveExtractor reads the anim curves with, KCurveWriter is the writing half.
+
+    It mirrors OpenMayaAnim.MFnAnimCurve: set_curve() is called once per curve, then read_key() once per key.
+    Subclass it to read curves from something else than Maya, for example a stub in tests.
+    """
+
+    @abstractmethod
+    def get_fps(self):
+        """ Returns the frames per second of the key times.
+
+        Returns:
+            float
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_curves(self, names):
+        """ Returns the anim curves of nodes, or the anim curves themselves, driven key curves are skipped.
+
+        Args:
+            names(list): Node, plug or anim curve names.
+
+        Returns:
+            list: list of tuple (target name, curve), the target is the animated plug or the curve name.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_curve(self, curve):
+        """ Sets the curve the next calls read.
+
+        Args:
+            curve(object): Curve returned by get_curves().
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_weighted(self):
+        """ Returns True if the curve has weighted tangents.
+
+        Returns:
+            bool
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_infinity(self):
+        """ Returns the pre and post infinity types of the curve.
+
+        Returns:
+            tuple: (int, int)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def num_keys(self):
+        """ Returns the number of keys of the curve.
+
+        Returns:
+            int
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_key(self, index):
+        """ Returns everything about a key. Tangents are x and y like MFnAnimCurve.getTangent(): x in seconds, y in
+        the internal unit of the values.
+
+        Args:
+            index(int)
+
+        Returns:
+            tuple: (time, value, in type, out type, in x, in y, out x, out y, breakdown, tangent lock, weight lock)
+        """
+        raise NotImplementedError
+
+
+class KMayaCurveReader(KCurveReader):
+    """ Reader going through one OpenMayaAnim.MFnAnimCurve, Maya is only imported when used.
+
+    Times are in the current time unit, values and tangent y in internal units, radians for angles. Driven key
+    curves, whose input is unitless instead of time, are skipped like Inbetween.gather() does.
+    """
+
+    def __init__(self):
+        import maya.OpenMaya as OpenMaya
+        import maya.OpenMayaAnim as OpenMayaAnim
+
+        self._api = OpenMaya
+        self._anim_api = OpenMayaAnim
+        self._function = OpenMayaAnim.MFnAnimCurve()
+        self._unit = OpenMaya.MTime.uiUnit()
+        self._x_util = OpenMaya.MScriptUtil()
+        self._x_ptr = self._x_util.asFloatPtr()
+        self._y_util = OpenMaya.MScriptUtil()
+        self._y_ptr = self._y_util.asFloatPtr()
+
+    def get_fps(self):
+        return self._api.MTime(1.0, self._api.MTime.kSeconds).asUnits(self._unit)
+
+    def get_curves(self, names):
+        OpenMaya = self._api
+        OpenMayaAnim = self._anim_api
+        result = list()
+        nodes = OpenMaya.MSelectionList()
+
+        for name in names:
+            selection = OpenMaya.MSelectionList()
+            selection.add(name)
+            node = OpenMaya.MObject()
+            selection.getDependNode(0, node)
+
+            if node.hasFn(OpenMaya.MFn.kAnimCurve):
+                if self.is_time_curve(node):
+                    result.append((self.get_curve_target(node), node))
+            else:
+                nodes.add(name)
+
+        # Every animated plug of the nodes in one pass.
+        plugs = OpenMaya.MPlugArray()
+        OpenMayaAnim.MAnimUtil.findAnimatedPlugs(nodes, plugs)
+
+        for index in range(plugs.length()):
+            plug = plugs[index]
+            found = OpenMaya.MObjectArray()
+
+            if not OpenMayaAnim.MAnimUtil.findAnimation(plug, found):
+                continue
+
+            for curve_index in range(found.length()):
+                curve = found[curve_index]
+
+                if not curve.hasFn(OpenMaya.MFn.kAnimCurve):
+                    continue
+
+                if self.is_time_curve(curve):
+                    result.append((plug.partialName(True, False, False, False, False, True), curve))
+
+                break
+
+        return result
+
+    def is_time_curve(self, curve):
+        """ Returns True if the input of a curve is time, False for driven key curves.
+
+        Args:
+            curve(OpenMaya.MObject)
+
+        Returns:
+            bool
+        """
+        self._function.setObject(curve)
+        return not self._function.isUnitlessInput()
+
+    def get_curve_target(self, curve):
+        """ Returns the name of the plug a curve drives, the curve name if it drives nothing.
+
+        Args:
+            curve(OpenMaya.MObject)
+
+        Returns:
+            str
+        """
+        node = self._api.MFnDependencyNode(curve)
+        plugs = self._api.MPlugArray()
+        node.findPlug("output").connectedTo(plugs, False, True)
+
+        if plugs.length():
+            return plugs[0].partialName(True, False, False, False, False, True)
+
+        return node.name()
+
+    def set_curve(self, curve):
+        self._function.setObject(curve)
+        return
+
+    def is_weighted(self):
+        return self._function.isWeighted()
+
+    def get_infinity(self):
+        return self._function.preInfinityType(), self._function.postInfinityType()
+
+    def num_keys(self):
+        return self._function.numKeys()
+
+    def read_key(self, index):
+        function = self._function
+        get_float = self._api.MScriptUtil.getFloat
+        x_ptr = self._x_ptr
+        y_ptr = self._y_ptr
+
+        function.getTangent(index, x_ptr, y_ptr, True)
+        in_x = get_float(x_ptr)
+        in_y = get_float(y_ptr)
+        function.getTangent(index, x_ptr, y_ptr, False)
+        return (function.time(index).asUnits(self._unit), function.value(index),
+                function.inTangentType(index), function.outTangentType(index),
+                in_x, in_y, get_float(x_ptr), get_float(y_ptr),
+                function.isBreakdown(index), function.tangentsLocked(index), function.weightsLocked(index))
+
+
+class KCurveExtractor(KObject):
+    """ Class that reads every key and tangent of many anim curves in one pass, into KAnimCurve columns.
+
+    A KCurveReader does the reading, KMayaCurveReader goes through one MFnAnimCurve instead of a dozen
+    cmds.keyframe and cmds.keyTangent queries per curve. Tangents are converted to slopes in value per frame and
+    weights in frames.
+
+    Args:
+        adapter(KCurveReader): KMayaCurveReader if None.
+    """
+
+    # Object Methods
+    def __init__(self, adapter=None):
+        self._adapter = adapter if adapter is not None else KMayaCurveReader()
+
+    def __str__(self):
+        return self.str_formatter(self._adapter)
+
+    def is_valid(self):
+        return self._adapter is not None
+
+    def adapter(self):
+        """ Returns the adapter reading the curves.
+
+        Returns:
+            KCurveReader
+        """
+        return self._adapter
+
+    def read(self, curve, start=None, end=None, fps=None):
+        """ Returns the keys of a curve between start and end, both included.
+
+        Args:
+            curve(object): Curve returned by the adapter get_curves().
+            start(float): From the first key if None.
+            end(float): To the last key if None.
+            fps(float): Frames per second of the adapter if None.
+
+        Returns:
+            KAnimCurve
+        """
+        adapter = self._adapter
+        fps = adapter.get_fps() if fps is None else float(fps)
+        adapter.set_curve(curve)
+
+        columns = dict((name, array(code)) for name, code, _ in KAnimCurve.COLUMNS)
+        times = columns["times"].append
+        values = columns["values"].append
+        in_slopes = columns["in_slopes"].append
+        out_slopes = columns["out_slopes"].append
+        in_weights = columns["in_weights"].append
+        out_weights = columns["out_weights"].append
+        in_types = columns["in_types"].append
+        out_types = columns["out_types"].append
+        breakdowns = columns["breakdowns"].append
+        tangent_locks = columns["tangent_locks"].append
+        weight_locks = columns["weight_locks"].append
+        read_key = adapter.read_key
+
+        for index in range(adapter.num_keys()):
+            key = read_key(index)
+            time = key[0]
+
+            if start is not None and time < start:
+                continue
+
+            if end is not None and time > end:
+                break
+
+            # x is in seconds, the weight is the tangent length in frames.
+            in_weight = key[4] * fps
+            out_weight = key[6] * fps
+
+            times(time)
+            values(key[1])
+            in_types(key[2])
+            out_types(key[3])
+            in_slopes(key[5] / in_weight if in_weight else 0.0)
+            out_slopes(key[7] / out_weight if out_weight else 0.0)
+            in_weights(in_weight)
+            out_weights(out_weight)
+            breakdowns(key[8])
+            tangent_locks(key[9])
+            weight_locks(key[10])
+
+        pre, post = adapter.get_infinity()
+        return KAnimCurve.from_columns(columns, fps, adapter.is_weighted(), pre, post)
+
+    def extract(self, names, start=None, end=None):
+        """ Returns the curves of nodes by the plug they animate.
+
+        Args:
+            names(list): Node, plug or anim curve names.
+            start(float): From the first key if None.
+            end(float): To the last key if None.
+
+        Returns:
+            dict: Target name to KAnimCurve, in the order the adapter found them.
+        """
+        fps = self._adapter.get_fps()
+        result = dict()
+
+        for target, curve in self._adapter.get_curves(names):
+            result[target] = self.read(curve, start, end, fps)
+
+        return result
+
+
+if __name__ == '__main__':
+    _curves = KCurveExtractor().extract(["pCube1"])
+
+    for _target, _curve in _curves.items():
+        print(_target, _curve)
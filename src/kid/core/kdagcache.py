@@ -0,0 +1,318 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kdebug import KDebug
+
+# Python Modules
+
+
+class KDagCacheEvents(KObject):
+    """ Base class of the event sources that tell a KDagCache when cached names go stale.
+
+    An event source calls the cache back with:
+        * cache.on_rename(old_name, new_name)
+        * cache.on_delete(name)
+        * cache.clear() when the hierarchy changes or a scene is opened.
+
+    Subclass it to drive a cache from something else than Maya, for example a stub in tests.
+    """
+
+    def __init__(self):
+        self._cache = None
+
+    def is_valid(self):
+        """ Returns True if the event source is installed on a cache.
+
+        Returns:
+            bool
+        """
+        return self._cache is not None
+
+    def install(self, cache):
+        """ Starts sending events to a cache.
+
+        Args:
+            cache(KDagCache)
+
+        Returns:
+            None
+        """
+        self._cache = cache
+        return
+
+    def uninstall(self):
+        """ Stops sending events.
+
+        Returns:
+            None
+        """
+        self._cache = None
+        return
+
+
+class KMayaDagCacheEvents(KDagCacheEvents):
+    """ Event source registering OpenMaya message callbacks, Maya is only imported by install().
+
+    References:
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_node_message_html
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_scene_message_html
+    """
+
+    def __init__(self):
+        super(KMayaDagCacheEvents, self).__init__()
+        self._callbacks = list()
+
+    def install(self, cache):
+        import maya.OpenMaya as OpenMaya
+
+        self.uninstall()
+        self._cache = cache
+
+        def name_changed(node, previous, *args):
+            cache.on_rename(previous, OpenMaya.MFnDependencyNode(node).name())
+
+        def node_removed(node, *args):
+            cache.on_delete(OpenMaya.MFnDependencyNode(node).name())
+
+        def changed(*args):
+            cache.clear()
+
+        self._callbacks.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject(), name_changed))
+        self._callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(node_removed, "dependNode"))
+        self._callbacks.append(OpenMaya.MDagMessage.addAllDagChangesCallback(changed))
+
+        for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                        OpenMaya.MSceneMessage.kBeforeOpen,
+                        OpenMaya.MSceneMessage.kAfterOpen,
+                        OpenMaya.MSceneMessage.kBeforeRemoveReference):
+            self._callbacks.append(OpenMaya.MSceneMessage.addCallback(message, changed))
+        return
+
+    def uninstall(self):
+        if self._callbacks:
+            import maya.OpenMaya as OpenMaya
+
+            for callback in self._callbacks:
+                OpenMaya.MMessage.removeCallback(callback)
+
+        self._callbacks = list()
+        self._cache = None
+        return
+
+
+class KDagCache(KObject):
+    """ Class that caches the resolution of node names, for example name to MDagPath.
+
+    The cache keeps whatever the resolver returns for a name until the event source reports that the name was
+    renamed, deleted or that the scene changed. Names are compared per path component, so renaming or deleting
+    "arm" also drops "|rig|arm|hand" and "ns:arm".
+
+    The event source is only installed on the first get(), so importing a module with a cache has no side effect.
+
+    Args:
+        events(KDagCacheEvents): Event source driving the invalidation, KMayaDagCacheEvents if None.
+    """
+
+    def __init__(self, events=None):
+        self._entries = dict()
+        self._events = events if events is not None else KMayaDagCacheEvents()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __str__(self):
+        return self.str_formatter(**self.statistics())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def is_valid(self):
+        """ Returns True if the event source is installed.
+
+        Returns:
+            bool
+        """
+        return self._events.is_valid()
+
+    def events(self):
+        """ Returns the event source.
+
+        Returns:
+            KDagCacheEvents
+        """
+        return self._events
+
+    def set_events(self, events):
+        """ Replaces the event source, the cache is cleared since the old source may have missed events.
+
+        Args:
+            events(KDagCacheEvents)
+
+        Returns:
+            None
+        """
+        if not isinstance(events, KDagCacheEvents):
+            raise TypeError("Invalid type.")
+
+        self._events.uninstall()
+        self._events = events
+        self.clear()
+        return
+
+    def get(self, name, resolver):
+        """ Returns the cached value of a name, resolving and storing it on a miss.
+
+        Args:
+            name(str)
+            resolver(function): Called with the name on a miss, errors are raised and nothing is cached.
+
+        Returns:
+            object
+        """
+        try:
+            value = self._entries[name]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            return value
+
+        if not self._events.is_valid():
+            self._events.install(self)
+
+        self._misses += 1
+        value = resolver(name)
+        self._entries[name] = value
+        return value
+
+    def remove(self, name):
+        """ Removes a name from the cache.
+
+        Args:
+            name(str)
+
+        Returns:
+            None
+        """
+        if self._entries.pop(name, None) is not None:
+            self._invalidations += 1
+        return
+
+    def clear(self):
+        """ Removes every name from the cache, the statistics are kept.
+
+        Returns:
+            None
+        """
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        return
+
+    def invalidate(self, *names):
+        """ Removes every cached name that has one of names as a path component.
+
+        Args:
+            *names(str): Node names, with or without namespace.
+
+        Returns:
+            None
+        """
+        tokens = set()
+
+        for name in names:
+            if name:
+                tokens.add(name)
+                tokens.add(name.rsplit("|", 1)[-1])
+                tokens.add(name.rsplit(":", 1)[-1])
+
+        if not tokens or not self._entries:
+            return
+
+        for key in list(self._entries):
+            for component in key.split("|"):
+                if component in tokens or component.rsplit(":", 1)[-1] in tokens:
+                    del self._entries[key]
+                    self._invalidations += 1
+                    break
+        return
+
+    def on_rename(self, old_name, new_name):
+        """ Event callback, the new name is invalidated too since it may now resolve to another node.
+
+        Args:
+            old_name(str)
+            new_name(str)
+
+        Returns:
+            None
+        """
+        self.invalidate(old_name, new_name)
+        return
+
+    def on_delete(self, name):
+        """ Event callback.
+
+        Args:
+            name(str)
+
+        Returns:
+            None
+        """
+        self.invalidate(name)
+        return
+
+    def hit_rate(self):
+        """ Returns the ratio of get() calls served from the cache, between 0.0 and 1.0.
+
+        Returns:
+            float
+        """
+        total = self._hits + self._misses
+        return float(self._hits) / total if total else 0.0
+
+    def statistics(self):
+        """ Returns the cache counters.
+
+        Returns:
+            dict
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self.hit_rate(),
+            "invalidations": self._invalidations,
+            }
+
+    def reset_statistics(self):
+        """ Resets the hit, miss and invalidation counters.
+
+        Returns:
+            None
+        """
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        return
+
+    def log_statistics(self):
+        """ Logs the hit rate with KDebug.
+
+        Returns:
+            None
+        """
+        KDebug.info("DAG cache: {size} names, {hits} hits, {misses} misses, {hit_rate:.1%} hit rate, "
+                    "{invalidations} invalidations.".format(**self.statistics()))
+        return
+
+
+if __name__ == '__main__':
+    _cache = KDagCache(KDagCacheEvents())
+    _cache.get("|rig|arm", str.upper)
+    _cache.get("|rig|arm", str.upper)
+    _cache.on_rename("rig", "root")
+    print(_cache)
@@ -4,8 +4,15 @@
 from kid.core.kobject import KObject
 
 # Python Modules
+from array import array
 import math
 
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class KEuler(KObject):
     """ Class that handles manageing and manipulating euler rotations.
@@ -21,28 +28,238 @@ class KEuler(KObject):
     ZXY = 2
     ZYX = 5
 
-    RADIAN_TO_DEGREES = 57.2957795
+    RADIAN_TO_DEGREES = 180.0 / math.pi
+    DEGREES_TO_RADIAN = math.pi / 180.0
+
+    # Axis indices per rotation order, the first axis is applied first.
+    ORDER_AXES = {
+        XYZ: (0, 1, 2),
+        YZX: (1, 2, 0),
+        ZXY: (2, 0, 1),
+        XZY: (0, 2, 1),
+        YXZ: (1, 0, 2),
+        ZYX: (2, 1, 0),
+        }
+
+    # cos(middle angle) below this is treated as gimbal lock.
+    GIMBAL_TOLERANCE = 1e-9
+
+    HAS_NUMPY = numpy is not None
+
+    # Static Methods
+    @staticmethod
+    def get_rotation_from_axes(x_axis, y_axis, z_axis, order=0):
+        """ Returns the euler rotation in degrees of three orthonormal axes, the rows of a rotation matrix.
+
+        When the middle rotation is at +-90 degrees (gimbal lock) the last rotation is set to 0 and the first
+        one takes the whole remaining rotation.
+
+        Args:
+            x_axis(list, tuple): 3 element sequence
+            y_axis(list, tuple): 3 element sequence
+            z_axis(list, tuple): 3 element sequence
+            order(int)
+
+        Returns:
+            tuple
+        """
+        i, j, k = KEuler.ORDER_AXES[order]
+        sign = 1.0 if order < 3 else -1.0
+        rows = (x_axis, y_axis, z_axis)
+
+        sin_middle = -sign * rows[i][k]
+        cos_middle = math.sqrt(rows[i][i] * rows[i][i] + rows[i][j] * rows[i][j])
+
+        result = [0.0, 0.0, 0.0]
+
+        if cos_middle > KEuler.GIMBAL_TOLERANCE:
+            result[i] = math.atan2(sign * rows[j][k], rows[k][k])
+            result[j] = math.atan2(sin_middle, cos_middle)
+            result[k] = math.atan2(sign * rows[i][j], rows[i][i])
+        else:
+            result[i] = math.atan2(-sign * rows[k][j], rows[j][j])
+            result[j] = math.atan2(sin_middle, cos_middle)
+
+        return (result[0] * KEuler.RADIAN_TO_DEGREES,
+                result[1] * KEuler.RADIAN_TO_DEGREES,
+                result[2] * KEuler.RADIAN_TO_DEGREES)
+
+    @staticmethod
+    def get_axes_from_rotation(x, y, z, order=0):
+        """ Returns the three axes, rows of the rotation matrix, of an euler rotation in degrees.
+
+        Args:
+            x(float)
+            y(float)
+            z(float)
+            order(int)
+
+        Returns:
+            tuple: Three 3 element tuples.
+        """
+        cx = math.cos(x * KEuler.DEGREES_TO_RADIAN)
+        sx = math.sin(x * KEuler.DEGREES_TO_RADIAN)
+        cy = math.cos(y * KEuler.DEGREES_TO_RADIAN)
+        sy = math.sin(y * KEuler.DEGREES_TO_RADIAN)
+        cz = math.cos(z * KEuler.DEGREES_TO_RADIAN)
+        sz = math.sin(z * KEuler.DEGREES_TO_RADIAN)
+
+        # Row vector rotation matrices, Maya convention.
+        rotations = (
+            ((1.0, 0.0, 0.0), (0.0, cx, sx), (0.0, -sx, cx)),
+            ((cy, 0.0, -sy), (0.0, 1.0, 0.0), (sy, 0.0, cy)),
+            ((cz, sz, 0.0), (-sz, cz, 0.0), (0.0, 0.0, 1.0)),
+            )
+
+        i, j, k = KEuler.ORDER_AXES[order]
+        result = rotations[i]
+
+        for b in (rotations[j], rotations[k]):
+            result = tuple(
+                (a[0] * b[0][0] + a[1] * b[1][0] + a[2] * b[2][0],
+                 a[0] * b[0][1] + a[1] * b[1][1] + a[2] * b[2][1],
+                 a[0] * b[0][2] + a[1] * b[1][2] + a[2] * b[2][2]) for a in result)
+
+        return result
+
+    @staticmethod
+    def get_normalized_axes(matrix):
+        """ Returns the first three rows of a matrix with the scale removed.
+
+        Args:
+            matrix(list, KMatrix4): 3x3 or 4x4 matrix
+
+        Returns:
+            tuple: Three 3 element tuples.
+        """
+        result = list()
+
+        for row in range(3):
+            a, b, c = matrix[row][0], matrix[row][1], matrix[row][2]
+            length = math.sqrt(a * a + b * b + c * c)
+
+            if length:
+                result.append((a / length, b / length, c / length))
+            else:
+                result.append((a, b, c))
+
+        return tuple(result)
+
+    @staticmethod
+    def xforms_to_rotations(xforms, order=0):
+        """ Returns the euler rotations in degrees of a flat buffer of N 4x4 matrices.
+
+        Args:
+            xforms(list, array.array, numpy.ndarray): N * 16 row-major values
+            order(int)
+
+        Returns:
+            numpy.ndarray, array.array: (N, 3) array with NumPy, otherwise a flat array('d') of N * 3 values.
+        """
+        if KEuler.HAS_NUMPY:
+            matrices = numpy.asarray(xforms, dtype=numpy.float64).reshape(-1, 4, 4)[:, :3, :3]
+
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                lengths = numpy.linalg.norm(matrices, axis=2)[:, :, numpy.newaxis]
+                rows = numpy.where(lengths > 0.0, matrices / lengths, matrices)
+
+            i, j, k = KEuler.ORDER_AXES[order]
+            sign = 1.0 if order < 3 else -1.0
+
+            sin_middle = -sign * rows[:, i, k]
+            cos_middle = numpy.sqrt(rows[:, i, i] ** 2 + rows[:, i, j] ** 2)
+            locked = cos_middle <= KEuler.GIMBAL_TOLERANCE
+
+            result = numpy.empty((len(rows), 3))
+            result[:, i] = numpy.where(locked,
+                                       numpy.arctan2(-sign * rows[:, k, j], rows[:, j, j]),
+                                       numpy.arctan2(sign * rows[:, j, k], rows[:, k, k]))
+            result[:, j] = numpy.arctan2(sin_middle, cos_middle)
+            result[:, k] = numpy.where(locked, 0.0, numpy.arctan2(sign * rows[:, i, j], rows[:, i, i]))
+            return numpy.degrees(result)
 
+        result = array("d")
+
+        for index in range(0, len(xforms), 16):
+            m = xforms[index:index + 16]
+            axes = KEuler.get_normalized_axes(((m[0], m[1], m[2]), (m[4], m[5], m[6]), (m[8], m[9], m[10])))
+            result.extend(KEuler.get_rotation_from_axes(axes[0], axes[1], axes[2], order))
+
+        return result
+
+    @staticmethod
+    def rotations_to_xforms(rotations, order=0):
+        """ Returns a flat buffer of N 4x4 rotation matrices from N euler rotations in degrees.
+
+        Args:
+            rotations(list, array.array, numpy.ndarray): N * 3 values
+            order(int)
+
+        Returns:
+            numpy.ndarray, array.array: (N, 4, 4) array with NumPy, otherwise a flat array('d') of N * 16 values.
+        """
+        if KEuler.HAS_NUMPY:
+            radians = numpy.radians(numpy.asarray(rotations, dtype=numpy.float64).reshape(-1, 3))
+            count = len(radians)
+            cos = numpy.cos(radians)
+            sin = numpy.sin(radians)
+
+            rotations = numpy.zeros((3, count, 3, 3))
+
+            for axis, (a, b) in enumerate(((1, 2), (2, 0), (0, 1))):
+                rotations[axis, :, axis, axis] = 1.0
+                rotations[axis, :, a, a] = cos[:, axis]
+                rotations[axis, :, b, b] = cos[:, axis]
+                rotations[axis, :, a, b] = sin[:, axis]
+                rotations[axis, :, b, a] = -sin[:, axis]
+
+            i, j, k = KEuler.ORDER_AXES[order]
+            result = numpy.zeros((count, 4, 4))
+            result[:, :3, :3] = numpy.matmul(numpy.matmul(rotations[i], rotations[j]), rotations[k])
+            result[:, 3, 3] = 1.0
+            return result
+
+        result = array("d")
+
+        for index in range(0, len(rotations), 3):
+            x_axis, y_axis, z_axis = KEuler.get_axes_from_rotation(
+                rotations[index], rotations[index + 1], rotations[index + 2], order)
+            result.extend(x_axis + (0.0,) + y_axis + (0.0,) + z_axis + (0.0, 0.0, 0.0, 0.0, 1.0))
+
+        return result
+
+    # Class Methods
     @classmethod
-    def from_matrix(cls, matrix):
-        """ Returns a rotation matrix4x4 from a transformation matrix.
+    def from_matrix(cls, matrix, order=0):
+        """ Returns the rotation of a transformation matrix, the scale is removed first.
 
         References:
             * https://forums.cgsociety.org/t/4x4-matrix-to-transform-values/1743190/9
+            * https://www.geometrictools.com/Documentation/EulerAngles.pdf
 
         Args:
-            matrix(list): Matrix 4x4
+            matrix(list, KMatrix4): Matrix 4x4 or 3x3
+            order(int): Rotation order
 
         Returns:
             KEuler
         """
-        obj = cls()
+        axes = cls.get_normalized_axes(matrix)
+        x, y, z = cls.get_rotation_from_axes(axes[0], axes[1], axes[2], order)
+        return cls(x, y, z, order)
 
-        obj.x = math.atan2(matrix[1][2], matrix[2][2]) * cls.RADIAN_TO_DEGREES
-        obj.y = -math.asin(matrix[0][2]) * cls.RADIAN_TO_DEGREES
-        obj.z = math.atan2(matrix[0][1], matrix[0][0]) * cls.RADIAN_TO_DEGREES
+    @classmethod
+    def from_matrices(cls, matrices, order=0):
+        """ Returns a list of KEuler from a list of matrices.
 
-        return obj
+        Args:
+            matrices(list): list of KMatrix4 or 4x4 matrix lists
+            order(int): Rotation order
+
+        Returns:
+            list
+        """
+        return [cls.from_matrix(matrix, order) for matrix in matrices]
 
     @classmethod
     def from_kvector(cls, kvector, order=0):
@@ -87,21 +304,21 @@ class KEuler(KObject):
     def __init__(self, x=0.0, y=0.0, z=0.0, order=0):
         """
         Args:
-            x(float):  X rotation in radians
-            y(float):  Y rotation in radians
-            z(float):  Z rotation in radians
+            x(float):  X rotation in degrees
+            y(float):  Y rotation in degrees
+            z(float):  Z rotation in degrees
             order(int): Rotation order
         """
-        self._x = float(x),
-        self._y = float(y),
-        self._z = float(z),
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
         self._order = order
 
     def __str__(self):
         return self.str_formatter((self.x, self.y, self.z))
 
     def __repr__(self):
-        return self.x, self.y, self.z
+        return "{}({}, {}, {}, {})".format(self.__class__.__name__, self.x, self.y, self.z, self.order)
 
     def __getitem__(self, item):
         result = [self.x, self.y, self.z]
@@ -145,8 +362,8 @@ class KEuler(KObject):
     def order(self, value):
         if not isinstance(value, int):
             raise TypeError("Invalid type")
-        elif 0 > value > 5:
-            raise IndexError
+        elif value not in self.ORDER_AXES:
+            raise IndexError("Invalid rotation order.")
 
         self._order = value
         return
@@ -154,6 +371,39 @@ class KEuler(KObject):
     def as_list(self):
         return list(self)
 
+    def as_axes(self):
+        """ Returns the three axes, rows of the rotation matrix.
+
+        Returns:
+            tuple: Three 3 element tuples.
+        """
+        return self.get_axes_from_rotation(self.x, self.y, self.z, self.order)
+
+    def to_matrix(self):
+        """ Returns the rotation as a KMatrix4.
+
+        Returns:
+            KMatrix4
+        """
+        # Imported here, KMatrix4 depends on this module.
+        from kid.core.kmatrix4 import KMatrix4
+
+        x_axis, y_axis, z_axis = self.as_axes()
+        return KMatrix4.from_xform(x_axis + (0.0,) + y_axis + (0.0,) + z_axis + (0.0, 0.0, 0.0, 0.0, 1.0))
+
+    def reorder(self, order):
+        """ Returns the same rotation expressed with another rotation order.
+
+        Args:
+            order(int)
+
+        Returns:
+            KEuler
+        """
+        x_axis, y_axis, z_axis = self.as_axes()
+        x, y, z = self.get_rotation_from_axes(x_axis, y_axis, z_axis, order)
+        return self.__class__(x, y, z, order)
+
 
 if __name__ == '__main__':
     pass
@@ -0,0 +1,199 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+
+# Python Modules
+from array import array
+from bisect import bisect_left
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class KInbetween(KObject):
+    """ Class that blends many curves between their previous and next keys at once.
+
+    The previous and next key values are stored in two columns, one row per curve, so a blend is one vectorized
+    operation: previous + (next - previous) * weight. With NumPy the columns are float64 arrays, without NumPy they
+    are array('d') and the blend runs in a single loop.
+
+    Tangents are optional, they are only used by blend_hermite() to follow the shape of the curves.
+
+    Args:
+        previous_values(list): Previous key value of every curve.
+        next_values(list): Next key value of every curve.
+        previous_tangents(list): Out tangent of every previous key, as a slope times the time between the keys.
+        next_tangents(list): In tangent of every next key, as a slope times the time between the keys.
+    """
+    HAS_NUMPY = numpy is not None
+
+    # Static Methods
+    @staticmethod
+    def get_neighbours(times, time):
+        """ Returns the indices of the keys before and after a time with a binary search, -1 if there is none.
+
+        When the time is on a key, its neighbours are the keys on each side of it.
+
+        Args:
+            times(list): Increasing key times, any sequence with __len__ and __getitem__.
+            time(float)
+
+        Returns:
+            tuple: (previous index, next index)
+        """
+        count = len(times)
+        index = bisect_left(times, time)
+
+        if index < count and times[index] == time:
+            return index - 1, index + 1 if index + 1 < count else -1
+
+        return index - 1, index if index < count else -1
+
+    # Object Methods
+    def __init__(self, previous_values=None, next_values=None, previous_tangents=None, next_tangents=None):
+        previous_values = previous_values if previous_values is not None else list()
+        next_values = next_values if next_values is not None else list()
+
+        if len(previous_values) != len(next_values):
+            raise ValueError("Previous and next values are NOT the same size.")
+
+        self._tangents = None
+
+        if previous_tangents is not None or next_tangents is not None:
+            previous_tangents = previous_tangents if previous_tangents is not None else [0.0] * len(previous_values)
+            next_tangents = next_tangents if next_tangents is not None else [0.0] * len(previous_values)
+
+            if not len(previous_tangents) == len(next_tangents) == len(previous_values):
+                raise ValueError("Tangents and values are NOT the same size.")
+
+            if self.HAS_NUMPY:
+                self._tangents = (numpy.array(previous_tangents, dtype=numpy.float64),
+                                  numpy.array(next_tangents, dtype=numpy.float64))
+            else:
+                self._tangents = (array("d", previous_tangents), array("d", next_tangents))
+
+        if self.HAS_NUMPY:
+            self._previous = numpy.array(previous_values, dtype=numpy.float64)
+            self._delta = numpy.array(next_values, dtype=numpy.float64) - self._previous
+        else:
+            self._previous = array("d", previous_values)
+            self._delta = array("d", [b - a for a, b in zip(previous_values, next_values)])
+
+    def __str__(self):
+        return self.str_formatter(len(self), numpy=self.HAS_NUMPY)
+
+    def __len__(self):
+        return len(self._previous)
+
+    def is_valid(self):
+        """ Returns True if there is at least one curve to blend.
+
+        Returns:
+            bool
+        """
+        return len(self._previous) > 0
+
+    def has_tangents(self):
+        """ Returns True if the tangents of the keys are known.
+
+        Returns:
+            bool
+        """
+        return self._tangents is not None
+
+    def new_buffer(self):
+        """ Returns a zeroed buffer to blend into, reused between blends to avoid allocating on every call.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        if self.HAS_NUMPY:
+            return numpy.zeros(len(self._previous), dtype=numpy.float64)
+
+        return array("d", bytes(8 * len(self._previous)))
+
+    def previous_values(self):
+        """ Returns the previous key values.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        return self._previous
+
+    def next_values(self):
+        """ Returns the next key values.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        if self.HAS_NUMPY:
+            return self._previous + self._delta
+
+        return array("d", [a + b for a, b in zip(self._previous, self._delta)])
+
+    def blend(self, weight, out=None):
+        """ Returns the value of every curve at weight between its previous (0.0) and next (1.0) keys.
+
+        Args:
+            weight(float): Values outside 0.0 to 1.0 overshoot.
+            out(numpy.ndarray, array.array): Optional buffer to write the values into.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        weight = float(weight)
+
+        if self.HAS_NUMPY:
+            if out is None:
+                return self._previous + self._delta * weight
+
+            numpy.multiply(self._delta, weight, out=out)
+            numpy.add(out, self._previous, out=out)
+            return out
+
+        if out is None:
+            return array("d", [a + b * weight for a, b in zip(self._previous, self._delta)])
+
+        for index, (a, b) in enumerate(zip(self._previous, self._delta)):
+            out[index] = a + b * weight
+
+        return out
+
+    def blend_hermite(self, basis, out=None):
+        """ Returns the value of every curve on the cubic Hermite between its keys, from the basis functions of a
+        position. Without tangents the curves ease in and out.
+
+        Args:
+            basis(tuple): (h00, h10, h01, h11) as returned by KTangentProfile.get_basis().
+            out(numpy.ndarray, array.array): Optional buffer to write the values into.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        # h00 + h01 is always 1, so h00 * previous + h01 * next is previous + h01 * delta.
+        _, h10, h01, h11 = [float(value) for value in basis]
+        out = self.blend(h01, out)
+
+        if self._tangents is None:
+            return out
+
+        previous_tangents, next_tangents = self._tangents
+
+        if self.HAS_NUMPY:
+            out += previous_tangents * h10
+            out += next_tangents * h11
+            return out
+
+        for index, (a, b) in enumerate(zip(previous_tangents, next_tangents)):
+            out[index] += a * h10 + b * h11
+
+        return out
+
+
+if __name__ == '__main__':
+    _inbetween = KInbetween([0.0, 10.0], [1.0, 20.0])
+    print(list(_inbetween.blend(0.25)))
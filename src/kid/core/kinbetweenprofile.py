@@ -0,0 +1,286 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+
+# Python Modules
+from array import array
+import math
+
+
+class KInbetweenProfile(KObject):
+    """ Class that maps the position of the inbetween slider to a blend weight, linear by default.
+
+    The profile is sampled into a lookup table the first time it is used, so the drag loop indexes the table
+    instead of evaluating the profile again. Subclasses only implement evaluate().
+
+    Args:
+        samples(int): Number of intervals of the lookup table.
+    """
+    SAMPLES = 256
+    USES_TANGENTS = False
+
+    # Object Methods
+    def __init__(self, samples=None):
+        self._samples = int(samples) if samples else self.SAMPLES
+        self._table = None
+
+        if self._samples < 1:
+            raise ValueError("A profile needs at least one sample.")
+
+    def __str__(self):
+        return self.str_formatter(self._samples)
+
+    def samples(self):
+        """ Returns the number of intervals of the lookup table.
+
+        Returns:
+            int
+        """
+        return self._samples
+
+    def evaluate(self, position):
+        """ Returns the weight at a slider position, called when building the lookup table.
+
+        Args:
+            position(float): 0.0 to 1.0
+
+        Returns:
+            float
+        """
+        return position
+
+    def sample(self, function):
+        """ Returns function sampled at every position of the lookup table.
+
+        Args:
+            function(callable): Takes a position from 0.0 to 1.0.
+
+        Returns:
+            array.array
+        """
+        count = self._samples
+        return array("d", [function(index / float(count)) for index in range(count + 1)])
+
+    def table(self):
+        """ Returns the lookup table, built on the first call.
+
+        Returns:
+            array.array
+        """
+        if self._table is None:
+            self._table = self.sample(self.evaluate)
+
+        return self._table
+
+    def lookup_table(self, table, position):
+        """ Returns the value of a table at a position, interpolating linearly between its samples.
+
+        Args:
+            table(array.array)
+            position(float): Clamped to 0.0 to 1.0.
+
+        Returns:
+            float
+        """
+        position = min(max(float(position), 0.0), 1.0) * self._samples
+        index = min(int(position), self._samples - 1)
+        fraction = position - index
+        return table[index] + (table[index + 1] - table[index]) * fraction
+
+    def lookup(self, position):
+        """ Returns the weight at a slider position from the lookup table.
+
+        Args:
+            position(float): Clamped to 0.0 to 1.0.
+
+        Returns:
+            float
+        """
+        return self.lookup_table(self.table(), position)
+
+    def presets(self, count=13):
+        """ Returns the weights of evenly spaced slider positions, used by the preset buttons.
+
+        Args:
+            count(int)
+
+        Returns:
+            list
+        """
+        if count < 2:
+            return [self.lookup(0.0)]
+
+        return [self.lookup(index / float(count - 1)) for index in range(count)]
+
+    def blend(self, inbetween, position, out=None):
+        """ Returns the value of every curve of an inbetween at a slider position.
+
+        Args:
+            inbetween(KInbetween)
+            position(float): 0.0 to 1.0
+            out(numpy.ndarray, array.array): Optional buffer to write the values into.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        return inbetween.blend(self.lookup(position), out)
+
+
+class KOvershootProfile(KInbetweenProfile):
+    """ Linear profile going past the previous and next keys.
+
+    Args:
+        minimum(float): Weight at the start of the slider.
+        maximum(float): Weight at the end of the slider.
+        samples(int)
+    """
+
+    # Object Methods
+    def __init__(self, minimum=-1.0, maximum=2.0, samples=None):
+        super(KOvershootProfile, self).__init__(samples)
+        self._minimum = float(minimum)
+        self._maximum = float(maximum)
+
+    def __str__(self):
+        return self.str_formatter(self._minimum, self._maximum)
+
+    def evaluate(self, position):
+        return self._minimum + (self._maximum - self._minimum) * position
+
+
+class KEaseProfile(KInbetweenProfile):
+    """ Profile easing in, out, or both, with a power curve.
+
+    Args:
+        ease_in(bool): Starts slowly from the previous key.
+        ease_out(bool): Ends slowly on the next key.
+        power(float): 2.0 is quadratic, 3.0 cubic.
+        samples(int)
+    """
+
+    # Object Methods
+    def __init__(self, ease_in=True, ease_out=True, power=2.0, samples=None):
+        super(KEaseProfile, self).__init__(samples)
+        self._ease_in = bool(ease_in)
+        self._ease_out = bool(ease_out)
+        self._power = float(power)
+
+    def __str__(self):
+        return self.str_formatter(ease_in=self._ease_in, ease_out=self._ease_out, power=self._power)
+
+    def evaluate(self, position):
+        power = self._power
+
+        if self._ease_in and self._ease_out:
+            if position < 0.5:
+                return 0.5 * (2.0 * position) ** power
+
+            return 1.0 - 0.5 * (2.0 - 2.0 * position) ** power
+
+        if self._ease_in:
+            return position ** power
+
+        if self._ease_out:
+            return 1.0 - (1.0 - position) ** power
+
+        return position
+
+
+class KSpringProfile(KInbetweenProfile):
+    """ Profile overshooting the next key and settling on it like a damped spring.
+
+    The spring is scaled so the end of the slider lands on the next key, frequency and damping can't leave it at
+    zero there, like a whole number of oscillations without damping.
+
+    Args:
+        frequency(float): Number of oscillations over the slider.
+        damping(float): How fast the oscillations fade, 0.0 or more.
+        samples(int)
+    """
+    # Smallest value of the spring at the end of the slider it can be scaled from.
+    TOLERANCE = 1e-3
+
+    # Object Methods
+    def __init__(self, frequency=1.5, damping=4.0, samples=None):
+        super(KSpringProfile, self).__init__(samples)
+        self._frequency = float(frequency)
+        self._damping = float(damping)
+
+        if self._damping < 0.0:
+            raise ValueError("Spring damping can't be negative.")
+
+        self._end = self._spring(1.0)
+
+        if abs(self._end) < self.TOLERANCE:
+            raise ValueError("Spring with frequency {} and damping {} doesn't reach the next key.".format(
+                self._frequency, self._damping))
+
+    def __str__(self):
+        return self.str_formatter(self._frequency, self._damping)
+
+    def _spring(self, position):
+        return 1.0 - math.exp(-self._damping * position) * math.cos(2.0 * math.pi * self._frequency * position)
+
+    def evaluate(self, position):
+        # Scaled so the end of the slider lands on the next key.
+        return self._spring(position) / self._end
+
+
+class KTangentProfile(KInbetweenProfile):
+    """ Profile following the tangents of the previous and next keys, a cubic Hermite between them.
+
+    The four Hermite basis functions are sampled into lookup tables, the tangents of every curve come from the
+    inbetween. Without tangents it eases in and out.
+
+    References:
+        * https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+    """
+    USES_TANGENTS = True
+
+    # Static Methods
+    @staticmethod
+    def get_basis(position):
+        """ Returns the Hermite basis functions at a position.
+
+        Args:
+            position(float)
+
+        Returns:
+            tuple: (h00, h10, h01, h11)
+        """
+        square = position * position
+        cube = square * position
+        return (2.0 * cube - 3.0 * square + 1.0,
+                cube - 2.0 * square + position,
+                -2.0 * cube + 3.0 * square,
+                cube - square)
+
+    # Object Methods
+    def __init__(self, samples=None):
+        super(KTangentProfile, self).__init__(samples)
+        self._basis = None
+
+    def evaluate(self, position):
+        return self.get_basis(position)[2]
+
+    def basis_tables(self):
+        """ Returns the lookup tables of the four Hermite basis functions, built on the first call.
+
+        Returns:
+            tuple: (h00, h10, h01, h11) array.array
+        """
+        if self._basis is None:
+            self._basis = tuple(self.sample(lambda position, index=index: self.get_basis(position)[index])
+                                for index in range(4))
+
+        return self._basis
+
+    def blend(self, inbetween, position, out=None):
+        basis = [self.lookup_table(table, position) for table in self.basis_tables()]
+        return inbetween.blend_hermite(basis, out)
+
+
+if __name__ == '__main__':
+    _profile = KEaseProfile()
+    print(_profile.presets())
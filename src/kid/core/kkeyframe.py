@@ -4,34 +4,76 @@
 from kid.core.kobject import KObject
 
 # Python Modules
-
-# Maya Modules
-import maya.cmds as cmds
+import math
 
 
 class KKeyTangent(KObject):
+    """ Class that holds the in and out tangents of a key.
+
+    Slopes are in value per frame. Weights are the length of the tangents in frames, only used by weighted curves,
+    0.0 uses a third of the time to the neighbour key like Maya's default weight. Types are the
+    OpenMayaAnim.MFnAnimCurve tangent types, see KAnimCurve.
+
+    Args:
+        in_slope(float)
+        out_slope(float)
+        in_type(int)
+        out_type(int)
+        in_weight(float)
+        out_weight(float)
     """
+    __slots__ = ("in_slope", "out_slope", "in_type", "out_type", "in_weight", "out_weight")
 
-    """
+    # Object Methods
+    def __init__(self, in_slope=0.0, out_slope=0.0, in_type=1, out_type=1, in_weight=0.0, out_weight=0.0):
+        self.in_slope = float(in_slope)
+        self.out_slope = float(out_slope)
+        self.in_type = int(in_type)
+        self.out_type = int(out_type)
+        self.in_weight = float(in_weight)
+        self.out_weight = float(out_weight)
+
+    def __str__(self):
+        return self.str_formatter(self.in_slope, self.out_slope, in_type=self.in_type, out_type=self.out_type)
+
+    def __eq__(self, other):
+        if not isinstance(other, KKeyTangent):
+            return False
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __ne__(self, other):
+        return not self == other
 
-    def __init__(self):
-        self._in_x = None
-        self._in_y = None
-        self._in_angle = None
-        self._in_type = None
-        self._in_weight = None
+    # Tangents are mutable, they compare by value and are not hashable.
+    __hash__ = None
 
-        self._out_x = None
-        self._out_y = None
-        self._out_angle = None
-        self._out_type = None
-        self._out_weight = None
+    def in_angle(self):
+        """ Returns the angle of the in tangent in degrees.
+
+        Returns:
+            float
+        """
+        return math.degrees(math.atan(self.in_slope))
+
+    def out_angle(self):
+        """ Returns the angle of the out tangent in degrees.
+
+        Returns:
+            float
+        """
+        return math.degrees(math.atan(self.out_slope))
 
 
 class KKeyFrame(KObject):
-    """
+    """ Class that holds the time, value and tangents of a key, the tangents are only created when needed.
 
+    Args:
+        time(float): Frame.
+        value(float)
+        tangent(KKeyTangent)
     """
+    __slots__ = ("_time", "_value", "_tangent")
 
     # Class Methods
     @classmethod
@@ -46,6 +88,8 @@ class KKeyFrame(KObject):
         Returns:
             KObject
         """
+        import maya.cmds as cmds
+
         obj = cls()
         query = "{}.{}".format(node, attr)
         obj.time = time
@@ -53,15 +97,25 @@ class KKeyFrame(KObject):
         return obj
 
     # Object Methods
-    def __init__(self):
-        self._time = None
-        self._value = None
+    def __init__(self, time=None, value=None, tangent=None):
+        self._time = time
+        self._value = value
+        self._tangent = tangent
 
-        self._tangent = KKeyTangent()
+    def __str__(self):
+        return self.str_formatter(self._time, self._value)
 
     def __getitem__(self, item):
         return [self._time, self._value][item]
 
+    def has_tangent(self):
+        """ Returns True if the tangent was set or created.
+
+        Returns:
+            bool
+        """
+        return self._tangent is not None
+
     @property
     def time(self):
         return self._time
@@ -80,6 +134,22 @@ class KKeyFrame(KObject):
         self._value = value
         return
 
+    @property
+    def tangent(self):
+        if self._tangent is None:
+            self._tangent = KKeyTangent()
+
+        return self._tangent
+
+    @tangent.setter
+    def tangent(self, value):
+        if value is not None and not isinstance(value, KKeyTangent):
+            raise TypeError("Invalid type.")
+
+        self._tangent = value
+        return
+
 
 if __name__ == '__main__':
-    pass
+    _key = KKeyFrame(1.0, 5.0)
+    print(_key, _key.has_tangent())
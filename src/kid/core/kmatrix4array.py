@@ -0,0 +1,370 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kmatrix4 import KMatrix4
+from kid.core.keuler import KEuler
+
+# Python Modules
+from array import array
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class KMatrix4Array(KObject):
+    """ Class that handles a stack of 4x4 matrices, for example a world matrix per frame.
+
+    With NumPy the stack is a (N, 4, 4) float64 array and every operation is vectorized. Without NumPy the stack
+    is a flat array('d') of N * 16 values and the operations loop over KMatrix4 in pure Python, so the results
+    are the same either way.
+
+    Args:
+        count(int): Number of identity matrices to start with.
+    """
+    __slots__ = ("_data", "_count")
+
+    HAS_NUMPY = numpy is not None
+
+    # Class Methods
+    @classmethod
+    def from_xforms(cls, xforms):
+        """ Returns a new KMatrix4Array from a flat buffer of N * 16 row-major values.
+
+        Args:
+            xforms(list, tuple, array.array, memoryview, numpy.ndarray)
+
+        Returns:
+            KMatrix4Array
+        """
+        if len(xforms) % 16:
+            raise TypeError("Invalid xform buffer length.")
+
+        obj = cls()
+        obj._count = len(xforms) // 16
+
+        if cls.HAS_NUMPY:
+            obj._data = numpy.array(xforms, dtype=numpy.float64).reshape(obj._count, 4, 4)
+        else:
+            obj._data = array("d", xforms)
+
+        return obj
+
+    @classmethod
+    def from_matrices(cls, matrices):
+        """ Returns a new KMatrix4Array from a list of KMatrix4.
+
+        Args:
+            matrices(list): list of KMatrix4
+
+        Returns:
+            KMatrix4Array
+        """
+        xforms = array("d")
+
+        for matrix in matrices:
+            xforms.extend(matrix.data())
+
+        return cls.from_xforms(xforms)
+
+    @classmethod
+    def from_numpy(cls, data):
+        """ Returns a new KMatrix4Array from a (N, 4, 4) or (N, 16) array.
+
+        Args:
+            data(numpy.ndarray)
+
+        Returns:
+            KMatrix4Array
+        """
+        return cls.from_xforms(numpy.asarray(data, dtype=numpy.float64).reshape(-1))
+
+    # Object Methods
+    def __init__(self, count=0):
+        self._count = count
+
+        if self.HAS_NUMPY:
+            self._data = numpy.tile(numpy.identity(4), (count, 1, 1))
+        else:
+            self._data = KMatrix4.IDENTITY * count
+
+    def __str__(self):
+        return self.str_formatter(len(self), numpy=self.HAS_NUMPY)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, item):
+        if item < 0:
+            item += self._count
+
+        if not 0 <= item < self._count:
+            raise IndexError("Matrix index out of range.")
+
+        if self.HAS_NUMPY:
+            return KMatrix4.from_xform(self._data[item].ravel())
+
+        return KMatrix4.from_xform(self._data[item * 16:item * 16 + 16], copy=False)
+
+    def __setitem__(self, item, value):
+        if not isinstance(value, KMatrix4):
+            raise TypeError("Invalid type.")
+
+        if item < 0:
+            item += self._count
+
+        if not 0 <= item < self._count:
+            raise IndexError("Matrix index out of range.")
+
+        if self.HAS_NUMPY:
+            self._data[item] = numpy.frombuffer(value.data(), dtype=numpy.float64).reshape(4, 4)
+        else:
+            self._data[item * 16:item * 16 + 16] = value.data()
+        return
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def _new(self, data):
+        obj = self.__class__()
+        obj._data = data
+        obj._count = len(data) if self.HAS_NUMPY else len(data) // 16
+        return obj
+
+    def _as_stack(self, other):
+        """ Returns other as storage compatible with this stack, broadcasting a single matrix.
+
+        Args:
+            other(KMatrix4Array, KMatrix4)
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        if isinstance(other, KMatrix4):
+            if self.HAS_NUMPY:
+                return numpy.frombuffer(other.data(), dtype=numpy.float64).reshape(1, 4, 4)
+            return other.data()
+
+        if isinstance(other, KMatrix4Array):
+            if len(other) not in (1, self._count) and self._count != 1:
+                raise ArithmeticError("Matrix stacks are NOT the same size.")
+            return other._data
+
+        raise ArithmeticError("Invalid type")
+
+    def count(self):
+        """ Returns the number of matrices.
+
+        Returns:
+            int
+        """
+        return self._count
+
+    def data(self):
+        """ Returns the storage, a (N, 4, 4) numpy.ndarray or a flat array('d').
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        return self._data
+
+    def multiply(self, other):
+        """ Returns the per matrix product self[i] * other[i].
+
+        A KMatrix4 or a single matrix stack is broadcast over every matrix of the stack.
+
+        Args:
+            other(KMatrix4Array, KMatrix4)
+
+        Returns:
+            KMatrix4Array
+        """
+        b = self._as_stack(other)
+
+        if self.HAS_NUMPY:
+            return self._new(numpy.matmul(self._data, b))
+
+        a = self._data
+        a_count = self._count
+        b_count = len(b) // 16
+        result = array("d")
+
+        # Broadcasting over an empty stack gives an empty stack, like numpy.matmul().
+        if not a_count or not b_count:
+            return self._new(result)
+
+        count = max(a_count, b_count)
+        a_step = 16 if a_count > 1 else 0
+        b_step = 16 if b_count > 1 else 0
+
+        multiply = KMatrix4.multiply_xform
+
+        for index in range(count):
+            result.extend(multiply(a[index * a_step:index * a_step + 16], b[index * b_step:index * b_step + 16]))
+
+        return self._new(result)
+
+    def inverse(self):
+        """ Returns the stack of inverse matrices, raises ZeroDivisionError if one is singular like KMatrix4.
+
+        Returns:
+            KMatrix4Array
+        """
+        if self.HAS_NUMPY:
+            try:
+                return self._new(numpy.linalg.inv(self._data))
+            except numpy.linalg.LinAlgError:
+                raise ZeroDivisionError('Matrix is singular.')
+
+        result = array("d")
+        matrix = KMatrix4()
+
+        for index in range(self._count):
+            matrix.xform_view()[:] = self._data[index * 16:index * 16 + 16]
+            matrix.inverse(out=matrix)
+            result.extend(matrix.data())
+
+        return self._new(result)
+
+    def transpose(self):
+        """ Returns the stack of transposed matrices.
+
+        Returns:
+            KMatrix4Array
+        """
+        if self.HAS_NUMPY:
+            return self._new(numpy.ascontiguousarray(numpy.swapaxes(self._data, 1, 2)))
+
+        data = self._data
+        result = array("d", data)
+
+        for index in range(0, len(data), 16):
+            for row in range(4):
+                for column in range(4):
+                    result[index + column * 4 + row] = data[index + row * 4 + column]
+
+        return self._new(result)
+
+    def decompose(self, order=0, shear=False):
+        """ Returns the translation, euler rotation in degrees and scale of every matrix.
+
+        Scale and shear are extracted with Gram-Schmidt like KMatrix4.decompose_xform(), so sheared and mirrored
+        matrices give the same values as Maya.
+
+        Args:
+            order(int): Rotation order of the euler rotations.
+            shear(bool): Also returns the xy, xz and yz shear of every matrix.
+
+        Returns:
+            tuple: Three, or four with shear, (N, 3) numpy.ndarray, or flat array('d') of N * 3 values without
+                   NumPy.
+        """
+        if self.HAS_NUMPY:
+            data = self._data
+            translations = data[:, 3, :3].copy()
+            x_axes = data[:, 0, :3].copy()
+            y_axes = data[:, 1, :3].copy()
+            z_axes = data[:, 2, :3].copy()
+
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                scales = numpy.empty((self._count, 3))
+                shears = numpy.empty((self._count, 3))
+
+                scales[:, 0] = numpy.linalg.norm(x_axes, axis=1)
+                x_axes = numpy.where(scales[:, 0:1] > 0.0, x_axes / scales[:, 0:1], x_axes)
+
+                shears[:, 0] = numpy.einsum("ij,ij->i", x_axes, y_axes)
+                y_axes -= x_axes * shears[:, 0:1]
+                scales[:, 1] = numpy.linalg.norm(y_axes, axis=1)
+                y_axes = numpy.where(scales[:, 1:2] > 0.0, y_axes / scales[:, 1:2], y_axes)
+
+                shears[:, 1] = numpy.einsum("ij,ij->i", x_axes, z_axes)
+                shears[:, 2] = numpy.einsum("ij,ij->i", y_axes, z_axes)
+                z_axes -= x_axes * shears[:, 1:2] + y_axes * shears[:, 2:3]
+                scales[:, 2] = numpy.linalg.norm(z_axes, axis=1)
+                z_axes = numpy.where(scales[:, 2:3] > 0.0, z_axes / scales[:, 2:3], z_axes)
+
+                shears[:, 0] = numpy.where(scales[:, 1] > 0.0, shears[:, 0] / scales[:, 1], shears[:, 0])
+                shears[:, 1:] = numpy.where(scales[:, 2:3] > 0.0, shears[:, 1:] / scales[:, 2:3], shears[:, 1:])
+
+            mirrored = numpy.linalg.det(data[:, :3, :3]) < 0.0
+            scales[mirrored, 0] *= -1.0
+            x_axes[mirrored] *= -1.0
+            shears[mirrored, :2] *= -1.0
+
+            axes = numpy.zeros((self._count, 4, 4))
+            axes[:, 0, :3] = x_axes
+            axes[:, 1, :3] = y_axes
+            axes[:, 2, :3] = z_axes
+            rotations = KEuler.xforms_to_rotations(axes.ravel(), order)
+
+            if shear:
+                return translations, rotations, scales, shears
+
+            return translations, rotations, scales
+
+        translations = array("d")
+        rotations = array("d")
+        scales = array("d")
+        shears = array("d")
+        values = [0.0] * 12
+        data = self._data
+
+        for index in range(0, len(data), 16):
+            KMatrix4.decompose_xform(data[index:index + 16], order, values)
+            translations.extend(values[0:3])
+            rotations.extend(values[3:6])
+            scales.extend(values[6:9])
+            shears.extend(values[9:12])
+
+        if shear:
+            return translations, rotations, scales, shears
+
+        return translations, rotations, scales
+
+    def as_matrices(self):
+        """ Returns the stack as a list of KMatrix4.
+
+        Returns:
+            list
+        """
+        return [self[index] for index in range(self._count)]
+
+    def as_xforms(self):
+        """ Returns the stack as a flat array('d') of N * 16 row-major values.
+
+        Returns:
+            array.array
+        """
+        if self.HAS_NUMPY:
+            result = array("d")
+            result.frombytes(numpy.ascontiguousarray(self._data).tobytes())
+            return result
+
+        return array("d", self._data)
+
+    def as_numpy(self):
+        """ Returns the stack as a (N, 4, 4) float64 array.
+
+        Returns:
+            numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError("NumPy is not available.")
+
+        if self.HAS_NUMPY:
+            return self._data
+
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(self._count, 4, 4)
+
+
+if __name__ == '__main__':
+    _stack = KMatrix4Array(3)
+    print(_stack, _stack.decompose())
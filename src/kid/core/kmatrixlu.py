@@ -0,0 +1,253 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+
+# Python Modules
+
+
+class KMatrixLU(KObject):
+    """ Class that holds the LU decomposition (with partial pivoting) of a square matrix.
+
+    The factorization is computed once and can be reused to get the determinant, the inverse or to solve
+    linear systems without running the elimination again. Cost is O(n^3) instead of the O(n!) of the cofactor
+    expansion.
+
+    References:
+        * https://en.wikipedia.org/wiki/LU_decomposition
+        * https://integratedmlai.com/basic-linear-algebra-tools-in-pure-python-without-numpy-or-scipy/
+
+    Args:
+        matrix(list): NxN matrix list
+    """
+    # Pivots smaller than this, relative to the largest element of their row, are treated as zero.
+    TOLERANCE = 1e-12
+
+    # Class Methods
+    @classmethod
+    def from_matrix(cls, matrix):
+        """ Returns a new KMatrixLU object from a NxN matrix list.
+
+        Args:
+            matrix(list): NxN matrix list
+
+        Returns:
+            KMatrixLU
+        """
+        return cls(matrix)
+
+    # Object Methods
+    def __init__(self, matrix):
+        size = len(matrix)
+
+        for row in matrix:
+            if len(row) != size:
+                raise ArithmeticError('Matrix is NOT square.')
+
+        self._size = size
+        self._lu = [float(value) for row in matrix for value in row]
+        self._pivots = list(range(size))
+        self._sign = 1.0
+        self._singular = False
+
+        self._decompose()
+
+    def __str__(self):
+        return self.str_formatter(self._size, singular=self._singular)
+
+    def _decompose(self):
+        """ Runs the Doolittle elimination in place on the flat row-major buffer.
+
+        Returns:
+            None
+        """
+        n = self._size
+        lu = self._lu
+        pivots = self._pivots
+
+        # Each row is measured against its own largest element, badly scaled rows like diag(1e6, 1e-7) aren't
+        # singular.
+        scales = [self.TOLERANCE * max([abs(value) for value in lu[i * n:i * n + n]]) for i in range(n)]
+
+        for k in range(n):
+            # Section 1: Find the pivot row
+            pivot_row = k
+            pivot_value = abs(lu[k * n + k])
+
+            for i in range(k + 1, n):
+                value = abs(lu[i * n + k])
+
+                if value > pivot_value:
+                    pivot_row = i
+                    pivot_value = value
+
+            if pivot_value <= scales[pivot_row]:
+                self._singular = True
+                continue
+
+            # Section 2: Swap rows
+            if pivot_row != k:
+                a = k * n
+                b = pivot_row * n
+                lu[a:a + n], lu[b:b + n] = lu[b:b + n], lu[a:a + n]
+                pivots[k], pivots[pivot_row] = pivots[pivot_row], pivots[k]
+                scales[k], scales[pivot_row] = scales[pivot_row], scales[k]
+                self._sign = -self._sign
+
+            # Section 3: Eliminate below the pivot
+            pivot = lu[k * n + k]
+            k_row = k * n
+
+            for i in range(k + 1, n):
+                i_row = i * n
+                factor = lu[i_row + k] / pivot
+                lu[i_row + k] = factor
+
+                if factor == 0.0:
+                    continue
+
+                for j in range(k + 1, n):
+                    lu[i_row + j] -= factor * lu[k_row + j]
+
+        return
+
+    def _solve_column(self, column):
+        """ Solves LUx = Pb for a single column and returns x as a list.
+
+        Args:
+            column(list): n element list
+
+        Returns:
+            list
+        """
+        n = self._size
+        lu = self._lu
+
+        # Forward substitution (L has an implicit unit diagonal)
+        y = [float(column[p]) for p in self._pivots]
+
+        for i in range(n):
+            i_row = i * n
+            total = y[i]
+
+            for j in range(i):
+                total -= lu[i_row + j] * y[j]
+
+            y[i] = total
+
+        # Back substitution
+        for i in range(n - 1, -1, -1):
+            i_row = i * n
+            total = y[i]
+
+            for j in range(i + 1, n):
+                total -= lu[i_row + j] * y[j]
+
+            y[i] = total / lu[i_row + i]
+
+        return y
+
+    def size(self):
+        """ Returns the square size of the factored matrix.
+
+        Returns:
+            int
+        """
+        return self._size
+
+    def is_singular(self):
+        """ Returns True if the factored matrix can't be inverted.
+
+        Returns:
+            bool
+        """
+        return self._singular
+
+    def lower(self):
+        """ Returns the unit lower triangular factor.
+
+        Returns:
+            list
+        """
+        n = self._size
+        return [[self._lu[i * n + j] if j < i else (1.0 if i == j else 0.0) for j in range(n)] for i in range(n)]
+
+    def upper(self):
+        """ Returns the upper triangular factor.
+
+        Returns:
+            list
+        """
+        n = self._size
+        return [[self._lu[i * n + j] if j >= i else 0.0 for j in range(n)] for i in range(n)]
+
+    def pivots(self):
+        """ Returns the row permutation, where pivots[i] is the source row of row i.
+
+        Returns:
+            list
+        """
+        return list(self._pivots)
+
+    def determinant(self):
+        """ Returns the determinant of the factored matrix.
+
+        Returns:
+            float
+        """
+        if self._singular:
+            return 0.0
+
+        n = self._size
+        result = self._sign
+
+        for i in range(n):
+            result *= self._lu[i * n + i]
+
+        return result
+
+    def solve(self, b):
+        """ Solves the linear system Ax = b.
+
+        Args:
+            b(list): n element list, or a n x m matrix list to solve for several columns at once.
+
+        Returns:
+            list
+        """
+        if self._singular:
+            raise ZeroDivisionError('Matrix is singular.')
+
+        if len(b) != self._size:
+            raise ArithmeticError('Number of b rows must equal the matrix size.')
+
+        if not b or not isinstance(b[0], (list, tuple)):
+            return self._solve_column(b)
+
+        columns = [self._solve_column(column) for column in zip(*b)]
+        return list(map(list, zip(*columns)))
+
+    def inverse(self):
+        """ Returns the inverse of the factored matrix.
+
+        Returns:
+            list
+        """
+        if self._singular:
+            raise ZeroDivisionError('Matrix is singular.')
+
+        n = self._size
+        columns = list()
+
+        for j in range(n):
+            unit = [0.0] * n
+            unit[j] = 1.0
+            columns.append(self._solve_column(unit))
+
+        return list(map(list, zip(*columns)))
+
+
+if __name__ == '__main__':
+    _lu = KMatrixLU([[4.0, 3.0, 0.0], [6.0, 3.0, 1.0], [0.0, 2.0, 5.0]])
+    print(_lu.determinant())
+    print(_lu.inverse())
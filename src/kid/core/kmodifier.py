@@ -0,0 +1,366 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+
+# Python Modules
+
+# Maya Modules
+import maya.cmds as cmds
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
+
+
+class KModifier(KObject):
+    """ Class that batches plug writes and animation keys and applies them as a single undoable step.
+
+    Plug values are queued on an OpenMaya.MDGModifier, keys are added in bulk with MFnAnimCurve.addKeys() and
+    recorded in an MAnimCurveChange. Nothing changes in the scene until do_it().
+
+    do_it() hands the batch to the kidApplyModifier command registered by plugin_kid.py, which applies it and keeps
+    it for undo and redo. Going through a command puts the whole batch in the current undo chunk, such as the one
+    KMCommand.do_it() opens. When the plug-in isn't loaded the batch is applied directly and can't be undone.
+
+    References:
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_d_g_modifier_html
+        * https://github.com/mottosso/apiundo
+    """
+    COMMAND = "kidApplyModifier"
+
+    # Batches waiting for the command to pick them up.
+    _PENDING = list()
+
+    # Static Methods
+    @staticmethod
+    def has_command():
+        """ Returns True if the kidApplyModifier command is registered.
+
+        Returns:
+            bool
+        """
+        return hasattr(cmds, KModifier.COMMAND)
+
+    # Class Methods
+    @classmethod
+    def pop_pending(cls):
+        """ Returns the oldest batch waiting to be applied, called by the kidApplyModifier command.
+
+        Returns:
+            KModifier: Call redo_it() and undo_it() on it.
+        """
+        if not cls._PENDING:
+            raise RuntimeError("No modifier to apply.")
+
+        return cls._PENDING.pop(0)
+
+    # Object Methods
+    def __init__(self):
+        self._modifier = OpenMaya.MDGModifier()
+        self._curve_modifier = OpenMaya.MDGModifier()
+        self._keys = list()
+        self._curves = list()
+        self._changes = list()
+        self._applied = False
+        self._count = 0
+        self._progress = None
+        self._created = dict()
+
+    def __str__(self):
+        return self.str_formatter(self._count)
+
+    def __len__(self):
+        return self._count
+
+    def is_valid(self):
+        """ Returns True if there is something to apply.
+
+        Returns:
+            bool
+        """
+        return self._count > 0
+
+    def modifier(self):
+        """ Returns the wrapped MDGModifier.
+
+        Returns:
+            OpenMaya.MDGModifier
+        """
+        return self._modifier
+
+    def set_double(self, plug, value):
+        """ Queues a double plug value, angles are in radians and distances in centimeters.
+
+        Args:
+            plug(OpenMaya.MPlug)
+            value(float)
+
+        Returns:
+            None
+        """
+        self._modifier.newPlugValueDouble(plug, value)
+        self._count += 1
+        return
+
+    def set_doubles(self, plugs, values):
+        """ Queues double plug values.
+
+        Args:
+            plugs(list): list of OpenMaya.MPlug
+            values(list): One float per plug.
+
+        Returns:
+            None
+        """
+        modifier = self._modifier
+
+        for plug, value in zip(plugs, values):
+            modifier.newPlugValueDouble(plug, value)
+
+        self._count += len(plugs)
+        return
+
+    def add_keys(self, plug, times, values, tangent_in=None, tangent_out=None, keep_existing=True, curve=None):
+        """ Queues keys on a plug, an anim curve is created for it if it has none.
+
+        Args:
+            plug(OpenMaya.MPlug)
+            times(list): Frames in the current time unit.
+            values(list): One value per frame, angles are in radians and distances in centimeters.
+            tangent_in(int): OpenMayaAnim.MFnAnimCurve tangent type, kTangentGlobal if None.
+            tangent_out(int): OpenMayaAnim.MFnAnimCurve tangent type, kTangentGlobal if None.
+            keep_existing(bool): Keeps the keys of the curve that aren't replaced.
+            curve(OpenMaya.MObject): Anim curve driving the plug, skips looking it up when already known.
+
+        Returns:
+            None
+        """
+        if len(times) != len(values):
+            raise ValueError("Times and values are NOT the same size.")
+
+        tangent_in = OpenMayaAnim.MFnAnimCurve.kTangentGlobal if tangent_in is None else tangent_in
+        tangent_out = OpenMayaAnim.MFnAnimCurve.kTangentGlobal if tangent_out is None else tangent_out
+        self._keys.append((plug, times, values, tangent_in, tangent_out, keep_existing, curve))
+        self._count += len(times)
+        return
+
+    def add_curve(self, plug, curve, keep_existing=False):
+        """ Queues every key of a KAnimCurve on a plug with its tangents, weights, locks and infinity.
+
+        Args:
+            plug(OpenMaya.MPlug)
+            curve(KAnimCurve): Values and slopes in internal units, radians for angles.
+            keep_existing(bool): Keeps the keys of the anim curve that aren't replaced, they are cleared if False.
+
+        Returns:
+            None
+        """
+        self._curves.append((plug, curve, keep_existing))
+        self._count += len(curve)
+        return
+
+    def _get_curve(self, plug):
+        """ Returns the anim curve driving a plug, queues creating one if it has none.
+
+        A queued curve only exists after the curve modifier doIt(), so the curves created for the batch are kept by
+        plug name, every entry of the same plug gets the same one.
+        """
+        name = plug.name()
+
+        if name in self._created:
+            return self._created[name]
+
+        found = OpenMaya.MObjectArray()
+
+        if OpenMayaAnim.MAnimUtil.findAnimation(plug, found) and found.length():
+            return found[0]
+
+        curve = OpenMayaAnim.MFnAnimCurve().create(plug, self._curve_modifier)
+        self._created[name] = curve
+        return curve
+
+    def _apply_curve(self, function, curve, keep_existing, change):
+        """ Adds the keys of a KAnimCurve with one addKeys() call and sets what addKeys() can't on every key.
+        """
+        columns = curve.columns()
+        fps = curve.fps()
+        seconds = OpenMaya.MTime.kSeconds
+        time_array = OpenMaya.MTimeArray()
+        value_array = OpenMaya.MDoubleArray()
+
+        # The curve times are frames at its own frame rate.
+        for time, value in zip(columns["times"], columns["values"]):
+            time_array.append(OpenMaya.MTime(time / fps, seconds))
+            value_array.append(value)
+
+        function.addKeys(time_array, value_array, OpenMayaAnim.MFnAnimCurve.kTangentGlobal,
+                         OpenMayaAnim.MFnAnimCurve.kTangentGlobal, keep_existing, change)
+        function.setIsWeighted(curve.is_weighted(), change)
+        function.setPreInfinityType(curve.pre_infinity(), change)
+        function.setPostInfinityType(curve.post_infinity(), change)
+
+        fixed = OpenMayaAnim.MFnAnimCurve.kTangentFixed
+        weighted = curve.is_weighted()
+        rows = zip(columns["times"], columns["in_slopes"], columns["out_slopes"], columns["in_weights"],
+                   columns["out_weights"], columns["in_types"], columns["out_types"], columns["breakdowns"],
+                   columns["tangent_locks"], columns["weight_locks"])
+
+        for index, row in enumerate(rows):
+            time, in_slope, out_slope, in_weight, out_weight, in_type, out_type, breakdown, locked, weight_locked = row
+
+            if keep_existing:
+                index = function.findClosest(OpenMaya.MTime(time / fps, seconds))
+
+            # Unlocked first so setting one tangent doesn't move the other one.
+            function.setTangentsLocked(index, False, change)
+            function.setInTangentType(index, in_type, change)
+            function.setOutTangentType(index, out_type, change)
+
+            # Tangents are x in seconds and y in internal units, a weight of 0.0 is one frame long.
+            if weighted or in_type == fixed:
+                in_weight = in_weight or 1.0
+                function.setTangent(index, in_weight / fps, in_slope * in_weight, True, change, False)
+
+            if weighted or out_type == fixed:
+                out_weight = out_weight or 1.0
+                function.setTangent(index, out_weight / fps, out_slope * out_weight, False, change, False)
+
+            if breakdown:
+                function.setIsBreakdown(index, True, change)
+
+            function.setTangentsLocked(index, bool(locked), change)
+
+            if weighted:
+                function.setWeightsLocked(index, bool(weight_locked), change)
+
+        return
+
+    def _apply_keys(self):
+        """ Creates the missing anim curves and adds the queued keys and curves, recording every change for undo.
+        """
+        curves = list()
+        unit = OpenMaya.MTime.uiUnit()
+
+        for plug, _, _, _, _, _, curve in self._keys:
+            curves.append(curve if curve is not None else self._get_curve(plug))
+
+        anim_curves = [self._get_curve(plug) for plug, _, _ in self._curves]
+        self._curve_modifier.doIt()
+        function = OpenMayaAnim.MFnAnimCurve()
+        progress = self._progress
+        total = len(self._curves) + len(self._keys)
+
+        for done, (anim_curve, (_, curve, keep_existing)) in enumerate(zip(anim_curves, self._curves), 1):
+            change = OpenMayaAnim.MAnimCurveChange()
+            function.setObject(anim_curve)
+            self._apply_curve(function, curve, keep_existing, change)
+            self._changes.append(change)
+
+            if progress is not None:
+                progress(done, total)
+
+        done = len(self._curves)
+
+        for curve, (_, times, values, tangent_in, tangent_out, keep_existing, _) in zip(curves, self._keys):
+            time_array = OpenMaya.MTimeArray()
+            value_array = OpenMaya.MDoubleArray()
+
+            for time, value in zip(times, values):
+                time_array.append(OpenMaya.MTime(time, unit))
+                value_array.append(value)
+
+            change = OpenMayaAnim.MAnimCurveChange()
+            function.setObject(curve)
+            function.addKeys(time_array, value_array, tangent_in, tangent_out, keep_existing, change)
+            self._changes.append(change)
+            done += 1
+
+            if progress is not None:
+                progress(done, total)
+        return
+
+    def redo_it(self):
+        """ Applies the batch, called by do_it() or the kidApplyModifier command.
+
+        Returns:
+            None
+        """
+        self._modifier.doIt()
+
+        if self._applied:
+            self._curve_modifier.doIt()
+
+            for change in self._changes:
+                change.redoIt()
+        elif self._keys or self._curves:
+            try:
+                self._apply_keys()
+            finally:
+                # Redo doesn't report, and the batch kept for undo doesn't keep the callback.
+                self._progress = None
+
+        self._applied = True
+        return
+
+    def undo_it(self):
+        """ Reverts the batch, called by the kidApplyModifier command.
+
+        Returns:
+            None
+        """
+        for change in reversed(self._changes):
+            change.undoIt()
+
+        self._curve_modifier.undoIt()
+        self._modifier.undoIt()
+        return
+
+    def detach(self):
+        """ Returns a KModifier owning the queued batch and starts over with an empty one.
+
+        Returns:
+            KModifier
+        """
+        batch = KModifier.__new__(KModifier)
+        batch.__dict__.update(self.__dict__)
+        self.__init__()
+        return batch
+
+    def do_it(self, undoable=True, progress=None):
+        """ Applies the queued plug values and keys.
+
+        Args:
+            undoable(bool): Goes through the kidApplyModifier command so the batch can be undone.
+            progress(callable): Called with (done, total) curves after the keys of each curve are added.
+
+        Returns:
+            None
+        """
+        if not self._count:
+            return
+
+        # A batch can only be applied once, the next writes start a new one.
+        batch = self.detach()
+        batch._progress = progress
+
+        if undoable and self.has_command():
+            self._PENDING.append(batch)
+
+            try:
+                getattr(cmds, self.COMMAND)()
+            finally:
+                if batch in self._PENDING:
+                    self._PENDING.remove(batch)
+        else:
+            batch.redo_it()
+
+        return
+
+
+if __name__ == '__main__':
+    _modifier = KModifier()
+    _selection = OpenMaya.MSelectionList()
+    _selection.add("pCube1.translateX")
+    _plug = OpenMaya.MPlug()
+    _selection.getPlug(0, _plug)
+    _modifier.set_double(_plug, 5.0)
+    _modifier.do_it()
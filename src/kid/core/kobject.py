@@ -8,6 +8,9 @@
 class KObject(object):
     """ Base object framework.
     """
+    # Empty so slotted subclasses don't get a __dict__ back from the base class.
+    __slots__ = ()
+
     def __str__(self):
         return self.str_formatter()
 
@@ -79,7 +82,15 @@ class KObject(object):
     def as_dict(self):
         result = dict()
 
-        for x in self.__dict__.keys():
+        # Slotted subclasses have no __dict__, their attributes are in the __slots__ of every class.
+        for cls in reversed(type(self).__mro__):
+            slots = cls.__dict__.get("__slots__", ())
+
+            for x in (slots,) if isinstance(slots, str) else slots:
+                if x not in ("__dict__", "__weakref__") and hasattr(self, x):
+                    result[x] = getattr(self, x)
+
+        for x in getattr(self, "__dict__", dict()).keys():
             result[x] = getattr(self, x)
         return result
 
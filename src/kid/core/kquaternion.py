@@ -0,0 +1,412 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.keuler import KEuler
+
+# Python Modules
+from array import array
+import math
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class KQuaternion(KObject):
+    """ Class that handles managing and manipulating rotation quaternions without Maya.
+
+    Notes:
+        * Matrices follow the Maya layout (row vectors), so (a * b).as_matrix() == a.as_matrix() * b.as_matrix(),
+          rotation a is applied first, like KMatrix4 multiplication.
+
+    References:
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_quaternion_html
+        * https://www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion/
+        * https://en.wikipedia.org/wiki/Slerp
+
+    Args:
+        x(float)
+        y(float)
+        z(float)
+        w(float)
+    """
+    __slots__ = ("x", "y", "z", "w")
+
+    # Below this angle between two quaternions slerp falls back to a normalized lerp.
+    SLERP_TOLERANCE = 1e-6
+
+    HAS_NUMPY = numpy is not None
+
+    # Static Methods
+    @staticmethod
+    def slerp_array(a, b, weights):
+        """ Returns the slerp of many quaternion pairs at once, for example every key of two poses.
+
+        Args:
+            a(list, array.array, numpy.ndarray): N * 4 values (x, y, z, w)
+            b(list, array.array, numpy.ndarray): N * 4 values (x, y, z, w)
+            weights(float, list, array.array, numpy.ndarray): One weight or N weights.
+
+        Returns:
+            numpy.ndarray, array.array: (N, 4) array with NumPy, otherwise a flat array('d') of N * 4 values.
+        """
+        if len(a) != len(b):
+            raise ArithmeticError("Quaternion arrays are NOT the same size.")
+
+        if KQuaternion.HAS_NUMPY:
+            a = numpy.asarray(a, dtype=numpy.float64).reshape(-1, 4)
+            b = numpy.asarray(b, dtype=numpy.float64).reshape(-1, 4)
+            weights = numpy.broadcast_to(numpy.asarray(weights, dtype=numpy.float64), (len(a),))
+
+            dot = numpy.einsum("ij,ij->i", a, b)
+
+            # Shortest path
+            b = numpy.where(dot[:, numpy.newaxis] < 0.0, -b, b)
+            dot = numpy.minimum(numpy.abs(dot), 1.0)
+
+            angle = numpy.arccos(dot)
+            sin = numpy.sin(angle)
+            linear = sin < KQuaternion.SLERP_TOLERANCE
+
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                weight_a = numpy.where(linear, 1.0 - weights, numpy.sin((1.0 - weights) * angle) / sin)
+                weight_b = numpy.where(linear, weights, numpy.sin(weights * angle) / sin)
+
+            result = a * weight_a[:, numpy.newaxis] + b * weight_b[:, numpy.newaxis]
+            return result / numpy.linalg.norm(result, axis=1)[:, numpy.newaxis]
+
+        count = len(a) // 4
+
+        if isinstance(weights, (int, float)):
+            weights = [weights] * count
+        elif len(weights) != count:
+            raise ArithmeticError("Number of weights must equal the number of quaternions.")
+
+        result = array("d")
+        slerp = KQuaternion.get_slerp
+
+        for index in range(count):
+            offset = index * 4
+            result.extend(slerp(a[offset:offset + 4], b[offset:offset + 4], weights[index]))
+
+        return result
+
+    @staticmethod
+    def get_slerp(a, b, weight):
+        """ Returns the spherical interpolation of two (x, y, z, w) sequences, along the shortest path.
+
+        Args:
+            a(list, tuple): 4 element sequence
+            b(list, tuple): 4 element sequence
+            weight(float)
+
+        Returns:
+            tuple
+        """
+        ax, ay, az, aw = a
+        bx, by, bz, bw = b
+        dot = ax * bx + ay * by + az * bz + aw * bw
+
+        if dot < 0.0:
+            bx, by, bz, bw = -bx, -by, -bz, -bw
+            dot = -dot
+
+        angle = math.acos(min(dot, 1.0))
+        sin = math.sin(angle)
+
+        if sin < KQuaternion.SLERP_TOLERANCE:
+            weight_a = 1.0 - weight
+            weight_b = weight
+        else:
+            weight_a = math.sin((1.0 - weight) * angle) / sin
+            weight_b = math.sin(weight * angle) / sin
+
+        x = ax * weight_a + bx * weight_b
+        y = ay * weight_a + by * weight_b
+        z = az * weight_a + bz * weight_b
+        w = aw * weight_a + bw * weight_b
+        length = math.sqrt(x * x + y * y + z * z + w * w)
+        return x / length, y / length, z / length, w / length
+
+    # Class Methods
+    @classmethod
+    def from_axes(cls, x_axis, y_axis, z_axis):
+        """ Returns a KQuaternion from three orthonormal axes, the rows of a rotation matrix.
+
+        Args:
+            x_axis(list, tuple): 3 element sequence
+            y_axis(list, tuple): 3 element sequence
+            z_axis(list, tuple): 3 element sequence
+
+        Returns:
+            KQuaternion
+        """
+        m00, m01, m02 = x_axis[0], x_axis[1], x_axis[2]
+        m10, m11, m12 = y_axis[0], y_axis[1], y_axis[2]
+        m20, m21, m22 = z_axis[0], z_axis[1], z_axis[2]
+        trace = m00 + m11 + m22
+
+        # Shepperd's method, pick the largest diagonal term to stay stable.
+        if trace > 0.0:
+            s = math.sqrt(trace + 1.0) * 2.0
+            obj = cls((m12 - m21) / s, (m20 - m02) / s, (m01 - m10) / s, 0.25 * s)
+        elif m00 > m11 and m00 > m22:
+            s = math.sqrt(1.0 + m00 - m11 - m22) * 2.0
+            obj = cls(0.25 * s, (m01 + m10) / s, (m20 + m02) / s, (m12 - m21) / s)
+        elif m11 > m22:
+            s = math.sqrt(1.0 + m11 - m00 - m22) * 2.0
+            obj = cls((m01 + m10) / s, 0.25 * s, (m12 + m21) / s, (m20 - m02) / s)
+        else:
+            s = math.sqrt(1.0 + m22 - m00 - m11) * 2.0
+            obj = cls((m20 + m02) / s, (m12 + m21) / s, 0.25 * s, (m01 - m10) / s)
+
+        return obj.normalize()
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """ Returns the rotation of a transformation matrix as a KQuaternion, the scale is removed first.
+
+        Args:
+            matrix(list, KMatrix4): Matrix 4x4 or 3x3
+
+        Returns:
+            KQuaternion
+        """
+        return cls.from_axes(*KEuler.get_normalized_axes(matrix))
+
+    @classmethod
+    def from_euler(cls, euler):
+        """ Returns a KQuaternion from a KEuler rotation.
+
+        Args:
+            euler(KEuler)
+
+        Returns:
+            KQuaternion
+        """
+        return cls.from_axes(*euler.as_axes())
+
+    @classmethod
+    def from_axis_angle(cls, axis, angle):
+        """ Returns a KQuaternion rotating around an axis.
+
+        Args:
+            axis(list, tuple, KVector3): 3 element sequence
+            angle(float): Angle in degrees.
+
+        Returns:
+            KQuaternion
+        """
+        x, y, z = axis[0], axis[1], axis[2]
+        length = math.sqrt(x * x + y * y + z * z)
+
+        if not length:
+            return cls()
+
+        half = angle * KEuler.DEGREES_TO_RADIAN * 0.5
+        sin = math.sin(half) / length
+        return cls(x * sin, y * sin, z * sin, math.cos(half))
+
+    @classmethod
+    def lerp(cls, a, b, weight):
+        """ Returns the normalized linear interpolation of two quaternions, along the shortest path.
+
+        Args:
+            a(KQuaternion)
+            b(KQuaternion)
+            weight(float)
+
+        Returns:
+            KQuaternion
+        """
+        sign = -1.0 if a.dot(b) < 0.0 else 1.0
+        inverse_weight = 1.0 - weight
+        weight *= sign
+
+        obj = cls(a.x * inverse_weight + b.x * weight,
+                  a.y * inverse_weight + b.y * weight,
+                  a.z * inverse_weight + b.z * weight,
+                  a.w * inverse_weight + b.w * weight)
+        return obj.normalize()
+
+    @classmethod
+    def slerp(cls, a, b, weight):
+        """ Returns the spherical interpolation of two quaternions, along the shortest path.
+
+        Args:
+            a(KQuaternion)
+            b(KQuaternion)
+            weight(float)
+
+        Returns:
+            KQuaternion
+        """
+        return cls(*cls.get_slerp(a, b, weight))
+
+    # Object Methods
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=1.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = float(w)
+
+    def __str__(self):
+        return self.str_formatter((self.x, self.y, self.z, self.w))
+
+    def __repr__(self):
+        return "{}({}, {}, {}, {})".format(self.__class__.__name__, self.x, self.y, self.z, self.w)
+
+    def __getitem__(self, item):
+        return (self.x, self.y, self.z, self.w)[item]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z, self.w))
+
+    def __len__(self):
+        return 4
+
+    def __neg__(self):
+        return self.__class__(-self.x, -self.y, -self.z, -self.w)
+
+    def __mul__(self, other):
+        if not isinstance(other, KQuaternion):
+            raise ArithmeticError("Invalid type.")
+
+        # Hamilton product other (x) self, so self is applied first like with row vector matrices.
+        ax, ay, az, aw = other.x, other.y, other.z, other.w
+        bx, by, bz, bw = self.x, self.y, self.z, self.w
+
+        return self.__class__(aw * bx + ax * bw + ay * bz - az * by,
+                              aw * by - ax * bz + ay * bw + az * bx,
+                              aw * bz + ax * by - ay * bx + az * bw,
+                              aw * bw - ax * bx - ay * by - az * bz)
+
+    def __imul__(self, other):
+        self.x, self.y, self.z, self.w = self * other
+        return self
+
+    def dot(self, other):
+        """ Returns the dot product with another quaternion.
+
+        Args:
+            other(KQuaternion)
+
+        Returns:
+            float
+        """
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+    def length(self):
+        """ Returns the length of the quaternion.
+
+        Returns:
+            float
+        """
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w)
+
+    def normalize(self):
+        """ Normalizes the quaternion in place.
+
+        Returns:
+            KQuaternion: self
+        """
+        length = self.length()
+
+        if length:
+            self.x /= length
+            self.y /= length
+            self.z /= length
+            self.w /= length
+
+        return self
+
+    def normal(self):
+        """ Returns a normalized copy of the quaternion.
+
+        Returns:
+            KQuaternion
+        """
+        return self.__class__(self.x, self.y, self.z, self.w).normalize()
+
+    def conjugate(self):
+        """ Returns the conjugate, the inverse rotation of a unit quaternion.
+
+        Returns:
+            KQuaternion
+        """
+        return self.__class__(-self.x, -self.y, -self.z, self.w)
+
+    def inverse(self):
+        """ Returns the inverse quaternion.
+
+        Returns:
+            KQuaternion
+        """
+        length = self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
+
+        if not length:
+            raise ZeroDivisionError("Quaternion has no length.")
+
+        return self.__class__(-self.x / length, -self.y / length, -self.z / length, self.w / length)
+
+    def as_list(self):
+        return list(self)
+
+    def as_axes(self):
+        """ Returns the three axes, rows of the rotation matrix.
+
+        Returns:
+            tuple: Three 3 element tuples.
+        """
+        x, y, z, w = self.x, self.y, self.z, self.w
+        xx, yy, zz = x * x, y * y, z * z
+        xy, xz, yz = x * y, x * z, y * z
+        wx, wy, wz = w * x, w * y, w * z
+
+        return ((1.0 - 2.0 * (yy + zz), 2.0 * (xy + wz), 2.0 * (xz - wy)),
+                (2.0 * (xy - wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz + wx)),
+                (2.0 * (xz + wy), 2.0 * (yz - wx), 1.0 - 2.0 * (xx + yy)))
+
+    def as_matrix(self):
+        """ Returns the rotation as a KMatrix4.
+
+        Returns:
+            KMatrix4
+        """
+        # Imported here, KMatrix4 depends on this module.
+        from kid.core.kmatrix4 import KMatrix4
+
+        x_axis, y_axis, z_axis = self.as_axes()
+        return KMatrix4.from_xform(x_axis + (0.0,) + y_axis + (0.0,) + z_axis + (0.0, 0.0, 0.0, 0.0, 1.0))
+
+    def as_euler(self, order=0):
+        """ Returns the rotation as a KEuler.
+
+        Args:
+            order(int): Rotation order
+
+        Returns:
+            KEuler
+        """
+        x_axis, y_axis, z_axis = self.as_axes()
+        x, y, z = KEuler.get_rotation_from_axes(x_axis, y_axis, z_axis, order)
+        return KEuler(x, y, z, order)
+
+    def as_mquaternion(self):
+        """ Returns an OpenMaya.MQuaternion object.
+
+        Returns:
+            OpenMaya.MQuaternion
+        """
+        import maya.OpenMaya as OpenMaya
+
+        return OpenMaya.MQuaternion(self.x, self.y, self.z, self.w)
+
+
+if __name__ == '__main__':
+    _a = KQuaternion.from_euler(KEuler(0.0, 0.0, 0.0))
+    _b = KQuaternion.from_euler(KEuler(0.0, 90.0, 0.0))
+    print(KQuaternion.slerp(_a, _b, 0.5).as_euler())
@@ -0,0 +1,232 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kmatrix4array import KMatrix4Array
+
+# Python Modules
+from array import array
+from abc import ABC, abstractmethod
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class KSamplerEvaluator(KObject, ABC):
+    """ Abstract base class of what KMatrixSampler reads the matrices with.
+
+    get_context() is called once per frame and read() once per transform with that context, subclass it to sample
+    something else than Maya, for example a stub in tests.
+    """
+
+    @abstractmethod
+    def get_context(self, frame):
+        """ Returns the context to evaluate a frame in.
+
+        Args:
+            frame(float)
+
+        Returns:
+            object
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, transform, attribute, context, out):
+        """ Writes the 16 values of a matrix attribute evaluated in a context into out.
+
+        Args:
+            transform(KTransform)
+            attribute(str)
+            context(object): Value returned by get_context().
+            out(memoryview): 16 element slice of the result buffer.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+
+class KMayaSamplerEvaluator(KSamplerEvaluator):
+    """ Evaluator reading the KTransform matrix plugs in an OpenMaya.MDGContext, Maya is only imported when used.
+    """
+
+    def get_context(self, frame):
+        import maya.OpenMaya as OpenMaya
+
+        return OpenMaya.MDGContext(OpenMaya.MTime(float(frame), OpenMaya.MTime.uiUnit()))
+
+    def read(self, transform, attribute, context, out):
+        transform.get_matrix_plug(attribute, True, context, out)
+        return
+
+
+class KMatrixSampler(KObject):
+    """ Class that samples a matrix attribute of many transforms over a frame range.
+
+    Every frame is evaluated once, through one DG context, and the matrices of all transforms are read in that
+    context straight into a contiguous buffer, so the timeline never moves.
+
+    The result is frame major: with NumPy a (F, N, 16) float64 array, without NumPy a flat array('d') of
+    F * N * 16 values. sample_stack() returns the same matrices as a KMatrix4Array of F * N matrices.
+
+    Args:
+        transforms(list): list of KTransform
+        attribute(str): Matrix attribute to sample.
+        evaluator(KSamplerEvaluator): KMayaSamplerEvaluator if None.
+    """
+    WORLD_MATRIX = "worldMatrix"
+    PARENT_INVERSE_MATRIX = "parentInverseMatrix"
+
+    HAS_NUMPY = numpy is not None
+
+    # Static Methods
+    @staticmethod
+    def get_frames(start, end, step=1.0):
+        """ Returns the frames from start to end, both included.
+
+        Args:
+            start(int, float)
+            end(int, float)
+            step(int, float)
+
+        Returns:
+            list
+        """
+        if step <= 0.0:
+            raise ValueError("Step must be positive.")
+
+        count = int(round((end - start) / float(step))) + 1
+        return [start + index * step for index in range(max(count, 0))]
+
+    # Object Methods
+    def __init__(self, transforms=None, attribute=WORLD_MATRIX, evaluator=None):
+        self._transforms = list(transforms) if transforms else list()
+        self._attribute = attribute
+        self._evaluator = evaluator if evaluator is not None else KMayaSamplerEvaluator()
+
+    def __str__(self):
+        return self.str_formatter(len(self._transforms), self._attribute)
+
+    def __len__(self):
+        return len(self._transforms)
+
+    def is_valid(self):
+        """ Returns True if there is something to sample.
+
+        Returns:
+            bool
+        """
+        return bool(self._transforms)
+
+    def transforms(self):
+        """ Returns the sampled transforms.
+
+        Returns:
+            list
+        """
+        return self._transforms
+
+    def set_transforms(self, transforms):
+        """ Sets the transforms to sample.
+
+        Args:
+            transforms(list): list of KTransform
+
+        Returns:
+            None
+        """
+        self._transforms = list(transforms)
+        return
+
+    def read_frames(self, frames, out):
+        """ Reads the matrices of every transform at every frame into a buffer.
+
+        Args:
+            frames(list): Frames to evaluate.
+            out(array.array, numpy.ndarray): C contiguous float64 buffer of at least F * N * 16 values.
+
+        Returns:
+            None
+        """
+        view = memoryview(out).cast("B").cast("d")
+
+        if len(view) < len(frames) * len(self._transforms) * 16:
+            raise ValueError("Output buffer is too small.")
+
+        evaluator = self._evaluator
+        attribute = self._attribute
+        offset = 0
+
+        for frame in frames:
+            context = evaluator.get_context(frame)
+
+            for transform in self._transforms:
+                evaluator.read(transform, attribute, context, view[offset:offset + 16])
+                offset += 16
+        return
+
+    def sample_frames(self, frames, out=None):
+        """ Returns the matrices of every transform at every frame.
+
+        Args:
+            frames(list): Frames to evaluate.
+            out(array.array, numpy.ndarray): Optional float64 buffer of at least F * N * 16 values to write into,
+                                             it is returned as is.
+
+        Returns:
+            numpy.ndarray, array.array: (F, N, 16) array with NumPy, otherwise a flat array('d').
+        """
+        if out is not None:
+            self.read_frames(frames, out)
+            return out
+
+        size = len(frames) * len(self._transforms) * 16
+
+        if self.HAS_NUMPY:
+            out = numpy.empty((len(frames), len(self._transforms), 16))
+        else:
+            out = array("d", [0.0]) * size
+
+        self.read_frames(frames, out)
+        return out
+
+    def sample(self, start, end, step=1.0, out=None):
+        """ Returns the matrices of every transform from start to end, see sample_frames().
+
+        Args:
+            start(int, float)
+            end(int, float)
+            step(int, float)
+            out(array.array, numpy.ndarray): Optional float64 buffer of at least F * N * 16 values to write into.
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        return self.sample_frames(self.get_frames(start, end, step), out)
+
+    def sample_stack(self, start, end, step=1.0):
+        """ Returns the matrices of every transform from start to end as a frame major KMatrix4Array.
+
+        Args:
+            start(int, float)
+            end(int, float)
+            step(int, float)
+
+        Returns:
+            KMatrix4Array: F * N matrices, the matrix of transform n at frame f is at f * N + n.
+        """
+        frames = self.get_frames(start, end, step)
+        stack = KMatrix4Array(len(frames) * len(self._transforms))
+        self.read_frames(frames, stack.data())
+        return stack
+
+
+if __name__ == '__main__':
+    from kid.core.ktransform import KTransform
+
+    _sampler = KMatrixSampler([KTransform.from_name("pCube1"), KTransform.from_name("locator1")])
+    print(_sampler.sample(1, 24).shape)
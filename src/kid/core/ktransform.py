@@ -5,6 +5,9 @@ from kid.core.kobject import KObject
 from kid.core.kvector3 import KVector3
 from kid.core.kmatrix4 import KMatrix4
 from kid.core.keuler import KEuler
+from kid.core.kquaternion import KQuaternion
+from kid.core.kdagcache import KDagCache
+from kid.core.kmodifier import KModifier
 
 from kid.core.kanim import KAnim
 
@@ -23,26 +26,202 @@ class KTransform(KObject):
         * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid
         =Maya_SDK_py_ref_class_open_maya_1_1_m_transformation_matrix_html
         * https://medium.com/swlh/understanding-3d-matrix-transforms-with-pixijs-c76da3f8bd8
+
+    Notes:
+        * Names are resolved through DAG_CACHE, a process-wide KDagCache invalidated by Maya rename, delete and
+          scene messages. The cached MDagPath and MFnDependencyNode are shared, don't modify them in place.
+        * The worldMatrix[0], parentInverseMatrix[0] and matrix plugs are looked up once per KTransform and reused,
+          they are reset by set_dag().
+        * set_translations(), set_rotations(), set_scales() and set_xforms() write many transforms through one
+          KModifier, a single undoable step. They set the local channels and ignore pivots, rotate axis and joint
+          orient.
     """
+    WORLD_MATRIX = "worldMatrix"
+    LOCAL_MATRIX = "matrix"
+    PARENT_INVERSE_MATRIX = "parentInverseMatrix"
+    ROTATE_ORDER = "rotateOrder"
+    TRANSLATE = ("translateX", "translateY", "translateZ")
+    ROTATE = ("rotateX", "rotateY", "rotateZ")
+    SCALE = ("scaleX", "scaleY", "scaleZ")
+    SHEAR = ("shearXY", "shearXZ", "shearYZ")
+
+    DAG_CACHE = KDagCache()
 
     # Static Methods
     @staticmethod
-    def get_dag_from_name(name):
-        """ Returns MDagPath from scene node name.
+    def get_context(time=None):
+        """ Returns a MDGContext evaluating at a time, the normal context if time is None.
+
+        Args:
+            time(int, float, OpenMaya.MTime, OpenMaya.MDGContext): Frame in the current time unit.
+
+        Returns:
+            OpenMaya.MDGContext
+        """
+        if time is None:
+            return OpenMaya.MDGContext.fsNormal
+
+        if isinstance(time, OpenMaya.MDGContext):
+            return time
+
+        if not isinstance(time, OpenMaya.MTime):
+            time = OpenMaya.MTime(float(time), OpenMaya.MTime.uiUnit())
+
+        return OpenMaya.MDGContext(time)
+
+    @staticmethod
+    def resolve_dag_from_name(name):
+        """ Returns the MDagPath and MFnDependencyNode of a scene node name, without going through the cache.
 
         Args:
             name(str): String name of the transformation object.
 
         Returns:
-            OpenMaya.MDagPath()
+            tuple: (OpenMaya.MDagPath, OpenMaya.MFnDependencyNode)
         """
         selection = OpenMaya.MSelectionList()
         selection.add(name)
         path = OpenMaya.MDagPath()
         selection.getDagPath(0, path)
-        return path
+        return path, OpenMaya.MFnDependencyNode(path.node())
+
+    @staticmethod
+    def get_dag_from_name(name):
+        """ Returns MDagPath from scene node name.
+
+        Args:
+            name(str): String name of the transformation object.
+
+        Returns:
+            OpenMaya.MDagPath()
+        """
+        return KTransform.DAG_CACHE.get(name, KTransform.resolve_dag_from_name)[0]
+
+    @staticmethod
+    def get_components(values, count, size):
+        """ Returns one size element sequence per transform.
+
+        Args:
+            values(list): One size element sequence per transform, or a flat buffer of count * size values.
+            count(int): Number of transforms.
+            size(int)
+
+        Returns:
+            list
+        """
+        if len(values) == count * size and count and not hasattr(values[0], "__len__"):
+            return [values[index:index + size] for index in range(0, count * size, size)]
+
+        if len(values) != count:
+            raise TypeError("Invalid values length.")
+
+        return values
 
     # Class Methods
+    @classmethod
+    def set_channels(cls, transforms, attributes, values, scale=1.0, modifier=None):
+        """ Sets the same channels of many transforms in one undoable step.
+
+        Args:
+            transforms(list): list of KTransform
+            attributes(tuple): Attribute names, for example KTransform.TRANSLATE.
+            values(list): One sequence of len(attributes) values per transform, or a flat buffer.
+            scale(float): Multiplies every value, to convert degrees to radians for example.
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
+
+        Returns:
+            KModifier
+        """
+        apply = modifier is None
+        modifier = KModifier() if apply else modifier
+        size = len(attributes)
+
+        for transform, components in zip(transforms, cls.get_components(values, len(transforms), size)):
+            modifier.set_doubles([transform.get_channel(attribute) for attribute in attributes],
+                                 [value * scale for value in components] if scale != 1.0 else components)
+
+        if apply:
+            modifier.do_it()
+
+        return modifier
+
+    @classmethod
+    def set_translations(cls, transforms, translations, modifier=None):
+        """ Sets the local translation of many transforms in one undoable step.
+
+        Args:
+            transforms(list): list of KTransform
+            translations(list): One KVector3 or 3 element sequence per transform, or a flat buffer of N * 3 values.
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
+
+        Returns:
+            KModifier
+        """
+        return cls.set_channels(transforms, cls.TRANSLATE, translations, 1.0, modifier)
+
+    @classmethod
+    def set_rotations(cls, transforms, rotations, modifier=None):
+        """ Sets the local euler rotation in degrees of many transforms in one undoable step.
+
+        Args:
+            transforms(list): list of KTransform
+            rotations(list): One KEuler or 3 element sequence per transform, or a flat buffer of N * 3 values.
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
+
+        Returns:
+            KModifier
+        """
+        return cls.set_channels(transforms, cls.ROTATE, rotations, KEuler.DEGREES_TO_RADIAN, modifier)
+
+    @classmethod
+    def set_scales(cls, transforms, scales, modifier=None):
+        """ Sets the local scale of many transforms in one undoable step.
+
+        Args:
+            transforms(list): list of KTransform
+            scales(list): One KVector3 or 3 element sequence per transform, or a flat buffer of N * 3 values.
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
+
+        Returns:
+            KModifier
+        """
+        return cls.set_channels(transforms, cls.SCALE, scales, 1.0, modifier)
+
+    @classmethod
+    def set_xforms(cls, transforms, xforms, modifier=None):
+        """ Sets the local matrix of many transforms in one undoable step.
+
+        The matrices are decomposed in the rotation order of each transform and written to the translate, rotate,
+        scale and shear channels.
+
+        Args:
+            transforms(list): list of KTransform
+            xforms(list): One KMatrix4 or 16 element sequence per transform, or a flat buffer of N * 16 values.
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
+
+        Returns:
+            KModifier
+        """
+        apply = modifier is None
+        modifier = KModifier() if apply else modifier
+        attributes = cls.TRANSLATE + cls.ROTATE + cls.SCALE + cls.SHEAR
+        values = [0.0] * 12
+
+        for transform, xform in zip(transforms, cls.get_components(xforms, len(transforms), 16)):
+            if isinstance(xform, KMatrix4):
+                xform = xform.data()
+
+            KMatrix4.decompose_xform(xform, transform.get_channel(cls.ROTATE_ORDER).asInt(), values)
+            values[3] *= KEuler.DEGREES_TO_RADIAN
+            values[4] *= KEuler.DEGREES_TO_RADIAN
+            values[5] *= KEuler.DEGREES_TO_RADIAN
+            modifier.set_doubles([transform.get_channel(attribute) for attribute in attributes], values)
+
+        if apply:
+            modifier.do_it()
+
+        return modifier
+
     @classmethod
     def from_name(cls, name):
         """ Returns new KTransform object from scene node name.
@@ -55,8 +234,7 @@ class KTransform(KObject):
         """
         obj = cls()
         obj._name = name
-        obj._dag = cls.get_dag_from_name(name)
-        obj._fn = OpenMaya.MFnDependencyNode(obj._dag.node())
+        obj._dag, obj._fn = cls.DAG_CACHE.get(name, cls.resolve_dag_from_name)
         return obj
 
     # Object Methods
@@ -64,6 +242,8 @@ class KTransform(KObject):
         self._name = str()
         self._dag = None
         self._fn = None
+        self._plugs = dict()
+        self._matrix_data = None
 
     def is_valid(self):
         """ Returns True if the KTransform object has valid components.
@@ -84,6 +264,14 @@ class KTransform(KObject):
         """
         return self._name
 
+    def dag(self):
+        """ Returns the current dag path.
+
+        Returns:
+            OpenMaya.MDagPath
+        """
+        return self._dag
+
     def set_dag(self, dag):
         """ Set the current dag path.
 
@@ -94,6 +282,8 @@ class KTransform(KObject):
             None
         """
         self._dag = dag
+        self._fn = OpenMaya.MFnDependencyNode(dag.node()) if dag is not None else None
+        self._plugs = dict()
         return
 
     def transform(self):
@@ -122,33 +312,165 @@ class KTransform(KObject):
 
         return self.transform().transformation()
 
-    def world_matrix(self):
+    def get_plug(self, attribute):
+        """ Returns the first element plug of an array attribute, cached on the KTransform.
+
+        Args:
+            attribute(str): Attribute name, for example "worldMatrix".
+
+        Returns:
+            OpenMaya.MPlug
+        """
+        try:
+            return self._plugs[attribute]
+        except KeyError:
+            pass
+
+        if not self._fn:
+            raise RuntimeError("Can't retrieve plug object.")
+
+        plug = OpenMaya.MPlug(self._dag.node(), self._fn.attribute(attribute)).elementByLogicalIndex(0)
+        self._plugs[attribute] = plug
+        return plug
+
+    def get_channel(self, attribute):
+        """ Returns the plug of a non array attribute, cached on the KTransform.
+
+        Args:
+            attribute(str): Attribute name, for example "translateX".
+
+        Returns:
+            OpenMaya.MPlug
+        """
+        try:
+            return self._plugs[attribute]
+        except KeyError:
+            pass
+
+        if not self._fn:
+            raise RuntimeError("Can't retrieve plug object.")
+
+        plug = self._fn.findPlug(attribute, False)
+        self._plugs[attribute] = plug
+        return plug
+
+    def set_channel_keys(self, attributes, times, values, modifier=None, tangent_in=None, tangent_out=None,
+                         keep_existing=True):
+        """ Keys channels of the transform in bulk, one MFnAnimCurve.addKeys() per channel.
+
+        Args:
+            attributes(tuple): Attribute names, for example KTransform.TRANSLATE.
+            times(list): One sequence of frames per attribute.
+            values(list): One sequence of values per attribute, angles in radians.
+            modifier(KModifier): Queues the keys on this modifier and leaves applying it to the caller.
+            tangent_in(int): OpenMayaAnim.MFnAnimCurve tangent type, kTangentGlobal if None.
+            tangent_out(int): OpenMayaAnim.MFnAnimCurve tangent type, kTangentGlobal if None.
+            keep_existing(bool): Keeps the keys of the channels that aren't replaced, the keys in the range of the
+                new ones are removed if False.
+
+        Returns:
+            KModifier
+        """
+        apply = modifier is None
+        modifier = KModifier() if apply else modifier
+
+        for attribute, channel_times, channel_values in zip(attributes, times, values):
+            modifier.add_keys(self.get_channel(attribute), channel_times, channel_values, tangent_in, tangent_out,
+                              keep_existing)
+
+        if apply:
+            modifier.do_it()
+
+        return modifier
+
+    def get_matrix_plug(self, attribute, raw=False, context=None, out=None):
+        """ Returns the value of a matrix plug.
+
+        Args:
+            attribute(str): Attribute name, for example "worldMatrix".
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            context(OpenMaya.MDGContext): Evaluates the plug in this context, the normal context if None.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
+
+        Returns:
+            KMatrix4, list, array.array
+        """
+        plug = self.get_channel(attribute) if attribute == self.LOCAL_MATRIX else self.get_plug(attribute)
+        mobject = plug.asMObject() if context is None else plug.asMObject(context)
+
+        if self._matrix_data is None:
+            self._matrix_data = OpenMaya.MFnMatrixData(mobject)
+        else:
+            self._matrix_data.setObject(mobject)
+
+        matrix = self._matrix_data.matrix()
+
+        if raw:
+            return KMatrix4.mmatrix_to_xform(matrix, out)
+
+        return KMatrix4.from_mmatrix(matrix)
+
+    def world_matrix(self, raw=False, out=None):
         """ Returns the world matrix as KMatrix.
 
+        Args:
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
+
         Returns:
-            KMatrix
+            KMatrix4, list, array.array
         """
-        attr = self._fn.attribute("worldMatrix")
-        plug = OpenMaya.MPlug(self._dag.node(), attr)
-        plug = plug.elementByLogicalIndex(0)
-        mobject = plug.asMObject()
-        data = OpenMaya.MFnMatrixData(mobject)
+        return self.get_matrix_plug(self.WORLD_MATRIX, raw, None, out)
+
+    def local_matrix(self, raw=False, out=None):
+        """ Returns the local matrix as KMatrix.
+
+        Args:
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
 
-        return KMatrix4.from_mmatrix(data.matrix())
+        Returns:
+            KMatrix4, list, array.array
+        """
+        return self.get_matrix_plug(self.LOCAL_MATRIX, raw, None, out)
 
-    def parent_inverse_matrix(self):
+    def parent_inverse_matrix(self, raw=False, out=None):
         """ Returns the parent inverse matrix as KMatrix.
 
+        Args:
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
+
         Returns:
-            KMatrix
+            KMatrix4, list, array.array
         """
-        attr = self._fn.attribute("parentInverseMatrix")
-        plug = OpenMaya.MPlug(self._dag.node(), attr)
-        plug = plug.elementByLogicalIndex(0)
-        mobject = plug.asMObject()
-        data = OpenMaya.MFnMatrixData(mobject)
+        return self.get_matrix_plug(self.PARENT_INVERSE_MATRIX, raw, None, out)
 
-        return KMatrix4.from_mmatrix(data.matrix())
+    def world_matrix_at(self, time, raw=False, out=None):
+        """ Returns the world matrix evaluated at a time without moving the timeline.
+
+        Args:
+            time(int, float, OpenMaya.MTime, OpenMaya.MDGContext): Frame in the current time unit.
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
+
+        Returns:
+            KMatrix4, list, array.array
+        """
+        return self.get_matrix_plug(self.WORLD_MATRIX, raw, self.get_context(time), out)
+
+    def parent_inverse_matrix_at(self, time, raw=False, out=None):
+        """ Returns the parent inverse matrix evaluated at a time without moving the timeline.
+
+        Args:
+            time(int, float, OpenMaya.MTime, OpenMaya.MDGContext): Frame in the current time unit.
+            raw(bool): Returns a flat 16 element buffer instead of a KMatrix4.
+            out(list, array.array): Optional 16 element buffer written by raw mode.
+
+        Returns:
+            KMatrix4, list, array.array
+        """
+        return self.get_matrix_plug(self.PARENT_INVERSE_MATRIX, raw, self.get_context(time), out)
 
     def translation(self, space=OpenMaya.MSpace.kWorld):
         """ Returns the transformation's rotation component as a vector.
@@ -198,7 +520,7 @@ class KTransform(KObject):
         """ Sets the transformation's rotation component in world space.
 
         Args:
-            rotation(KVector3, KEuler, OpenMaya.MEulerRotation, OpenMaya.MQuaternion list, tuple)
+            rotation(KVector3, KEuler, KQuaternion, OpenMaya.MEulerRotation, OpenMaya.MQuaternion list, tuple)
             order(int)
 
         Returns:
@@ -210,6 +532,9 @@ class KTransform(KObject):
         elif isinstance(rotation, OpenMaya.MQuaternion):
             self.transform().setRotation(rotation, OpenMaya.MSpace.kWorld)
 
+        elif isinstance(rotation, KQuaternion):
+            self.transform().setRotation(rotation.as_mquaternion(), OpenMaya.MSpace.kWorld)
+
         elif isinstance(rotation, KVector3):
             self.transform().setRotation(OpenMaya.MEulerRotation(rotation.x / KEuler.RADIAN_TO_DEGREES,
                                                                  rotation.y / KEuler.RADIAN_TO_DEGREES,
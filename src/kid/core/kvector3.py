@@ -6,148 +6,333 @@ from kid.core.kobject import KObject
 # Python Modules
 import math
 
-# Maya Modules
-import maya.OpenMaya as OpenMaya
-
 
 class KVector3(KObject):
-    def __init__(self, x=0.0, y=0.0, z=0.0):
-        self._x = float(x)
-        self._y = float(y)
-        self._z = float(z)
+    """ Class that handles managing and manipulating 3D vectors.
 
-    @property
-    def x(self):
-        return self._x
+    Notes:
+        * x, y and z are plain slots, reading or writing them doesn't go through a property.
+        * Operators accept a KVector3, a scalar, a 3 element list/tuple or any object with x, y and z attributes
+          such as OpenMaya.MVector. Maya is only imported by as_mvector().
 
-    @x.setter
-    def x(self, value):
-        self._x = float(value)
-        return
+    Args:
+        x(float)
+        y(float)
+        z(float)
+    """
+    __slots__ = ("x", "y", "z")
 
-    @property
-    def y(self):
-        return self._y
+    # Static Methods
+    @staticmethod
+    def get_components(value):
+        """ Returns the x, y, z values of any value the operators accept.
 
-    @y.setter
-    def y(self, value):
-        self._y = float(value)
-        return
+        Args:
+            value(KVector3, int, float, list, tuple, OpenMaya.MVector)
 
-    @property
-    def z(self):
-        return self._z
+        Returns:
+            tuple
+        """
+        if isinstance(value, KVector3):
+            return value.x, value.y, value.z
 
-    @z.setter
-    def z(self, value):
-        self._z = float(value)
-        return
+        elif isinstance(value, (float, int)):
+            value = float(value)
+            return value, value, value
+
+        elif isinstance(value, (tuple, list)):
+            if len(value) != 3:
+                raise ArithmeticError("Invalid type.")
+
+            return value[0], value[1], value[2]
+
+        elif hasattr(value, "x") and hasattr(value, "y") and hasattr(value, "z"):
+            return value.x, value.y, value.z
+
+        raise ArithmeticError("Invalid type.")
+
+    # Class Methods
+    @classmethod
+    def from_iter(cls, value):
+        """ Returns a KVector3 from a 3 element sequence.
+
+        Args:
+            value(list, tuple)
+
+        Returns:
+            KVector3
+        """
+        if len(value) != 3:
+            raise TypeError("Invalid type.")
+
+        return cls(value[0], value[1], value[2])
+
+    @classmethod
+    def lerp(cls, a, b, weight):
+        """ Returns the linear interpolation between two vectors.
+
+        Args:
+            a(KVector3)
+            b(KVector3)
+            weight(float)
+
+        Returns:
+            KVector3
+        """
+        return cls(a.x + (b.x - a.x) * weight, a.y + (b.y - a.y) * weight, a.z + (b.z - a.z) * weight)
+
+    # Object Methods
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
 
     def __str__(self):
         return self.str_formatter((self.x, self.y, self.z))
 
     def __repr__(self):
-        return self.x, self.y, self.z
+        return "{}({}, {}, {})".format(self.__class__.__name__, self.x, self.y, self.z)
+
+    def __len__(self):
+        return 3
 
     def __getitem__(self, item):
-        result = [self.x, self.y, self.z]
-        return result[item]
+        if item == 0 or item == -3:
+            return self.x
+        elif item == 1 or item == -2:
+            return self.y
+        elif item == 2 or item == -1:
+            return self.z
+        elif isinstance(item, slice):
+            return [self.x, self.y, self.z][item]
+
+        raise IndexError("Vector index out of range.")
+
+    def __setitem__(self, item, value):
+        if item == 0 or item == -3:
+            self.x = float(value)
+        elif item == 1 or item == -2:
+            self.y = float(value)
+        elif item == 2 or item == -1:
+            self.z = float(value)
+        else:
+            raise IndexError("Vector index out of range.")
+        return
 
-    def __add__(self, other):
-        if isinstance(other, float):
-            return KVector3(self.x + other, self.y + other, self.z + other)
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
 
-        elif isinstance(other, int):
-            other = float(other)
-            return KVector3(self.x + other, self.y + other, self.z + other)
+    def __neg__(self):
+        return KVector3(-self.x, -self.y, -self.z)
 
-        elif isinstance(other, (tuple, list)):
-            if len(other) != 3:
-                raise ArithmeticError("Invalid type.")
+    def __add__(self, other):
+        if other.__class__ is KVector3:
+            return KVector3(self.x + other.x, self.y + other.y, self.z + other.z)
 
-            return KVector3(self.x + other[0], self.y + other[1], self.z + other[2])
+        try:
+            x, y, z = self.get_components(other)
+        except ArithmeticError:
+            return NotImplemented
 
-        elif isinstance(other, (KVector3, OpenMaya.MMatrix)):
-            return KVector3(self.x + other.x, self.y + other.y, self.z + other.z)
+        return KVector3(self.x + x, self.y + y, self.z + z)
 
-        raise ArithmeticError("Invalid type.")
-    
-    def __sub__(self, other):
-        if isinstance(other, float):
-            return KVector3(self.x - other, self.y - other, self.z - other)
+    __radd__ = __add__
 
-        elif isinstance(other, int):
-            other = float(other)
-            return KVector3(self.x - other, self.y - other, self.z - other)
+    def __sub__(self, other):
+        if other.__class__ is KVector3:
+            return KVector3(self.x - other.x, self.y - other.y, self.z - other.z)
 
-        elif isinstance(other, (tuple, list)):
-            if len(other) != 3:
-                raise ArithmeticError("Invalid type.")
+        try:
+            x, y, z = self.get_components(other)
+        except ArithmeticError:
+            return NotImplemented
 
-            return KVector3(self.x - other[0], self.y - other[1], self.z - other[2])
+        return KVector3(self.x - x, self.y - y, self.z - z)
 
-        elif isinstance(other, (KVector3, OpenMaya.MMatrix)):
-            return KVector3(self.x - other.x, self.y - other.y, self.z - other.z)
+    def __rsub__(self, other):
+        x, y, z = self.get_components(other)
+        return KVector3(x - self.x, y - self.y, z - self.z)
 
-        raise ArithmeticError("Invalid type.")
-    
     def __mul__(self, other):
-        if isinstance(other, float):
+        if other.__class__ is float:
             return KVector3(self.x * other, self.y * other, self.z * other)
 
-        elif isinstance(other, int):
-            other = float(other)
-            return KVector3(self.x * other, self.y * other, self.z * other)
+        try:
+            x, y, z = self.get_components(other)
+        except ArithmeticError:
+            return NotImplemented
+
+        return KVector3(self.x * x, self.y * y, self.z * z)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        x, y, z = self.get_components(other)
+        return KVector3(self.x / x, self.y / y, self.z / z)
+
+    __div__ = __truediv__
+
+    def __iadd__(self, other):
+        if other.__class__ is KVector3:
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+            return self
+
+        x, y, z = self.get_components(other)
+        self.x += x
+        self.y += y
+        self.z += z
+        return self
+
+    def __isub__(self, other):
+        if other.__class__ is KVector3:
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+            return self
+
+        x, y, z = self.get_components(other)
+        self.x -= x
+        self.y -= y
+        self.z -= z
+        return self
+
+    def __imul__(self, other):
+        x, y, z = self.get_components(other)
+        self.x *= x
+        self.y *= y
+        self.z *= z
+        return self
+
+    def __itruediv__(self, other):
+        x, y, z = self.get_components(other)
+        self.x /= x
+        self.y /= y
+        self.z /= z
+        return self
+
+    __idiv__ = __itruediv__
+
+    def set(self, x, y, z):
+        """ Set the x, y and z values.
+
+        Args:
+            x(float)
+            y(float)
+            z(float)
 
-        elif isinstance(other, (tuple, list)):
-            if len(other) != 3:
-                raise ArithmeticError("Invalid type.")
+        Returns:
+            None
+        """
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        return
 
-            return KVector3(self.x * other[0], self.y * other[1], self.z * other[2])
+    def copy(self):
+        """ Returns a copy of the vector.
 
-        elif isinstance(other, (KVector3, OpenMaya.MMatrix)):
-            return KVector3(self.x * other.x, self.y * other.y, self.z * other.z)
+        Returns:
+            KVector3
+        """
+        return KVector3(self.x, self.y, self.z)
 
-        raise ArithmeticError("Invalid type.")
-    
-    def __div__(self, other):
-        if isinstance(other, float):
-            return KVector3(self.x / other, self.y / other, self.z / other)
+    def length(self):
+        """ Returns the length of the Vector.
+
+        Returns:
+            float
+        """
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
-        elif isinstance(other, int):
-            other = float(other)
-            return KVector3(self.x / other, self.y / other, self.z / other)
+    def length_squared(self):
+        """ Returns the squared length of the Vector, cheaper than length() for comparisons.
 
-        elif isinstance(other, (tuple, list)):
-            if len(other) != 3:
-                raise ArithmeticError("Invalid type.")
+        Returns:
+            float
+        """
+        return self.x * self.x + self.y * self.y + self.z * self.z
 
-            return KVector3(self.x / other[0], self.y / other[1], self.z / other[2])
+    def dot(self, other):
+        """ Returns the dot product with another vector.
 
-        elif isinstance(other, (KVector3, OpenMaya.MMatrix)):
-            return KVector3(self.x / other.x, self.y / other.y, self.z / other.z)
+        Args:
+            other(KVector3, list, tuple)
 
-        raise ArithmeticError("Invalid type.")
+        Returns:
+            float
+        """
+        x, y, z = self.get_components(other)
+        return self.x * x + self.y * y + self.z * z
 
-    def __iter__(self):
-        return iter((self.x, self.y, self.z))
+    def cross(self, other):
+        """ Returns the cross product with another vector.
 
-    def length(self):
-        """ Returns the length of the Vector.
+        Args:
+            other(KVector3, list, tuple)
+
+        Returns:
+            KVector3
+        """
+        x, y, z = self.get_components(other)
+        return KVector3(self.y * z - self.z * y, self.z * x - self.x * z, self.x * y - self.y * x)
+
+    def distance(self, other):
+        """ Returns the distance to another point.
+
+        Args:
+            other(KVector3, list, tuple)
 
         Returns:
             float
         """
-        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        x, y, z = self.get_components(other)
+        x -= self.x
+        y -= self.y
+        z -= self.z
+        return math.sqrt(x * x + y * y + z * z)
 
     def normal(self):
-        raise NotImplementedError
+        """ Returns a normalized copy of the vector.
+
+        Returns:
+            KVector3
+        """
+        return self.copy().normalize()
 
     def normalize(self):
-        raise NotImplementedError
+        """ Normalizes the vector in place, a zero vector is left unchanged.
+
+        Returns:
+            KVector3: self
+        """
+        length = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+        if length:
+            self.x /= length
+            self.y /= length
+            self.z /= length
+
+        return self
+
+    def angle(self, other):
+        """ Returns the angle in degrees between this vector and another one.
 
-    def angle(self):
-        raise NotImplementedError
+        Args:
+            other(KVector3, list, tuple)
+
+        Returns:
+            float
+        """
+        x, y, z = self.get_components(other)
+        length = self.length() * math.sqrt(x * x + y * y + z * z)
+
+        if not length:
+            return 0.0
+
+        cosine = (self.x * x + self.y * y + self.z * z) / length
+        return math.degrees(math.acos(max(-1.0, min(1.0, cosine))))
 
     def as_list(self):
         """ Returns a list of float xyz values.
@@ -155,7 +340,15 @@ class KVector3(KObject):
         Returns:
             list
         """
-        return list(self)
+        return [self.x, self.y, self.z]
+
+    def as_tuple(self):
+        """ Returns a tuple of float xyz values.
+
+        Returns:
+            tuple
+        """
+        return self.x, self.y, self.z
 
     def as_mvector(self):
         """ Returns an OpenMaya.MVector object.
@@ -163,6 +356,8 @@ class KVector3(KObject):
         Returns:
             OpenMaya.MVector
         """
+        import maya.OpenMaya as OpenMaya
+
         return OpenMaya.MVector(self.x, self.y, self.z)
 
 
@@ -0,0 +1,364 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core.kobject import KObject
+from kid.core.kvector3 import KVector3
+
+# Python Modules
+from array import array
+from itertools import cycle, repeat
+import math
+import operator
+
+# Third Party Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class KVector3Array(KObject):
+    """ Class that handles bulk math on N 3D vectors, for example a translation per frame or many pivot offsets.
+
+    With NumPy the vectors are a (N, 3) float64 array. Without NumPy they are a flat array('d') of N * 3 values
+    and the operations run through map() over the flat buffers.
+
+    Operators accept another KVector3Array of the same size, a KVector3 or a 3 element sequence (broadcast to
+    every vector) or a scalar.
+
+    Args:
+        count(int): Number of zero vectors to start with.
+    """
+    __slots__ = ("_data", "_count")
+
+    HAS_NUMPY = numpy is not None
+
+    # Class Methods
+    @classmethod
+    def from_values(cls, values):
+        """ Returns a new KVector3Array from a flat buffer of N * 3 values.
+
+        Args:
+            values(list, tuple, array.array, numpy.ndarray)
+
+        Returns:
+            KVector3Array
+        """
+        if len(values) % 3:
+            raise TypeError("Invalid values length.")
+
+        obj = cls()
+        obj._count = len(values) // 3
+
+        if cls.HAS_NUMPY:
+            obj._data = numpy.array(values, dtype=numpy.float64).reshape(obj._count, 3)
+        else:
+            obj._data = array("d", values)
+
+        return obj
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """ Returns a new KVector3Array from a list of KVector3 or 3 element sequences.
+
+        Args:
+            vectors(list)
+
+        Returns:
+            KVector3Array
+        """
+        return cls.from_values([value for vector in vectors for value in vector])
+
+    @classmethod
+    def lerp(cls, a, b, weight):
+        """ Returns the linear interpolation between two arrays of vectors.
+
+        Args:
+            a(KVector3Array)
+            b(KVector3Array)
+            weight(float)
+
+        Returns:
+            KVector3Array
+        """
+        return a + (b - a) * weight
+
+    # Object Methods
+    def __init__(self, count=0):
+        self._count = count
+
+        if self.HAS_NUMPY:
+            self._data = numpy.zeros((count, 3))
+        else:
+            self._data = array("d", [0.0]) * (count * 3)
+
+    def __str__(self):
+        return self.str_formatter(len(self), numpy=self.HAS_NUMPY)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, item):
+        if item < 0:
+            item += self._count
+
+        if not 0 <= item < self._count:
+            raise IndexError("Vector index out of range.")
+
+        if self.HAS_NUMPY:
+            x, y, z = self._data[item]
+        else:
+            x, y, z = self._data[item * 3:item * 3 + 3]
+
+        return KVector3(x, y, z)
+
+    def __setitem__(self, item, value):
+        if item < 0:
+            item += self._count
+
+        if not 0 <= item < self._count:
+            raise IndexError("Vector index out of range.")
+
+        x, y, z = KVector3.get_components(value)
+
+        if self.HAS_NUMPY:
+            self._data[item] = (x, y, z)
+        else:
+            self._data[item * 3:item * 3 + 3] = array("d", (x, y, z))
+        return
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def _new(self, data):
+        obj = self.__class__()
+        obj._data = data
+        obj._count = len(data) if self.HAS_NUMPY else len(data) // 3
+        return obj
+
+    def _operand(self, other):
+        """ Returns other as storage that lines up with this array.
+
+        Args:
+            other(KVector3Array, KVector3, list, tuple, int, float)
+
+        Returns:
+            numpy.ndarray, array.array, float
+        """
+        if isinstance(other, KVector3Array):
+            if len(other) != self._count:
+                raise ArithmeticError("Vector arrays are NOT the same size.")
+            return other._data
+
+        if isinstance(other, (int, float)):
+            return float(other) if self.HAS_NUMPY else array("d", [float(other)]) * (self._count * 3)
+
+        x, y, z = KVector3.get_components(other)
+
+        if self.HAS_NUMPY:
+            return numpy.array((x, y, z))
+
+        return array("d", (x, y, z)) * self._count
+
+    def _values(self, other):
+        """ Returns other as values to map() over the flat storage, without NumPy. Scalars and single vectors are
+        repeated instead of copied N times.
+
+        Args:
+            other(KVector3Array, KVector3, list, tuple, int, float)
+
+        Returns:
+            iterable
+        """
+        if isinstance(other, KVector3Array):
+            return self._operand(other)
+
+        if isinstance(other, (int, float)):
+            return repeat(float(other))
+
+        return cycle(KVector3.get_components(other))
+
+    def _apply(self, function, other, reflected=False):
+        if self.HAS_NUMPY:
+            a, b = self._data, self._operand(other)
+            return self._new(function(b, a) if reflected else function(a, b))
+
+        a, b = self._data, self._values(other)
+        return self._new(array("d", map(function, b, a) if reflected else map(function, a, b)))
+
+    def _apply_in_place(self, function, other):
+        if self.HAS_NUMPY:
+            function(self._data, self._operand(other), out=self._data)
+        else:
+            # Written into the same buffer, views of data() see the result.
+            self._data[:] = array("d", map(function, self._data, self._values(other)))
+
+        return self
+
+    def __add__(self, other):
+        return self._apply(operator.add, other)
+
+    def __sub__(self, other):
+        return self._apply(operator.sub, other)
+
+    def __mul__(self, other):
+        return self._apply(operator.mul, other)
+
+    def __truediv__(self, other):
+        return self._apply(operator.truediv, other)
+
+    def __rsub__(self, other):
+        return self._apply(operator.sub, other, True)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __iadd__(self, other):
+        return self._apply_in_place(numpy.add if self.HAS_NUMPY else operator.add, other)
+
+    def __isub__(self, other):
+        return self._apply_in_place(numpy.subtract if self.HAS_NUMPY else operator.sub, other)
+
+    def __imul__(self, other):
+        return self._apply_in_place(numpy.multiply if self.HAS_NUMPY else operator.mul, other)
+
+    def __itruediv__(self, other):
+        return self._apply_in_place(numpy.true_divide if self.HAS_NUMPY else operator.truediv, other)
+
+    __idiv__ = __itruediv__
+
+    def count(self):
+        """ Returns the number of vectors.
+
+        Returns:
+            int
+        """
+        return self._count
+
+    def data(self):
+        """ Returns the storage, a (N, 3) numpy.ndarray or a flat array('d').
+
+        Returns:
+            numpy.ndarray, array.array
+        """
+        return self._data
+
+    def dot(self, other):
+        """ Returns the dot product of every vector with other.
+
+        Args:
+            other(KVector3Array, KVector3, list, tuple)
+
+        Returns:
+            numpy.ndarray, array.array: N values
+        """
+        if self.HAS_NUMPY:
+            return numpy.sum(self._data * self._operand(other), axis=1)
+
+        products = list(map(operator.mul, self._data, self._operand(other)))
+        return array("d", map(sum, zip(products[0::3], products[1::3], products[2::3])))
+
+    def cross(self, other):
+        """ Returns the cross product of every vector with other.
+
+        Args:
+            other(KVector3Array, KVector3, list, tuple)
+
+        Returns:
+            KVector3Array
+        """
+        if self.HAS_NUMPY:
+            return self._new(numpy.cross(self._data, numpy.broadcast_to(self._operand(other), self._data.shape)))
+
+        a = self._data
+        b = self._operand(other)
+        result = array("d", [0.0]) * len(a)
+
+        for index in range(0, len(a), 3):
+            ax, ay, az = a[index], a[index + 1], a[index + 2]
+            bx, by, bz = b[index], b[index + 1], b[index + 2]
+            result[index] = ay * bz - az * by
+            result[index + 1] = az * bx - ax * bz
+            result[index + 2] = ax * by - ay * bx
+
+        return self._new(result)
+
+    def lengths(self):
+        """ Returns the length of every vector.
+
+        Returns:
+            numpy.ndarray, array.array: N values
+        """
+        if self.HAS_NUMPY:
+            return numpy.linalg.norm(self._data, axis=1)
+
+        return array("d", map(math.sqrt, self.dot(self)))
+
+    def normalize(self):
+        """ Normalizes every vector in place, zero vectors are left unchanged.
+
+        Returns:
+            KVector3Array: self
+        """
+        lengths = self.lengths()
+
+        if self.HAS_NUMPY:
+            lengths[lengths == 0.0] = 1.0
+            self._data /= lengths[:, numpy.newaxis]
+            return self
+
+        data = self._data
+
+        for index, length in enumerate(lengths):
+            if length:
+                offset = index * 3
+                data[offset] /= length
+                data[offset + 1] /= length
+                data[offset + 2] /= length
+
+        return self
+
+    def as_vectors(self):
+        """ Returns the vectors as a list of KVector3.
+
+        Returns:
+            list
+        """
+        return [self[index] for index in range(self._count)]
+
+    def as_values(self):
+        """ Returns the vectors as a flat array('d') of N * 3 values.
+
+        Returns:
+            array.array
+        """
+        if self.HAS_NUMPY:
+            result = array("d")
+            result.frombytes(numpy.ascontiguousarray(self._data).tobytes())
+            return result
+
+        return array("d", self._data)
+
+    def as_numpy(self):
+        """ Returns the vectors as a (N, 3) float64 array.
+
+        Returns:
+            numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError("NumPy is not available.")
+
+        if self.HAS_NUMPY:
+            return self._data
+
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(self._count, 3)
+
+
+if __name__ == '__main__':
+    _array = KVector3Array.from_vectors([(1.0, 0.0, 0.0), (0.0, 2.0, 0.0)])
+    print((_array + KVector3(1.0, 1.0, 1.0)).as_vectors())
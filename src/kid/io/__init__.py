@@ -1,4 +1,4 @@
 # :coding: utf-8
 from kid.io.kio import KIO
 from kid.io.kjson import Kjson
-
+from kid.io.kclip import Kclip, KClipCurves
@@ -0,0 +1,327 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core import KObject, KAnimCurve
+from kid.io.kio import KIO
+
+# Python Modules
+from array import array
+from collections.abc import Mapping
+import json
+import mmap
+import struct
+import sys
+
+
+class KClipCurves(Mapping, KObject):
+    """ Read only mapping of target names to KAnimCurve, loading every curve from a memory map the first time it
+    is accessed.
+
+    The file stays mapped until close(), use it in a with block to release it, on Windows a mapped file can't be
+    overwritten. Closing only releases the map, the curves loaded so far stay usable and the other ones raise
+    ValueError, call load_all() first to keep them all.
+
+    Args:
+        buffer(mmap.mmap, bytes): Whole clip file.
+        targets(list): Target name of every curve.
+        entries(list): Curve index entry of every curve, see Kclip.CURVE.
+    """
+
+    # Object Methods
+    def __init__(self, buffer, targets, entries):
+        self._buffer = buffer
+        self._targets = targets
+        self._entries = dict(zip(targets, entries))
+        self._curves = dict()
+
+    def __str__(self):
+        return self.str_formatter(len(self), loaded=len(self._curves))
+
+    def __len__(self):
+        return len(self._targets)
+
+    def __iter__(self):
+        return iter(self._targets)
+
+    def __getitem__(self, target):
+        curve = self._curves.get(target)
+
+        if curve is None:
+            entry = self._entries[target]
+
+            if self._buffer is None:
+                raise ValueError("""Clip file is closed, "{}" wasn't loaded.""".format(target))
+
+            curve = Kclip.read_curve(self._buffer, entry)
+            self._curves[target] = curve
+
+        return curve
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def is_valid(self):
+        return self._buffer is not None
+
+    def loaded(self):
+        """ Returns the number of curves loaded so far.
+
+        Returns:
+            int
+        """
+        return len(self._curves)
+
+    def load_all(self):
+        """ Loads the curves that weren't loaded yet, so they stay usable after close().
+
+        Returns:
+            None
+        """
+        for target in self._targets:
+            self[target]
+        return
+
+    def close(self):
+        """ Releases the memory map, called when leaving a with block.
+
+        Returns:
+            None
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+        self._buffer = None
+        return
+
+
+class Kclip(KIO):
+    """ Class that handles reading and writing animation clips to versioned binary .kclip files.
+
+    The data is a dict of target name, node.attribute, to KAnimCurve, as returned by KCurveExtractor.extract().
+    Reading memory maps the file and only parses the header, the string table and the curve index. The columns
+    of a curve are read the first time it is accessed, see KClipCurves.
+
+    Layout, little endian:
+        * Header: HEADER struct, then the JSON encoded root of head_size bytes.
+        * String table: string_count + 1 uint32 offsets into the utf-8 blob that follows them, node and attribute
+          names are stored once.
+        * Curve index: one CURVE struct per curve.
+        * Data: the KAnimCurve.COLUMNS of every curve, float64 then int8 arrays, padded to 8 bytes.
+    """
+    BINARY = True
+
+    MAGIC = b"KCLP"
+    VERSION = 1
+
+    # magic, version, flags, curve count, string count, head size, string offset, index offset, data offset
+    HEADER = struct.Struct("<4sHHIIIQQQ")
+
+    # node string, attribute string, key count, fps, weighted, pre infinity, post infinity, data offset
+    CURVE = struct.Struct("<IIIdBBBxQ")
+
+    # Static Methods
+    @staticmethod
+    def get_column_size(code, count):
+        """ Returns the size in bytes of a column.
+
+        Args:
+            code(str): array type code.
+            count(int): Number of keys.
+
+        Returns:
+            int
+        """
+        return array(code).itemsize * count
+
+    @staticmethod
+    def pad(size, alignment=8):
+        """ Returns size rounded up to alignment.
+
+        Args:
+            size(int)
+            alignment(int)
+
+        Returns:
+            int
+        """
+        return (size + alignment - 1) // alignment * alignment
+
+    @staticmethod
+    def read_curve(buffer, entry):
+        """ Returns a KAnimCurve from its curve index entry.
+
+        Args:
+            buffer(mmap.mmap, bytes): Whole clip file.
+            entry(tuple): CURVE struct values.
+
+        Returns:
+            KAnimCurve
+        """
+        _, _, count, fps, weighted, pre, post, offset = entry
+        columns = dict()
+
+        # The columns are copied once, from the map into arrays the curve owns.
+        with memoryview(buffer) as view:
+            for name, code, _ in KAnimCurve.COLUMNS:
+                column = array(code)
+                size = Kclip.get_column_size(code, count)
+                column.frombytes(view[offset:offset + size])
+
+                if sys.byteorder == "big":
+                    column.byteswap()
+
+                columns[name] = column
+                offset += size
+
+        return KAnimCurve.from_columns(columns, fps, bool(weighted), pre, post)
+
+    # Object Methods
+    def extension(self):
+        return ".kclip"
+
+    def write_handler(self, *args, **kwargs):
+        curves = self.data or dict()
+        strings = list()
+        string_ids = dict()
+
+        def get_string(value):
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+
+            return string_ids[value]
+
+        names = list()
+
+        for target in curves:
+            node, _, attribute = target.partition(".")
+            names.append((get_string(node), get_string(attribute)))
+
+        head = json.dumps(self.root.as_dict(), separators=(",", ":")).encode("utf-8")
+        blobs = [value.encode("utf-8") for value in strings]
+        offsets = array("I", [0])
+
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+
+        string_offset = self.pad(self.HEADER.size + len(head))
+        index_offset = self.pad(string_offset + offsets.itemsize * len(offsets) + offsets[-1])
+        data_offset = self.pad(index_offset + self.CURVE.size * len(curves))
+
+        entries = list()
+        offset = data_offset
+
+        for (node, attribute), curve in zip(names, curves.values()):
+            entries.append((node, attribute, len(curve), curve.fps(), curve.is_weighted(), curve.pre_infinity(),
+                            curve.post_infinity(), offset))
+            offset += self.pad(sum(self.get_column_size(code, len(curve)) for _, code, _ in KAnimCurve.COLUMNS))
+
+        stream = self.file()
+        stream.write(self.HEADER.pack(self.MAGIC, self.VERSION, 0, len(curves), len(strings), len(head),
+                                      string_offset, index_offset, data_offset))
+        stream.write(head)
+        self._write_padding(stream, string_offset)
+        self._write_array(stream, offsets)
+        stream.write(b"".join(blobs))
+        self._write_padding(stream, index_offset)
+
+        for entry in entries:
+            stream.write(self.CURVE.pack(*entry))
+
+        for entry, curve in zip(entries, curves.values()):
+            self._write_padding(stream, entry[-1])
+
+            for column in (curve.columns()[name] for name, _, _ in KAnimCurve.COLUMNS):
+                self._write_array(stream, column)
+
+        self._write_padding(stream, offset)
+        return
+
+    def _write_array(self, stream, values):
+        """ Writes an array in little endian.
+        """
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+
+        stream.write(values.tobytes())
+        return
+
+    def _write_padding(self, stream, offset):
+        """ Writes zeros up to offset.
+        """
+        stream.write(b"\0" * (offset - stream.tell()))
+        return
+
+    def read_handler(self, *args, **kwargs):
+        stream = self.file()
+        stream.seek(0, 2)
+        size = stream.tell()
+
+        if not size:
+            raise ValueError("Empty clip file.")
+
+        if size < self.HEADER.size:
+            raise ValueError("Not a clip file.")
+
+        buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # The map is only kept by the KClipCurves of a valid file.
+        try:
+            self.data = self._read_buffer(buffer)
+        except struct.error:
+            buffer.close()
+            raise ValueError("Truncated clip file.")
+        except Exception:
+            buffer.close()
+            raise
+
+        return
+
+    def _read_buffer(self, buffer):
+        """ Returns the KClipCurves of a mapped file, after reading its header, string table and curve index.
+        """
+        magic, version, _, curve_count, string_count, head_size, string_offset, index_offset, _ = \
+            self.HEADER.unpack_from(buffer, 0)
+
+        if magic != self.MAGIC:
+            raise ValueError("Not a clip file.")
+
+        if version > self.VERSION:
+            raise ValueError("Unsupported clip version {}, {} is the latest.".format(version, self.VERSION))
+
+        head = json.loads(bytes(buffer[self.HEADER.size:self.HEADER.size + head_size]).decode("utf-8"))
+
+        for key in head:
+            if hasattr(self.root, key):
+                setattr(self.root, key, head[key])
+
+        offsets = array("I")
+        offsets.frombytes(buffer[string_offset:string_offset + offsets.itemsize * (string_count + 1)])
+
+        if sys.byteorder == "big":
+            offsets.byteswap()
+
+        blob = string_offset + offsets.itemsize * len(offsets)
+        strings = [bytes(buffer[blob + start:blob + end]).decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+        entries = [self.CURVE.unpack_from(buffer, index_offset + index * self.CURVE.size)
+                   for index in range(curve_count)]
+        targets = ["{}.{}".format(strings[entry[0]], strings[entry[1]]) if strings[entry[1]] else strings[entry[0]]
+                   for entry in entries]
+        return KClipCurves(buffer, targets, entries)
+
+
+if __name__ == '__main__':
+    from kid.core import kglobals, KPath
+
+    _path = KPath(kglobals.DATA_PATH) + "test.kclip"
+    Kclip.write(_path, {"pCube1.translateX": KAnimCurve.from_keys([1.0, 10.0], [0.0, 5.0])})
+    _clip = Kclip.read(_path)
+
+    with _clip.data as _curves:
+        print(_clip.root, _curves["pCube1.translateX"])
@@ -37,6 +37,9 @@ class KIO(ABC):
     MODE_DEBUG = "d"
     MODES = [MODE_READ, MODE_WRITE, MODE_DEBUG]
 
+    # Opens the file in binary mode.
+    BINARY = False
+
     @classmethod
     def read(cls, filepath):
         """ Returns data read from a file path.
@@ -103,11 +106,13 @@ class KIO(ABC):
         raise NotImplementedError
 
     def __enter__(self):
+        suffix = "b" if self.BINARY else str()
+
         if self._mode == KIO.MODE_READ:
-            self._file = open(self._filepath.as_str(), KIO.MODE_READ)
+            self._file = open(self._filepath.as_str(), KIO.MODE_READ + suffix)
             self.read_handler()
         elif self._mode == KIO.MODE_WRITE:
-            self._file = open(self._filepath.as_str(), KIO.MODE_WRITE)
+            self._file = open(self._filepath.as_str(), KIO.MODE_WRITE + suffix)
             self.root.extension = self.extension()
             self.root.path = self.path()
         elif self._mode == KIO.MODE_DEBUG:
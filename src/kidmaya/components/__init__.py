@@ -1,3 +1,4 @@
 # :coding: utf-8
-from kdummyconstraint import KDummyConstraint
+from kidmaya.components.kdummyconstraint import KDummyConstraint, KConstraintEvents, KMayaConstraintEvents
+from kidmaya.components.kconstraintsystem import KConstraintSystem
 
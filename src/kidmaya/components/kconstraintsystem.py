@@ -0,0 +1,263 @@
+# :coding: utf-8
+
+# Project Modules
+from kid.core import KObject, KMatrix4, KModifier
+from kidmaya.components.kdummyconstraint import KDummyConstraint
+
+# Python Modules
+
+# Maya Modules
+
+
+class KConstraintSystem(KObject):
+    """ Class that owns many KDummyConstraint and evaluates them in dependency order, a temporary rig in memory.
+
+    A constraint depends on another one when the other one's child is its parent, or above its parent or child in
+    the hierarchy. The constraints are sorted into levels: a level only depends on the levels before it, so the
+    constraints of a level are independent branches.
+
+    Every level is solved, then written with one KModifier. The world matrix each child gets from the write, see
+    KDummyConstraint.written_world_matrix(), is cached and fed to the constraints below it instead of reading the
+    matrix back from Maya after the modifier is applied.
+
+    Args:
+        constraints(list): list of KDummyConstraint
+    """
+
+    # Static Methods
+    @staticmethod
+    def get_path(transform):
+        """ Returns the full path of a transform, its name if it has no dag path.
+
+        Args:
+            transform(KTransform)
+
+        Returns:
+            str
+        """
+        dag = transform.dag()
+
+        if hasattr(dag, "fullPathName"):
+            return dag.fullPathName()
+
+        return transform.get_name()
+
+    @staticmethod
+    def get_parent_path(path):
+        """ Returns the full path of the parent of a path, an empty string at the top of the hierarchy.
+
+        Args:
+            path(str)
+
+        Returns:
+            str
+        """
+        return path.rsplit("|", 1)[0] if "|" in path else str()
+
+    @staticmethod
+    def is_below(path, other):
+        """ Returns True if path is other or below it in the hierarchy.
+
+        Args:
+            path(str)
+            other(str)
+
+        Returns:
+            bool
+        """
+        return path == other or path.startswith(other + "|")
+
+    # Object Methods
+    def __init__(self, constraints=None):
+        self._constraints = list()
+        self._levels = None
+
+        for constraint in constraints or list():
+            self.add(constraint)
+
+    def __str__(self):
+        return self.str_formatter(len(self._constraints))
+
+    def __len__(self):
+        return len(self._constraints)
+
+    def __iter__(self):
+        return iter(self._constraints)
+
+    def is_valid(self):
+        """ Returns True if the constraints have no cycle.
+
+        Returns:
+            bool
+        """
+        try:
+            self.levels()
+        except RuntimeError:
+            return False
+
+        return True
+
+    def add(self, constraint):
+        """ Adds a constraint to the system.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            None
+        """
+        if not isinstance(constraint, KDummyConstraint):
+            raise TypeError("Invalid type.")
+
+        if not constraint.is_valid():
+            raise ValueError("Constraint has no parent or child.")
+
+        if constraint not in self._constraints:
+            self._constraints.append(constraint)
+            self._levels = None
+        return
+
+    def remove(self, constraint):
+        """ Removes a constraint from the system.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            None
+        """
+        if constraint in self._constraints:
+            self._constraints.remove(constraint)
+            self._levels = None
+        return
+
+    def clear(self):
+        """ Removes every constraint.
+
+        Returns:
+            None
+        """
+        self._constraints = list()
+        self._levels = None
+        return
+
+    def constraints(self):
+        """ Returns the constraints in the order they were added.
+
+        Returns:
+            list
+        """
+        return self._constraints
+
+    def dependencies(self):
+        """ Returns the indices of the constraints each constraint depends on.
+
+        Returns:
+            list: One set of indices per constraint.
+        """
+        paths = [(self.get_path(constraint.parent()), self.get_path(constraint.child()))
+                 for constraint in self._constraints]
+        result = list()
+
+        for parent, child in paths:
+            upstream = set()
+
+            for index, (_, other_child) in enumerate(paths):
+                if other_child == child:
+                    continue
+
+                if self.is_below(parent, other_child) or self.is_below(self.get_parent_path(child), other_child):
+                    upstream.add(index)
+
+            result.append(upstream)
+
+        return result
+
+    def levels(self):
+        """ Returns the constraints sorted into levels of independent constraints, in evaluation order.
+
+        Raises a RuntimeError naming the constraints of a cycle, since they can't be ordered.
+
+        Returns:
+            list: list of list of KDummyConstraint
+        """
+        if self._levels is not None:
+            return self._levels
+
+        # Kahn's algorithm, one level per pass.
+        dependencies = self.dependencies()
+        remaining = dict((index, set(upstream)) for index, upstream in enumerate(dependencies))
+        levels = list()
+
+        while remaining:
+            ready = sorted(index for index, upstream in remaining.items() if not upstream)
+
+            if not ready:
+                names = ["{} -> {}".format(self._constraints[index].parent().get_name(),
+                                           self._constraints[index].child().get_name())
+                         for index in sorted(remaining)]
+                raise RuntimeError("Constraint cycle between: {}.".format(", ".join(names)))
+
+            for index in ready:
+                del remaining[index]
+
+            for upstream in remaining.values():
+                upstream.difference_update(ready)
+
+            levels.append([self._constraints[index] for index in ready])
+
+        self._levels = levels
+        return levels
+
+    def evaluate(self, force=False):
+        """ Updates every constraint in dependency order.
+
+        Args:
+            force(bool): Solves and writes every constraint even if its inputs didn't change.
+
+        Returns:
+            int: Number of constraints that solved and wrote a new transformation.
+        """
+        worlds = dict()
+        count = 0
+
+        for level in self.levels():
+            solving = list()
+
+            for constraint in level:
+                parent_path = self.get_path(constraint.parent())
+                child_path = self.get_path(constraint.child())
+                parent_world = worlds.get(parent_path)
+                parent_inverse = worlds.get(self.get_parent_path(child_path))
+                upstream = parent_world is not None or parent_inverse is not None
+
+                if not force and not upstream and not constraint.is_dirty():
+                    continue
+
+                if parent_inverse is not None:
+                    parent_inverse = KMatrix4.from_xform(parent_inverse, copy=False).inverse().data()
+
+                if constraint.read(parent_world, parent_inverse) or force:
+                    solving.append((constraint, child_path))
+
+            if not solving:
+                continue
+
+            modifier = KModifier()
+
+            for constraint, child_path in solving:
+                constraint.solve()
+                constraint.write(modifier)
+                worlds[child_path] = constraint.written_world_matrix().data()
+
+            modifier.do_it()
+            count += len(solving)
+
+        return count
+
+
+if __name__ == '__main__':
+    _system = KConstraintSystem([KDummyConstraint.from_name("locator1", "pCube1", True),
+                                 KDummyConstraint.from_name("pCube1", "pSphere1", True)])
+    print(_system.levels())
+    _system.evaluate()
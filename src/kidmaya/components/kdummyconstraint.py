@@ -1,12 +1,162 @@
 # :coding: utf-8
 
 # Project Modules
-from kid.core import KObject, KTransform
+from kid.core import KObject, KTransform, KMatrix4, KMath, KMatrixSampler
 
 # Python Modules
+from array import array
+import itertools
+import weakref
 
 # Maya Modules
 import maya.cmds as cmds
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
+
+
+class KConstraintEvents(KObject):
+    """ Base class of the event sources that mark a KDummyConstraint dirty when its parent or child changes.
+
+    An event source calls constraint.set_dirty() when one of the watched nodes changes. Subclass it to drive the
+    constraints from something else than Maya, for example a stub in tests.
+
+    Every watched constraint gets a token that is never reused, unlike id(). A constraint that is collected without
+    unwatch() is released by a weakref.finalize(), see release().
+    """
+
+    def __init__(self):
+        self._constraints = dict()
+        self._finalizers = dict()
+        self._tokens = weakref.WeakKeyDictionary()
+        self._counter = itertools.count(1)
+
+    def is_valid(self):
+        """ Returns True if the event source watches at least one constraint.
+
+        Returns:
+            bool
+        """
+        return bool(self._constraints)
+
+    def is_watching(self, constraint):
+        """ Returns True if the constraint is watched.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            bool
+        """
+        return constraint in self._tokens
+
+    def get_token(self, constraint):
+        """ Returns the token of a watched constraint.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            int: None if the constraint isn't watched.
+        """
+        return self._tokens.get(constraint)
+
+    def watch(self, constraint):
+        """ Starts marking a constraint dirty when its parent or child changes.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            None
+        """
+        self.unwatch(constraint)
+
+        token = next(self._counter)
+        self._tokens[constraint] = token
+        self._constraints[token] = weakref.ref(constraint)
+        self._finalizers[token] = weakref.finalize(constraint, self.release, token)
+        return
+
+    def unwatch(self, constraint):
+        """ Stops watching a constraint.
+
+        Args:
+            constraint(KDummyConstraint)
+
+        Returns:
+            None
+        """
+        token = self._tokens.pop(constraint, None)
+
+        if token is not None:
+            self._finalizers[token].detach()
+            self.release(token)
+        return
+
+    def release(self, token):
+        """ Forgets a constraint, called by unwatch() or when the constraint is collected.
+
+        Args:
+            token(int): Token of the constraint.
+
+        Returns:
+            None
+        """
+        self._constraints.pop(token, None)
+        self._finalizers.pop(token, None)
+        return
+
+    def emit(self, token):
+        """ Marks a watched constraint dirty.
+
+        Args:
+            token(int): Token of the constraint, see get_token().
+
+        Returns:
+            None
+        """
+        reference = self._constraints.get(token)
+        constraint = reference() if reference else None
+
+        if constraint is not None:
+            constraint.set_dirty()
+        return
+
+
+class KMayaConstraintEvents(KConstraintEvents):
+    """ Event source registering a node dirty plug callback on the parent and child of every watched constraint.
+
+    The parent world matrix and the child parent inverse matrix are dirtied when anything above them moves, so
+    these two callbacks catch every change of the constraint inputs. They are removed by unwatch() or when the
+    constraint is collected.
+
+    References:
+        * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_py_ref_class_open_maya_1_1_m_node_message_html
+    """
+
+    def __init__(self):
+        super(KMayaConstraintEvents, self).__init__()
+        self._callbacks = dict()
+
+    def watch(self, constraint):
+        super(KMayaConstraintEvents, self).watch(constraint)
+
+        token = self.get_token(constraint)
+
+        # Only the token is kept, the callbacks must not keep the constraint alive.
+        def dirty(*args):
+            self.emit(token)
+
+        self._callbacks[token] = [OpenMaya.MNodeMessage.addNodeDirtyPlugCallback(transform.dag().node(), dirty)
+                                  for transform in (constraint.parent(), constraint.child())]
+        return
+
+    def release(self, token):
+        for callback in self._callbacks.pop(token, list()):
+            OpenMaya.MMessage.removeCallback(callback)
+
+        super(KMayaConstraintEvents, self).release(token)
+        return
 
 
 class KDummyConstraint(KObject):
@@ -15,11 +165,20 @@ class KDummyConstraint(KObject):
     References:
         * https://charliebanks3d.wordpress.com/2018/05/02/rigging-with-matrices-parenting/
 
+    Notes:
+        * update() keeps the last parent world matrix and child parent inverse matrix it solved with and skips the
+          multiply, decompose and write when neither changed.
+        * With an event source the constraint is also marked dirty by node callbacks, so a clean constraint skips
+          reading its matrices too. update_all() only updates the dirty constraints.
+
     Args:
         parent(KTransform):     Parent transform node.
         child(KTransform):      Child transform node.
         offset(bool):           Maintain update_offset between parent and child.
+        events(KConstraintEvents): Optional event source marking the constraint dirty.
     """
+    # Every live constraint, for update_all().
+    _INSTANCES = weakref.WeakSet()
 
     # Static Methods
     @staticmethod
@@ -50,6 +209,24 @@ class KDummyConstraint(KObject):
         return
 
     # Class Methods
+    @classmethod
+    def update_all(cls, constraints=None):
+        """ Updates the dirty constraints.
+
+        Args:
+            constraints(list): Constraints to update, every live constraint if None.
+
+        Returns:
+            int: Number of constraints that solved and wrote a new transformation.
+        """
+        count = 0
+
+        for constraint in list(cls._INSTANCES) if constraints is None else constraints:
+            if constraint.is_dirty() and constraint.update():
+                count += 1
+
+        return count
+
     @classmethod
     def from_name(cls, parent, child, offset=False):
         """ Convenice method to create KDummyConstraint from string names.
@@ -69,14 +246,29 @@ class KDummyConstraint(KObject):
         return obj
 
     # Object Methods
-    def __init__(self, parent=None, child=None, offset=False):
+    def __init__(self, parent=None, child=None, offset=False, events=None):
         self._parent = parent
         self._child = child
         self._maintain_offset = offset
         self._offset = None
-
+        self._parent_matrix = KMatrix4()
+        self._child_matrix = KMatrix4()
+        self._result = KMatrix4()
+        self._local = KMatrix4()
+        self._values = [0.0] * 12
+
+        # Inputs of the last solve, compared to the current ones to skip unchanged updates.
+        self._last_parent = array("d", [0.0]) * 16
+        self._last_child = array("d", [0.0]) * 16
+        self._dirty = True
+        self._events = None
+
+        self._INSTANCES.add(self)
         self.update_offset()
 
+        if events is not None:
+            self.set_events(events)
+
     def __str__(self):
         parent = self._parent.get_name() if self._parent else None
         child = self._child.get_name() if self._child else None
@@ -106,6 +298,8 @@ class KDummyConstraint(KObject):
             raise TypeError("Invalid type.")
 
         self._parent = parent
+        self.invalidate()
+        self.watch()
         return
 
     def set_child(self, child):
@@ -121,6 +315,8 @@ class KDummyConstraint(KObject):
             raise TypeError("Invalid type.")
 
         self._child = child
+        self.invalidate()
+        self.watch()
         return
 
     def set_maintain_offset(self, offset):
@@ -139,6 +335,94 @@ class KDummyConstraint(KObject):
         self.update_offset()
         return
 
+    def parent(self):
+        """ Returns the parent transform.
+
+        Returns:
+            KTransform
+        """
+        return self._parent
+
+    def child(self):
+        """ Returns the child transform.
+
+        Returns:
+            KTransform
+        """
+        return self._child
+
+    def is_dirty(self):
+        """ Returns True if the constraint may need to update.
+
+        Without an event source a constraint is always considered dirty, update() then compares the matrices.
+
+        Returns:
+            bool
+        """
+        return self._dirty or self._events is None
+
+    def set_dirty(self, dirty=True):
+        """ Marks the constraint as changed, called by the event source.
+
+        Args:
+            dirty(bool)
+
+        Returns:
+            None
+        """
+        self._dirty = dirty
+        return
+
+    def invalidate(self):
+        """ Forgets the inputs of the last solve, so the next update() solves and writes even if the matrices
+        didn't change. Called when the parent, the child or the offset changes.
+
+        Returns:
+            None
+        """
+        self._last_parent[:] = array("d", [0.0]) * 16
+        self._last_child[:] = array("d", [0.0]) * 16
+        self.set_dirty()
+        return
+
+    def events(self):
+        """ Returns the event source, None if there isn't one.
+
+        Returns:
+            KConstraintEvents
+        """
+        return self._events
+
+    def set_events(self, events):
+        """ Sets the event source marking the constraint dirty, None to only compare the matrices.
+
+        Args:
+            events(KConstraintEvents)
+
+        Returns:
+            None
+        """
+        if events is not None and not isinstance(events, KConstraintEvents):
+            raise TypeError("Invalid type.")
+
+        if self._events is not None:
+            self._events.unwatch(self)
+
+        self._events = events
+        self.set_dirty()
+        self.watch()
+        return
+
+    def watch(self):
+        """ Registers the constraint on its event source once it has a parent and a child.
+
+        Returns:
+            None
+        """
+        if self._events is not None and self.is_valid():
+            self._events.watch(self)
+        return
+
     def offset(self):
         """ Returns the current offset if there is one.
 
@@ -155,43 +439,171 @@ class KDummyConstraint(KObject):
         """
         if self.is_valid() and self._maintain_offset:
             self._offset = self.get_offset(self._parent, self._child)
+
+        self.invalidate()
         return
 
-    def update(self):
-        """ Calulcates the new position of the child position and update.
+    def read(self, parent_world=None, parent_inverse=None):
+        """ Reads the parent world matrix and the child parent inverse matrix.
+
+        Args:
+            parent_world(array.array): Uses these 16 values instead of reading the parent world matrix.
+            parent_inverse(array.array): Uses these 16 values instead of reading the child parent inverse matrix.
+
+        Returns:
+            bool: True if the inputs changed since the last read.
+        """
+        parent_data = self._parent_matrix.data()
+        child_data = self._child_matrix.data()
+
+        if parent_world is None:
+            self._parent.world_matrix(True, parent_data)
+        else:
+            parent_data[:] = parent_world
+
+        if parent_inverse is None:
+            self._child.parent_inverse_matrix(True, child_data)
+        else:
+            child_data[:] = parent_inverse
+
+        self._dirty = False
+
+        if parent_data == self._last_parent and child_data == self._last_child:
+            return False
+
+        self._last_parent[:] = parent_data
+        self._last_child[:] = child_data
+        return True
+
+    def solve(self):
+        """ Returns the local matrix of the child from the last read inputs, pure math without Maya calls.
+
+        Returns:
+            KMatrix4: Reused between calls.
+        """
+        if self._maintain_offset:
+            return KMatrix4.chain(self._offset, self._parent_matrix, self._child_matrix, out=self._result)
+
+        return self._parent_matrix.multiply_into(self._child_matrix, self._result)
+
+    def written_world_matrix(self, out=None):
+        """ Returns the world matrix the child gets from the last write(): only the translation is written, so it is
+        the solved translation with the current rotation and scale of the child, times its parent matrix.
+
+        Args:
+            out(KMatrix4): Optional matrix to write the result into.
+
+        Returns:
+            KMatrix4
+        """
+        out = out if out is not None else KMatrix4()
+        local = self._child.local_matrix(True, self._local.data())
+        local[12:15] = array("d", self._values[0:3])
+
+        # The parent matrix of the child is the inverse of the parent inverse matrix the solve used.
+        self._child_matrix.inverse(out=out)
+        return self._local.multiply_into(out, out)
+
+    def write(self, modifier=None):
+        """ Writes the last solved local matrix to the child.
+
+        Args:
+            modifier(KModifier): Queues the values on this modifier and leaves applying it to the caller.
 
         Returns:
             None
         """
-        if self.is_valid():
-            # Get Matrics
-            parent_matrix = self._parent.world_matrix()
-            child_matrix = self._child.parent_inverse_matrix()
+        # Decompose Matrix Sum, tx ty tz rx ry rz sx sy sz shxy shxz shyz written into a reused buffer.
+        values = self._result.decompose_values(out=self._values)
+        translation = values[0:3]
+        euler = values[3:6]
+
+        # Update Transformation, one undoable API write instead of a cmds.setAttr per channel.
+        self._child.set_translations([self._child], [translation], modifier)
+
+        # self._child.set_rotations([self._child], [euler], modifier)
+
+        # Writing the child dirties it, the inputs are compared again on the next update.
+        self._dirty = False
+        return
+
+    def bake(self, start, end, step=1.0, reduce=False, tolerance=1e-3, evaluator=None, modifier=None):
+        """ Solves the constraint over a frame range and keys the child translation in bulk.
+
+        The parent world matrix and the child parent inverse matrix are sampled for the whole range through DG
+        contexts, the timeline doesn't move. Each channel is written with one MFnAnimCurve.addKeys() call that
+        replaces the keys of the baked range.
+
+        Args:
+            start(int, float)
+            end(int, float)
+            step(int, float)
+            reduce(bool): Removes the keys linear interpolation of their neighbours reproduces within tolerance,
+                the kept keys get linear tangents.
+            tolerance(float): Largest difference a removed key can have.
+            evaluator(KSamplerEvaluator): Evaluator of the samplers, KMayaSamplerEvaluator if None.
+            modifier(KModifier): Queues the keys on this modifier and leaves applying it to the caller.
 
-            # Mutliply Matrices
-            if self._maintain_offset:
-                mult = self._offset * parent_matrix * child_matrix
+        Returns:
+            KModifier
+        """
+        if not self.is_valid():
+            raise RuntimeError("Constraint has no parent or child.")
+
+        frames = KMatrixSampler.get_frames(start, end, step)
+        size = len(frames) * 16
+        parents = KMatrixSampler([self._parent], KMatrixSampler.WORLD_MATRIX, evaluator).sample_frames(
+            frames, array("d", [0.0]) * size)
+        inverses = KMatrixSampler([self._child], KMatrixSampler.PARENT_INVERSE_MATRIX, evaluator).sample_frames(
+            frames, array("d", [0.0]) * size)
+
+        columns = [array("d"), array("d"), array("d")]
+
+        for offset in range(0, size, 16):
+            self.read(parents[offset:offset + 16], inverses[offset:offset + 16])
+            values = self.solve().decompose_values(out=self._values)
+            columns[0].append(values[0])
+            columns[1].append(values[1])
+            columns[2].append(values[2])
+
+        # The inputs of the last frame aren't the current ones.
+        self.invalidate()
+
+        times = list()
+        tangent = OpenMayaAnim.MFnAnimCurve.kTangentLinear if reduce else None
+
+        for index, column in enumerate(columns):
+            if reduce:
+                keys = KMath.get_linear_keys(frames, column, tolerance)
+                times.append([frames[key] for key in keys])
+                columns[index] = [column[key] for key in keys]
             else:
-                mult = parent_matrix * child_matrix
+                times.append(frames)
 
-            # Decompose Matrix Sum
-            translation, euler, scale = mult.decompose()
+        # The error of the reduction is only bounded with linear segments between the kept keys.
+        return self._child.set_channel_keys(KTransform.TRANSLATE, times, columns, modifier, tangent, tangent, False)
 
-            # Update Transformation
-            
-            # This code works, but I want to use the API instead - for reference.
-            cmds.setAttr("{}.tx".format(self._child.get_name()), translation[0])
-            cmds.setAttr("{}.ty".format(self._child.get_name()), translation[1])
-            cmds.setAttr("{}.tz".format(self._child.get_name()), translation[2])
+    def update(self, force=False):
+        """ Calulcates the new position of the child position and update.
 
-            # cmds.setAttr("{}.rx".format(self._child.get_name()), euler[0])
-            # cmds.setAttr("{}.ry".format(self._child.get_name()), euler[1])
-            # cmds.setAttr("{}.rz".format(self._child.get_name()), euler[2])
+        Args:
+            force(bool): Solves and writes even if the inputs didn't change.
 
-            # Api version
-            # self._child.set_translation(translation)
-            # self._child.set_rotation(euler)
-        return
+        Returns:
+            bool: True if the child was updated.
+        """
+        if not self.is_valid():
+            return False
+
+        if not force and not self.is_dirty():
+            return False
+
+        if not self.read() and not force:
+            return False
+
+        self.solve()
+        self.write()
+        return True
 
 
 if __name__ == '__main__':
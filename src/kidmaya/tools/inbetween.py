@@ -1,7 +1,8 @@
 # :coding: utf-8
 
 # Project Modules
-from kid.core import KObject, KTransform, KKeyFrame, KMath, KDebug, KAnim
+from kid.core import KObject, KTransform, KKeyFrame, KMath, KDebug, KAnim, KInbetween, KModifier
+from kid.core import KInbetweenProfile, KOvershootProfile
 
 # Python Modules
 
@@ -11,14 +12,47 @@ import maya.OpenMaya as OpenMaya
 import maya.OpenMayaAnim as OpenMayaAnim
 
 
+class InbetweenKeyTimes(object):
+    """ Sequence of the key times of an anim curve, read on demand so a binary search only reads a few of them.
+
+    Args:
+        function(OpenMayaAnim.MFnAnimCurve)
+        unit(int): OpenMaya.MTime unit the times are returned in.
+    """
+    def __init__(self, function, unit):
+        self._function = function
+        self._unit = unit
+        self._count = function.numKeys()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError("Key index out of range.")
+
+        return self._function.time(index).asUnits(self._unit)
+
+
 class Inbetween(KObject):
     """ Class that handles creating a keyframe from comparing the previous values with the next values.
-    
+
+    favor() is the cmds reference, it queries and keys one attribute at a time. favor_curves() is the engine: it
+    gathers every animated curve of the nodes in one pass, finds the neighbour keys with a binary search, blends all
+    the curves at once with KInbetween and keys them with one KModifier, so the whole operation is one undo step.
+    The slider uses an InbetweenSession so the keys are only gathered when the drag begins.
+
+    A KInbetweenProfile maps the slider position to a weight, easing, overshooting or following the tangents of
+    the keys. Profiles are sampled into lookup tables once, the favor presets come from the default one.
+
     References:
         * https://help.autodesk.com/view/MAYAUL/2022/ENU/?guid=Maya_SDK_cpp_ref_anim_export_util_2anim_export_util_8cpp_example_html
 
     """
-    DEFAULT_FAVOR_VALUES = [0.0, .0833, .1666, .2499, .3332, .4165, .5, .5833, .6666, .7499, .8332, .9165, 1.0]
+    DEFAULT_PROFILE = KInbetweenProfile()
+    OVERSHOOT_PROFILE = KOvershootProfile(-2.0, 2.0)
+    DEFAULT_FAVOR_VALUES = DEFAULT_PROFILE.presets()
+    # The overshoot buttons keep their quarter steps, evenly spaced presets of OVERSHOOT_PROFILE would be thirds.
     DEFAULT_OVERSHOOT_VALUES = [-2.0, -1.75, -1.5, -1.25, -1.0, -0.75, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0]
 
     # Static Methods
@@ -43,8 +77,7 @@ class Inbetween(KObject):
         new_value = (next_value - previous_value) * weight + previous_value
 
         try:
-            pass
-            # cmds.setAttr(query, new_value)
+            cmds.setKeyframe(query, value=new_value)
 
         except RuntimeError:
             KDebug.error("""Inbetween: Unable to set "{}".""".format(query))
@@ -59,7 +92,157 @@ class Inbetween(KObject):
 
     @staticmethod
     def favor_api(transform, attribute, weight):
-        return
+        """ Sets the keyframe value of one attribute with the API engine.
+
+        Args:
+            transform(str)
+            attribute(str)
+            weight(float)
+
+        Returns:
+            int: Number of keys set.
+        """
+        return Inbetween.favor_curves(["{}.{}".format(transform, attribute)], weight)
+
+    @staticmethod
+    def get_current_time():
+        """ Returns the current frame in the current time unit.
+
+        Returns:
+            float
+        """
+        return OpenMayaAnim.MAnimControl.currentTime().asUnits(OpenMaya.MTime.uiUnit())
+
+    @staticmethod
+    def get_tangent_slope(function, index, in_tangent):
+        """ Returns the slope of a key tangent in value per second.
+
+        Args:
+            function(OpenMayaAnim.MFnAnimCurve)
+            index(int)
+            in_tangent(bool)
+
+        Returns:
+            float
+        """
+        x_util = OpenMaya.MScriptUtil()
+        x_ptr = x_util.asFloatPtr()
+        y_util = OpenMaya.MScriptUtil()
+        y_ptr = y_util.asFloatPtr()
+        function.getTangent(index, x_ptr, y_ptr, in_tangent)
+        x = OpenMaya.MScriptUtil.getFloat(x_ptr)
+
+        if not x:
+            return 0.0
+
+        return OpenMaya.MScriptUtil.getFloat(y_ptr) / x
+
+    @staticmethod
+    def gather(nodes, time=None, tangents=False):
+        """ Returns every animated curve of nodes that has a key before and after time, found in one pass.
+
+        Driven keys, curves with an unitless input, are skipped.
+
+        Args:
+            nodes(list): Node or plug names.
+            time(float): Frame in the current time unit, the current frame if None.
+            tangents(bool): Also reads the tangents of the neighbour keys, used by KTangentProfile.
+
+        Returns:
+            tuple: (list of OpenMaya.MPlug, list of OpenMaya.MObject anim curves, KInbetween)
+        """
+        unit = OpenMaya.MTime.uiUnit()
+        time = Inbetween.get_current_time() if time is None else float(time)
+
+        selection = OpenMaya.MSelectionList()
+
+        for node in nodes:
+            selection.add(node)
+
+        animated = OpenMaya.MPlugArray()
+        OpenMayaAnim.MAnimUtil.findAnimatedPlugs(selection, animated)
+
+        function = OpenMayaAnim.MFnAnimCurve()
+        plugs = list()
+        curves = list()
+        previous_values = list()
+        next_values = list()
+        previous_tangents = list() if tangents else None
+        next_tangents = list() if tangents else None
+        seconds = OpenMaya.MTime.kSeconds
+
+        for plug_index in range(animated.length()):
+            plug = animated[plug_index]
+            found = OpenMaya.MObjectArray()
+
+            if not OpenMayaAnim.MAnimUtil.findAnimation(plug, found):
+                continue
+
+            for curve_index in range(found.length()):
+                curve = found[curve_index]
+
+                if not curve.hasFn(OpenMaya.MFn.kAnimCurve):
+                    continue
+
+                function.setObject(curve)
+
+                if function.isUnitlessInput():
+                    break
+
+                previous_index, next_index = KInbetween.get_neighbours(InbetweenKeyTimes(function, unit), time)
+
+                if previous_index >= 0 and next_index >= 0:
+                    plugs.append(plug)
+                    curves.append(curve)
+                    previous_values.append(function.value(previous_index))
+                    next_values.append(function.value(next_index))
+
+                    if tangents:
+                        # Hermite tangents are slopes scaled by the time between the keys.
+                        span = (function.time(next_index).asUnits(seconds) -
+                                function.time(previous_index).asUnits(seconds))
+                        previous_tangents.append(Inbetween.get_tangent_slope(function, previous_index, False) * span)
+                        next_tangents.append(Inbetween.get_tangent_slope(function, next_index, True) * span)
+
+                # Only the first curve drives the plug.
+                break
+
+        return plugs, curves, KInbetween(previous_values, next_values, previous_tangents, next_tangents)
+
+    @staticmethod
+    def favor_curves(nodes, weight, time=None, modifier=None, profile=None):
+        """ Keys every animated curve of nodes between its previous and next keys based on weight.
+
+        Args:
+            nodes(list): Node or plug names.
+            weight(float): 0.0 is the previous key, 1.0 the next one, values outside overshoot. The slider position
+                from 0.0 to 1.0 when there is a profile.
+            time(float): Frame in the current time unit, the current frame if None.
+            modifier(KModifier): Queues the keys on this modifier and leaves applying it to the caller.
+            profile(KInbetweenProfile): Maps weight to the blend weight, linear if None.
+
+        Returns:
+            int: Number of keys set.
+        """
+        time = Inbetween.get_current_time() if time is None else float(time)
+        plugs, curves, inbetween = Inbetween.gather(nodes, time, profile is not None and profile.USES_TANGENTS)
+
+        if not inbetween.is_valid():
+            return 0
+
+        values = inbetween.blend(weight) if profile is None else profile.blend(inbetween, weight)
+
+        apply = modifier is None
+        modifier = KModifier() if apply else modifier
+        times = [time]
+
+        for plug, curve, value in zip(plugs, curves, values):
+            modifier.add_keys(plug, times, [value], curve=curve)
+
+        if apply:
+            modifier.do_it()
+
+        return len(plugs)
 
     # Object Methods
     def __init__(self, transform):
@@ -86,116 +269,199 @@ class Inbetween(KObject):
         return
 
 
-if __name__ == '__main__':
-    transform = "pCube1"
+class InbetweenSession(KObject):
+    """ Class that drives the inbetween slider, the neighbour keys are gathered once when the drag begins.
+
+    begin() snapshots the previous and next key values of every animated curve of the nodes. Each drag() only
+    blends the snapshot into a reused buffer and previews the values on the plugs, without undo. release() keys the
+    last weight with one KModifier in a single undo chunk, cancel() restores the values the plugs had at begin().
+
+    Args:
+        nodes(list): Node or plug names.
+        time(float): Frame in the current time unit, the current frame when the drag begins if None.
+        profile(KInbetweenProfile): Maps the slider position to the blend weight, linear if None.
+    """
+    UNDO_CHUNK = "inbetween"
+
+    # Object Methods
+    def __init__(self, nodes=None, time=None, profile=None):
+        self._nodes = list(nodes) if nodes else list()
+        self._time = time
+        self._profile = profile
+        self._frame = None
+        self._plugs = list()
+        self._curves = list()
+        self._inbetween = KInbetween()
+        self._values = None
+        self._original = list()
+        self._weight = None
+        self._active = False
+
+    def __str__(self):
+        return self.str_formatter(len(self._plugs), active=self._active)
 
-    # # Cmds Version
-    # KDebug.update_time()
-    # Inbetween.favor_all(transform, .5) # 0.007997989654541016 seconds
-    # KDebug.log_elapsed_time()
+    def __len__(self):
+        return len(self._plugs)
+
+    def is_valid(self):
+        """ Returns True if the session has begun and has curves to blend.
+
+        Returns:
+            bool
+        """
+        return self._active and self._inbetween.is_valid()
+
+    def is_active(self):
+        """ Returns True between begin() and release() or cancel().
+
+        Returns:
+            bool
+        """
+        return self._active
+
+    def profile(self):
+        """ Returns the profile mapping the slider position to the blend weight.
+
+        Returns:
+            KInbetweenProfile
+        """
+        return self._profile
+
+    def set_profile(self, profile):
+        """ Sets the profile, takes effect on the next drag or when the next session begins if it needs tangents.
+
+        Args:
+            profile(KInbetweenProfile)
+
+        Returns:
+            None
+        """
+        if profile is not None and not isinstance(profile, KInbetweenProfile):
+            raise TypeError("Invalid type.")
+
+        self._profile = profile
+        self._weight = None
+        return
+
+    def weight(self):
+        """ Returns the last weight dragged to, None if there was no drag yet.
+
+        Returns:
+            float
+        """
+        return self._weight
+
+    def begin(self, nodes=None):
+        """ Gathers the curves to blend and snapshots their neighbour keys and current values.
+
+        Args:
+            nodes(list): Node or plug names, the ones of the constructor if None.
+
+        Returns:
+            int: Number of curves the session blends.
+        """
+        if nodes is not None:
+            self._nodes = list(nodes)
+
+        self._frame = Inbetween.get_current_time() if self._time is None else float(self._time)
+        tangents = self._profile is not None and self._profile.USES_TANGENTS
+        self._plugs, self._curves, self._inbetween = Inbetween.gather(self._nodes, self._frame, tangents)
+        self._values = self._inbetween.new_buffer()
+        self._original = [plug.asDouble() for plug in self._plugs]
+        self._weight = None
+        self._active = True
+        return len(self._plugs)
+
+    def _preview(self, values):
+        """ Sets the plug values without undo.
+        """
+        modifier = KModifier()
+        modifier.set_doubles(self._plugs, values)
+        modifier.do_it(undoable=False)
+        return
+
+    def drag(self, weight):
+        """ Blends every curve at weight and previews the values, nothing is queried.
+
+        Args:
+            weight(float): 0.0 is the previous key, 1.0 the next one, values outside overshoot. The slider position
+                from 0.0 to 1.0 when there is a profile.
+
+        Returns:
+            bool: False if the weight didn't change or there is nothing to blend.
+        """
+        if not self._active:
+            raise RuntimeError("Inbetween session has not begun.")
+
+        weight = float(weight)
+
+        if weight == self._weight or not self._inbetween.is_valid():
+            return False
+
+        if self._profile is None:
+            self._inbetween.blend(weight, out=self._values)
+        else:
+            self._profile.blend(self._inbetween, weight, out=self._values)
+
+        self._weight = weight
+        self._preview(self._values)
+        return True
+
+    def release(self, weight=None):
+        """ Keys the last weight on every curve as one undo chunk and ends the session.
+
+        Args:
+            weight(float): Drags to this weight first if not None.
+
+        Returns:
+            int: Number of keys set.
+        """
+        if weight is not None:
+            self.drag(weight)
+
+        self._active = False
+
+        if self._weight is None or not self._inbetween.is_valid():
+            return 0
+
+        modifier = KModifier()
+        times = [self._frame]
+
+        for plug, curve, value in zip(self._plugs, self._curves, self._values):
+            modifier.add_keys(plug, times, [value], curve=curve)
+
+        cmds.undoInfo(openChunk=True, chunkName=self.UNDO_CHUNK)
+
+        try:
+            modifier.do_it()
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return len(self._plugs)
+
+    def cancel(self):
+        """ Restores the values the plugs had when the session began and ends it.
+
+        Returns:
+            None
+        """
+        if self._active and self._weight is not None:
+            self._preview(self._original)
+
+        self._active = False
+        self._weight = None
+        return
+
+
+if __name__ == '__main__':
+    _selection = cmds.ls(selection=True) or ["pCube1"]
 
-    # Api Version
     KDebug.update_time()
-    
-    # Get Dag
-    selection = OpenMaya.MSelectionList()
-    selection.add(transform)
-    dag = OpenMaya.MDagPath()
-    selection.getDagPath(0, dag)
-    fn = OpenMaya.MFnDependencyNode(dag.node())
-    
-    # Get Current Time
-    current_time = OpenMayaAnim.MAnimControl.currentTime()
-    
-    # Get Animated Plugs
-    plugs = OpenMaya.MPlugArray()
-    OpenMayaAnim.MAnimUtil.findAnimatedPlugs(dag, plugs)
-    
-    for plug_index in range(plugs.length()):
-        plug = plugs[plug_index]
-        animation = OpenMaya.MObjectArray()
-        
-        OpenMayaAnim.MAnimUtil.findAnimation(plug, animation)
-        
-        for anim_index in range(animation.length()):
-            anim_object = animation[anim_index]
-            
-            if not anim_object.hasFn(OpenMaya.MFn.kAnimCurve):
-                continue
-                
-            anim_curve = OpenMayaAnim.MFnAnimCurve(anim_object)
-            
-            if anim_curve.numKeys() < 2:
-                continue
-            
-            # Get Closet Keyframe
-            close_index = anim_curve.findClosest(current_time)
-            close_time = anim_curve.time(close_index)
-            
-            previous_index = -1
-            next_index = -1
-            
-            last_index = anim_curve.numKeys() - 1
-            
-            if current_time == close_time:
-                # Previous Index
-                if close_index > 0:
-                    previous_index = close_index - 1
-                else:
-                    previous_index = close_index
-                
-                # Next Index
-                if close_index < last_index:
-                    next_index = close_index + 1
-                else:
-                    next_index = close_index
-                    
-            else:
-                # Still not found
-                # Previous Index
-                if close_index == 0 and current_time < close_time:
-                    previous_index = -1
-                    next_index = 0
-                
-                # Next Index
-                elif close_index == last_index and current_time > close_time:
-                    next_index = -1
-                    previous_index = last_index
-                
-                else:
-                    # Search Previous 2 vs Next 2
-                    if previous_index == -1 and next_index == -1:
-                        # Previous
-                        if close_time < current_time:
-                            previous_index = close_index
-                            next_index = close_index + 1
-                            
-                        # Next
-                        elif close_time > current_time:
-                            next_index = close_index
-                            previous_index = close_index - 1
-                            
-                        
-            #print(previous_index, next_index)
-                        
-            if previous_index == next_index:
-                continue
-            
-            elif previous_index == -1 or next_index == -1:
-                continue
-            
-            weight = 1.0
-            previous_value = anim_curve.value(previous_index)
-            next_value = anim_curve.value(next_index)
-            new_value = (next_value - previous_value) * weight + previous_value
-            #anim_curve.addKey(current_time, new_value, change=anim_cache)
-            #anim_curve.addKey(current_time, new_value)
-            #cmds.setKeyframe(plug.name(), value=new_value)
-            # print(previous_index, next_index)
-            
-    
+    _session = InbetweenSession(_selection)
+    _session.begin()
+
+    for _weight in Inbetween.DEFAULT_FAVOR_VALUES:
+        _session.drag(_weight)
+
+    _session.release()
     KDebug.log_elapsed_time()
-    
-    # KDebug.update_time()
-    # cmds.inbetween("pCube1",w=1.0)
-    # KDebug.log_elapsed_time()
@@ -0,0 +1,111 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KMatrix4
+from kidmaya.components import KConstraintSystem, KDummyConstraint
+from test_kdummyconstraint import StubTransform
+
+# Python Modules
+import math
+import pytest
+
+
+def _translated(x, y, z):
+    xform = list(KMatrix4.IDENTITY)
+    xform[12:15] = [x, y, z]
+    return xform
+
+
+def _rotated_z(angle):
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    xform = list(KMatrix4.IDENTITY)
+    xform[0:2] = [cos, sin]
+    xform[4:6] = [-sin, cos]
+    return xform
+
+
+def test_kconstraintsystem_levels():
+    root = StubTransform("|root")
+    a = StubTransform("|a")
+    b = StubTransform("|b")
+    c = StubTransform("|a|c")
+    d = StubTransform("|d")
+
+    first = KDummyConstraint(root, a)
+    second = KDummyConstraint(a, b)
+    third = KDummyConstraint(d, c)
+    other = KDummyConstraint(root, d)
+
+    system = KConstraintSystem([second, third, first, other])
+    assert system.is_valid()
+
+    # third depends on first through the hierarchy, c is below a.
+    levels = system.levels()
+    assert levels[0] == [first, other]
+    assert sorted(levels[1], key=id) == sorted([second, third], key=id)
+
+
+def test_kconstraintsystem_cycle():
+    a = StubTransform("|a")
+    b = StubTransform("|b")
+    system = KConstraintSystem([KDummyConstraint(a, b), KDummyConstraint(b, a)])
+    assert not system.is_valid()
+
+    with pytest.raises(RuntimeError):
+        system.levels()
+
+
+def test_kconstraintsystem_evaluate_chain():
+    root = StubTransform("|root", world=_translated(1.0, 2.0, 3.0))
+    a = StubTransform("|a")
+    b = StubTransform("|b")
+    system = KConstraintSystem([KDummyConstraint(a, b), KDummyConstraint(root, a)])
+    assert system.evaluate() == 2
+
+    assert a.writes == [[1.0, 2.0, 3.0]]
+    assert b.writes == [[1.0, 2.0, 3.0]]
+
+    # The second constraint used the written world matrix of a, it never read it back. The reads are the parent
+    # inverse matrix of a and its local matrix for the rotation and scale the write kept.
+    assert a.reads == 2
+
+    assert system.evaluate() == 0
+    root.move(4.0, 0.0, 0.0)
+    assert system.evaluate() == 2
+    assert b.writes[-1] == [4.0, 0.0, 0.0]
+
+
+def test_kconstraintsystem_evaluate_parent_inverse():
+    root = StubTransform("|root", world=_translated(5.0, 0.0, 0.0))
+    target = StubTransform("|target", world=_translated(6.0, 1.0, 0.0))
+    a = StubTransform("|a")
+    c = StubTransform("|a|c")
+    system = KConstraintSystem([KDummyConstraint(target, c), KDummyConstraint(root, a)])
+    assert system.evaluate() == 2
+
+    # c is below a, its local translation is relative to the solved position of a.
+    assert c.writes == [[1.0, 1.0, 0.0]]
+
+
+def test_kconstraintsystem_evaluate_chain_offset():
+    def build():
+        root = StubTransform("|root")
+        a = StubTransform("|a", world=_translated(2.0, 0.0, 0.0))
+        b = StubTransform("|b", world=_translated(3.0, 0.0, 0.0))
+        constraints = [KDummyConstraint(root, a, offset=True), KDummyConstraint(a, b, offset=True)]
+
+        # Only the translation of a is written, the rotation of root must not reach b through the cache.
+        root.world = _rotated_z(math.pi * 0.5)
+        return a, b, constraints
+
+    a, b, constraints = build()
+    assert KConstraintSystem(constraints).evaluate() == 2
+
+    expected_a, expected_b, expected = build()
+
+    for constraint in expected:
+        assert constraint.update()
+
+    assert a.writes[-1] == pytest.approx(expected_a.writes[-1])
+    assert b.writes[-1] == pytest.approx(expected_b.writes[-1])
+    assert b.writes[-1] == pytest.approx([1.0, 2.0, 0.0])
@@ -1,8 +1,86 @@
 # :coding: utf-8
 # Project Modules
-from src.kid.components import KDummyConstraint
+from kid.core import KMatrix4, KTransform, KSamplerEvaluator
+from kidmaya.components import KDummyConstraint, KConstraintEvents
+
+# Python Modules
+from array import array
+import gc
 
 # Maya Modules
+import maya.OpenMayaAnim as OpenMayaAnim
+
+
+class StubTransform(KTransform):
+    """ KTransform reading its matrices from lists and recording the translations written to it, a write moves
+    the world matrix as if the transform had no parent.
+    """
+    def __init__(self, name, world=None, parent_inverse=None):
+        super(StubTransform, self).__init__()
+        self._name = name
+        self._dag = name
+        self.world = list(world or KMatrix4.IDENTITY)
+        self.parent_inverse = list(parent_inverse or KMatrix4.IDENTITY)
+        self.reads = 0
+        self.writes = list()
+
+    @classmethod
+    def set_translations(cls, transforms, translations, modifier=None):
+        for transform, translation in zip(transforms, translations):
+            transform.writes.append(list(translation))
+            transform.move(*translation)
+        return
+
+    def set_channel_keys(self, attributes, times, values, modifier=None, tangent_in=None, tangent_out=None,
+                         keep_existing=True):
+        self.keys = dict((attribute, (list(channel_times), list(channel_values)))
+                         for attribute, channel_times, channel_values in zip(attributes, times, values))
+        self.tangents = (tangent_in, tangent_out)
+        self.keep_existing = keep_existing
+        return modifier
+
+    def _read(self, values, raw, out):
+        self.reads += 1
+
+        if raw:
+            out[:] = array("d", values)
+            return out
+
+        return KMatrix4.from_xform(values)
+
+    def world_matrix(self, raw=False, out=None):
+        return self._read(self.world, raw, out)
+
+    def parent_inverse_matrix(self, raw=False, out=None):
+        return self._read(self.parent_inverse, raw, out)
+
+    def local_matrix(self, raw=False, out=None):
+        return self._read(KMatrix4.multiply_xform(self.world, self.parent_inverse), raw, out)
+
+    def move(self, x, y, z):
+        self.world[12:15] = [x, y, z]
+
+
+class FrameEvaluator(KSamplerEvaluator):
+    """ Moves the stub parents along X by one unit per frame until frame 5, then holds.
+    """
+    def get_context(self, frame):
+        return frame
+
+    def read(self, transform, attribute, context, out):
+        values = transform.world if attribute == "worldMatrix" else transform.parent_inverse
+
+        for index, value in enumerate(values):
+            out[index] = value
+
+        if attribute == "worldMatrix":
+            out[12] += min(context, 5.0)
+        return
+
+
+class StubEvents(KConstraintEvents):
+    def change(self, constraint):
+        self.emit(self.get_token(constraint))
 
 
 def test_kdummyconstraint_constructor():
@@ -11,3 +89,150 @@ def test_kdummyconstraint_constructor():
 
 def test_kdummyconstraint():
     assert True
+
+
+def test_kdummyconstraint_skips_unchanged_inputs():
+    parent = StubTransform("parent")
+    child = StubTransform("child")
+    constraint = KDummyConstraint(parent, child)
+
+    parent.move(1.0, 2.0, 3.0)
+    assert constraint.update()
+    assert child.writes == [[1.0, 2.0, 3.0]]
+
+    # Nothing moved, the matrices are read but nothing is solved or written.
+    assert not constraint.update()
+    assert child.writes == [[1.0, 2.0, 3.0]]
+
+    assert constraint.update(force=True)
+    assert len(child.writes) == 2
+
+    parent.move(4.0, 5.0, 6.0)
+    assert constraint.update()
+    assert child.writes[-1] == [4.0, 5.0, 6.0]
+
+
+def test_kdummyconstraint_events():
+    events = StubEvents()
+    parent = StubTransform("parent")
+    child = StubTransform("child")
+    constraint = KDummyConstraint(parent, child, events=events)
+    assert events.is_watching(constraint)
+
+    assert constraint.update()
+    reads = parent.reads
+
+    # Clean constraints don't even read their matrices.
+    assert not constraint.is_dirty()
+    assert not constraint.update()
+    assert parent.reads == reads
+
+    parent.move(1.0, 0.0, 0.0)
+    events.change(constraint)
+    assert constraint.is_dirty()
+    assert constraint.update()
+    assert child.writes[-1] == [1.0, 0.0, 0.0]
+
+    constraint.set_events(None)
+    assert not events.is_watching(constraint)
+    assert constraint.is_dirty()
+
+
+def test_kdummyconstraint_events_release():
+    released = list()
+
+    class RecordingEvents(StubEvents):
+        def release(self, token):
+            released.append(token)
+            super(RecordingEvents, self).release(token)
+
+    events = RecordingEvents()
+    parent = StubTransform("parent")
+    constraint = KDummyConstraint(parent, StubTransform("child"), events=events)
+    token = events.get_token(constraint)
+
+    # Watching again gives a new token and releases the old one.
+    events.watch(constraint)
+    assert released == [token]
+    assert events.get_token(constraint) != token
+
+    # A dropped constraint is released without unwatch().
+    del constraint
+    gc.collect()
+    assert len(released) == 2
+    assert not events.is_valid()
+
+    other = KDummyConstraint(parent, StubTransform("other"), events=events)
+    assert events.get_token(other) not in released
+
+
+def test_kdummyconstraint_offset_changes():
+    parent = StubTransform("parent")
+    child = StubTransform("child")
+    child.move(10.0, 0.0, 0.0)
+    constraint = KDummyConstraint(parent, child, offset=True)
+
+    assert constraint.update()
+    assert child.writes[-1] == [10.0, 0.0, 0.0]
+    assert not constraint.update()
+
+    # A new offset is solved even though the matrices didn't change.
+    constraint.set_maintain_offset(False)
+    assert KDummyConstraint.update_all([constraint]) == 1
+    assert child.writes[-1] == [0.0, 0.0, 0.0]
+
+    child.move(0.0, 3.0, 0.0)
+    constraint.set_maintain_offset(True)
+    parent.move(1.0, 0.0, 0.0)
+    constraint.update_offset()
+    assert constraint.update()
+    assert child.writes[-1] == [0.0, 3.0, 0.0]
+
+    other = StubTransform("other")
+    other.move(0.0, 0.0, 5.0)
+    constraint.set_maintain_offset(False)
+    constraint.set_parent(other)
+    assert constraint.update()
+    assert child.writes[-1] == [0.0, 0.0, 5.0]
+
+
+def test_kdummyconstraint_update_all():
+    events = StubEvents()
+    parent = StubTransform("parent")
+    children = [StubTransform("child{}".format(index)) for index in range(3)]
+    constraints = [KDummyConstraint(parent, child, events=events) for child in children]
+    assert KDummyConstraint.update_all(constraints) == 3
+    assert KDummyConstraint.update_all(constraints) == 0
+
+    parent.move(0.0, 1.0, 0.0)
+    events.change(constraints[1])
+    assert KDummyConstraint.update_all(constraints) == 1
+    assert [len(child.writes) for child in children] == [1, 2, 1]
+
+
+def test_kdummyconstraint_bake():
+    parent = StubTransform("parent")
+    child = StubTransform("child")
+    parent.move(0.0, 2.0, 0.0)
+    constraint = KDummyConstraint(parent, child)
+
+    constraint.bake(1, 10, evaluator=FrameEvaluator())
+    times, values = child.keys["translateX"]
+    assert times == list(range(1, 11))
+    assert values == [1.0, 2.0, 3.0, 4.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0]
+    assert child.keys["translateY"][1] == [2.0] * 10
+    assert child.tangents == (None, None)
+    assert not child.keep_existing
+
+    # Baking doesn't move the child, and the next update solves again.
+    assert child.writes == list()
+    assert constraint.is_dirty()
+
+    constraint.bake(1, 10, reduce=True, evaluator=FrameEvaluator())
+    assert child.keys["translateX"] == ([1, 5, 10], [1.0, 5.0, 5.0])
+    assert child.keys["translateY"] == ([1, 10], [2.0, 2.0])
+
+    # Spline tangents could overshoot between the kept keys, and old keys in the range would stay.
+    linear = OpenMayaAnim.MFnAnimCurve.kTangentLinear
+    assert child.tangents == (linear, linear)
+    assert not child.keep_existing
@@ -0,0 +1,182 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KAnimCurve, KKeyFrame, KKeyTangent
+
+# Python Modules
+from array import array
+import pytest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def has_numpy(request, monkeypatch):
+    if request.param and numpy is None:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KAnimCurve, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def _fixed(times, values, in_slopes, out_slopes):
+    curve = KAnimCurve()
+    curve.add_keys(times, values, in_slopes, out_slopes)
+    return curve
+
+
+def test_kanimcurve_keys():
+    curve = KAnimCurve.from_keys([10.0, 1.0, 5.0], [2.0, 0.0, 1.0])
+    assert list(curve.times()) == [1.0, 5.0, 10.0]
+    assert list(curve.values()) == [0.0, 1.0, 2.0]
+
+    # A key at the same time replaces the old one.
+    curve.add_key(5.0, 3.0)
+    assert len(curve) == 3
+    assert curve[1].value == 3.0
+
+    assert curve.find(5.0) == 1
+    assert curve.find(6.0) == -1
+    assert curve.find_closest(8.0) == 2
+    assert curve.find_closest(-3.0) == 0
+    assert curve.find_segment(7.0) == 1
+    assert curve.find_segment(0.0) == -1
+
+    curve.remove_key(1)
+    assert list(curve.times()) == [1.0, 10.0]
+
+
+def test_kanimcurve_add_key_in_place():
+    times = [3.0, 0.0, 4.0, 1.0, 2.0]
+    values = [1.0, 0.0, -2.0, 3.0, 2.0]
+    curve = KAnimCurve()
+    data = curve.times()
+
+    for time, value in zip(times, values):
+        curve.add_key(time, value)
+
+    # Single keys are inserted into the same columns, with the same tangents as adding them all at once.
+    assert curve.times() is data
+    expected = KAnimCurve.from_keys(times, values)
+
+    for name, column in expected.columns().items():
+        assert list(curve.columns()[name]) == pytest.approx(list(column))
+
+
+def test_kanimcurve_from_columns():
+    times = array("d", [1.0, 2.0])
+    values = [3.0, 4.0]
+    curve = KAnimCurve.from_columns({"times": times, "values": values, "in_types": array("i", [1, 1])})
+
+    # Arrays of the right type are owned, anything else is converted.
+    assert curve.times() is times
+    assert curve.values() == array("d", values)
+    assert curve.columns()["in_types"].typecode == "b"
+    assert list(curve.columns()["tangent_locks"]) == [1, 1]
+
+
+def test_kanimcurve_keyframe():
+    key = KKeyFrame(2.0, 4.0)
+    assert not key.has_tangent()
+
+    curve = KAnimCurve()
+    curve.add_keyframe(key)
+    curve.add_keyframe(KKeyFrame(4.0, 8.0, KKeyTangent(1.5, 0.5)))
+    assert curve.key(1).tangent == KKeyTangent(1.5, 0.5)
+
+    with pytest.raises(TypeError):
+        hash(KKeyTangent())
+    assert [tuple(key) for key in curve] == [(2.0, 4.0), (4.0, 8.0)]
+
+
+def test_kanimcurve_tangent_types():
+    curve = KAnimCurve.from_keys([0.0, 10.0, 20.0], [0.0, 10.0, 0.0], KAnimCurve.TANGENT_LINEAR)
+    assert curve.evaluate(5.0) == pytest.approx(5.0)
+    assert curve.evaluate(15.0) == pytest.approx(5.0)
+
+    # Auto tangents are flat on extremes, smooth ones aren't.
+    curve = KAnimCurve.from_keys([0.0, 10.0, 20.0], [0.0, 10.0, 20.0])
+    assert curve.key(1).tangent.out_slope == pytest.approx(1.0)
+    assert curve.key(0).tangent.out_slope == 0.0
+
+    curve = KAnimCurve.from_keys([0.0, 10.0, 20.0], [0.0, 10.0, 20.0], KAnimCurve.TANGENT_SMOOTH)
+    assert curve.key(0).tangent.out_slope == pytest.approx(1.0)
+
+
+def test_kanimcurve_hermite():
+    curve = _fixed([0.0, 10.0], [0.0, 10.0], [0.0, 0.0], [0.0, 0.0])
+    assert curve.evaluate(0.0) == 0.0
+    assert curve.evaluate(5.0) == pytest.approx(5.0)
+    assert curve.evaluate(2.5) == pytest.approx(1.5625)
+    assert curve.evaluate(10.0) == 10.0
+
+    # Unweighted is the same as weighted with the default weights.
+    curve.set_weighted(True)
+    assert curve.evaluate(2.5) == pytest.approx(1.5625)
+
+
+def test_kanimcurve_weighted():
+    curve = _fixed([0.0, 12.0], [0.0, 12.0], [1.0, 1.0], [1.0, 1.0])
+    curve.columns()["out_weights"][0] = 30.0
+    curve.columns()["in_weights"][1] = 3.0
+    assert curve.evaluate(6.0) == pytest.approx(6.0)
+
+    curve.set_weighted(True)
+    values = [curve.evaluate(time) for time in range(13)]
+    assert values[0] == 0.0
+    assert values[-1] == pytest.approx(12.0)
+    assert values == sorted(values)
+
+    # The tangents are straight lines, so the curve still follows them where the other key has no influence.
+    assert curve.evaluate(1.0) == pytest.approx(1.0, abs=1e-3)
+
+
+def test_kanimcurve_step():
+    curve = KAnimCurve.from_keys([0.0, 10.0], [1.0, 2.0], KAnimCurve.TANGENT_STEP)
+    assert curve.evaluate(9.9) == 1.0
+    assert curve.evaluate(10.0) == 2.0
+
+    curve = KAnimCurve.from_keys([0.0, 10.0], [1.0, 2.0], KAnimCurve.TANGENT_STEP_NEXT)
+    assert curve.evaluate(0.0) == 1.0
+    assert curve.evaluate(0.1) == 2.0
+
+
+def test_kanimcurve_infinity():
+    curve = KAnimCurve.from_keys([0.0, 10.0], [0.0, 10.0], KAnimCurve.TANGENT_LINEAR)
+    assert curve.evaluate(-5.0) == 0.0
+    assert curve.evaluate(15.0) == 10.0
+
+    curve.set_infinity(KAnimCurve.INFINITY_LINEAR, KAnimCurve.INFINITY_LINEAR)
+    assert curve.evaluate(-5.0) == pytest.approx(-5.0)
+    assert curve.evaluate(15.0) == pytest.approx(15.0)
+
+    curve.set_infinity(KAnimCurve.INFINITY_CYCLE, KAnimCurve.INFINITY_CYCLE)
+    assert curve.evaluate(13.0) == pytest.approx(3.0)
+    assert curve.evaluate(-3.0) == pytest.approx(7.0)
+
+    curve.set_infinity(post=KAnimCurve.INFINITY_CYCLE_RELATIVE)
+    assert curve.evaluate(23.0) == pytest.approx(23.0)
+
+    curve.set_infinity(post=KAnimCurve.INFINITY_OSCILLATE)
+    assert curve.evaluate(13.0) == pytest.approx(7.0)
+    assert curve.evaluate(23.0) == pytest.approx(3.0)
+
+    with pytest.raises(ValueError):
+        curve.set_infinity(pre=2)
+
+
+def test_kanimcurve_evaluate_times(has_numpy):
+    curve = KAnimCurve.from_keys([0.0, 4.0, 10.0, 12.0, 20.0], [0.0, 3.0, -2.0, 1.0, 1.5])
+    curve.add_keys([6.0], [5.0], [0.5], [-1.0], KAnimCurve.TANGENT_FIXED, KAnimCurve.TANGENT_STEP)
+    times = [time * 0.5 - 3.0 for time in range(52)]
+
+    for pre, post, weighted in ((KAnimCurve.INFINITY_CONSTANT, KAnimCurve.INFINITY_LINEAR, False),
+                                (KAnimCurve.INFINITY_OSCILLATE, KAnimCurve.INFINITY_CYCLE_RELATIVE, True)):
+        curve.set_infinity(pre, post)
+        curve.set_weighted(weighted)
+        expected = [curve.evaluate(time) for time in times]
+        assert list(curve.evaluate_times(times)) == pytest.approx(expected)
+
+    assert list(KAnimCurve().evaluate_times([1.0, 2.0])) == [0.0, 0.0]
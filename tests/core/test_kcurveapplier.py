@@ -0,0 +1,94 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KAnimCurve, KCurveWriter, KCurveApplier
+
+# Python Modules
+import pytest
+
+
+class StubWriteAdapter(KCurveWriter):
+    """ Adapter writing curves into a dictionary of existing plugs, counting the applies and reporting every curve
+    written like KModifier.
+    """
+    def __init__(self, plugs):
+        self.plugs = dict((plug, None) for plug in plugs)
+        self.queued = list()
+        self.applies = list()
+        self.written = list()
+
+    def get_plugs(self, targets):
+        return [target if target in self.plugs else None for target in targets]
+
+    def add_curve(self, plug, curve, keep_existing=False):
+        self.queued.append((plug, curve, keep_existing))
+
+    def apply(self, undoable=True, progress=None):
+        self.applies.append(undoable)
+
+        for index, (plug, curve, _) in enumerate(self.queued):
+            self.plugs[plug] = curve
+            self.written.append(plug)
+
+            if progress is not None:
+                progress(index + 1, len(self.queued))
+
+        self.queued = list()
+
+
+def _curves(*targets):
+    return dict((target, KAnimCurve.from_keys([1.0, 10.0], [0.0, float(index)]))
+                for index, target in enumerate(targets))
+
+
+def test_kcurveapplier_get_target():
+    mapping = {"pCube1": "pCube2", "pCube1.translateX": "pSphere1.translateY"}
+    assert KCurveApplier.get_target("pCube1.translateX", mapping) == "pSphere1.translateY"
+    assert KCurveApplier.get_target("pCube1.rotateY", mapping) == "pCube2.rotateY"
+    assert KCurveApplier.get_target("pCone1.rotateY", mapping) == "pCone1.rotateY"
+    assert KCurveApplier.get_target("pCube1.rotateY", None) == "pCube1.rotateY"
+
+
+def test_kcurveapplier_apply():
+    adapter = StubWriteAdapter(["pCube2.translateX", "pCube2.rotateY"])
+    curves = _curves("pCube1.translateX", "pCube1.rotateY", "pCube1.scaleZ")
+    applied = KCurveApplier(adapter).apply(curves, mapping={"pCube1": "pCube2"})
+
+    # Missing plugs are skipped and everything is written at once.
+    assert applied == ["pCube2.translateX", "pCube2.rotateY"]
+    assert adapter.applies == [True]
+    assert adapter.plugs["pCube2.rotateY"] is curves["pCube1.rotateY"]
+
+    adapter = StubWriteAdapter(list())
+    assert KCurveApplier(adapter).apply(curves) == list()
+    assert adapter.applies == list()
+
+
+def test_kcurveapplier_progress(monkeypatch):
+    targets = ["node.attribute{}".format(index) for index in range(100)]
+    adapter = StubWriteAdapter(targets)
+    reports = list()
+
+    # Nothing but the final report when the interval is never reached.
+    monkeypatch.setattr(KCurveApplier, "PROGRESS_INTERVAL", 3600.0)
+    KCurveApplier(adapter).apply(_curves(*targets), progress=lambda done, total: reports.append(done))
+    assert reports == [100]
+
+    # Reported while writing, each report after the curves it counts are written.
+    def progress(done, total):
+        reports.append((done, len(adapter.written)))
+
+    reports = list()
+    adapter.written = list()
+    monkeypatch.setattr(KCurveApplier, "PROGRESS_INTERVAL", 0.0)
+    KCurveApplier(adapter).apply(_curves(*targets + ["missing.attribute"]), progress=progress)
+    assert reports[:-1] == [(done, done) for done in range(1, 101)]
+    assert reports[-1] == (100, 100)
+
+
+def test_kcurveapplier_incomplete_writer():
+    class IncompleteWriter(KCurveWriter):
+        def get_plugs(self, targets):
+            return list()
+
+    with pytest.raises(TypeError):
+        IncompleteWriter()
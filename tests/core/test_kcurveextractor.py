@@ -0,0 +1,95 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KAnimCurve, KCurveReader, KCurveExtractor
+
+# Python Modules
+import pytest
+
+
+class StubCurveAdapter(KCurveReader):
+    """ Adapter reading curves from dictionaries of key tuples, counting the keys read.
+    """
+    def __init__(self, curves):
+        self.curves = curves
+        self.curve = None
+        self.reads = 0
+
+    def get_fps(self):
+        return 24.0
+
+    def get_curves(self, names):
+        return [(target, curve) for target, curve in sorted(self.curves.items()) if target.split(".")[0] in names]
+
+    def set_curve(self, curve):
+        self.curve = curve
+
+    def is_weighted(self):
+        return self.curve.get("weighted", False)
+
+    def get_infinity(self):
+        return self.curve.get("infinity", (0, 0))
+
+    def num_keys(self):
+        return len(self.curve["keys"])
+
+    def read_key(self, index):
+        self.reads += 1
+        return self.curve["keys"][index]
+
+
+def _key(time, value, slope=0.0, weight=1.0, breakdown=False):
+    # Tangent x in seconds at 24 fps, y in value units.
+    x = weight / 24.0
+    return (time, value, KAnimCurve.TANGENT_FIXED, KAnimCurve.TANGENT_LINEAR, x, slope * weight, x, slope * weight,
+            breakdown, True, False)
+
+
+def test_kcurveextractor_extract():
+    adapter = StubCurveAdapter({
+        "pCube1.translateX": {"keys": [_key(1.0, 0.0, 0.5, 3.0), _key(10.0, 5.0, -1.0, 6.0, True)],
+                              "weighted": True, "infinity": (1, 3)},
+        "pCube1.rotateY": {"keys": [_key(1.0, 1.0), _key(5.0, 2.0), _key(9.0, 3.0)]},
+        "pSphere1.translateX": {"keys": [_key(1.0, 0.0)]},
+    })
+    curves = KCurveExtractor(adapter).extract(["pCube1"])
+    assert list(curves) == ["pCube1.rotateY", "pCube1.translateX"]
+
+    curve = curves["pCube1.translateX"]
+    assert curve.is_weighted()
+    assert (curve.pre_infinity(), curve.post_infinity()) == (1, 3)
+    assert list(curve.times()) == [1.0, 10.0]
+    assert list(curve.values()) == [0.0, 5.0]
+
+    columns = curve.columns()
+    assert list(columns["in_slopes"]) == pytest.approx([0.5, -1.0])
+    assert list(columns["out_weights"]) == pytest.approx([3.0, 6.0])
+    assert list(columns["in_types"]) == [KAnimCurve.TANGENT_FIXED] * 2
+    assert list(columns["out_types"]) == [KAnimCurve.TANGENT_LINEAR] * 2
+    assert list(columns["breakdowns"]) == [0, 1]
+    assert list(columns["tangent_locks"]) == [1, 1]
+    assert list(columns["weight_locks"]) == [0, 0]
+
+
+def test_kcurveextractor_range():
+    adapter = StubCurveAdapter({"pCube1.rotateY": {"keys": [_key(time, time) for time in range(1, 11)]}})
+    curve = KCurveExtractor(adapter).extract(["pCube1"], start=3, end=6)["pCube1.rotateY"]
+    assert list(curve.times()) == [3.0, 4.0, 5.0, 6.0]
+
+    # Reading stops at the first key after the range.
+    assert adapter.reads == 7
+
+
+def test_kcurveextractor_evaluate():
+    # Flat tangents with zero length x don't divide by zero.
+    keys = [(1.0, 0.0, 1, 1, 0.0, 0.0, 0.0, 0.0, False, True, True), _key(5.0, 4.0)]
+    curve = KCurveExtractor(StubCurveAdapter({"a.b": {"keys": keys}})).extract(["a"])["a.b"]
+    assert curve.evaluate(3.0) == pytest.approx(2.0)
+
+
+def test_kcurveextractor_incomplete_reader():
+    class IncompleteReader(KCurveReader):
+        def get_fps(self):
+            return 24.0
+
+    with pytest.raises(TypeError):
+        IncompleteReader()
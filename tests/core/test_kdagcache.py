@@ -0,0 +1,114 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KDagCache, KDagCacheEvents
+
+# Python Modules
+import pytest
+
+
+class StubEvents(KDagCacheEvents):
+    """ Event source driven by the tests instead of Maya messages.
+    """
+    def __init__(self):
+        super(StubEvents, self).__init__()
+        self.installs = 0
+
+    def install(self, cache):
+        super(StubEvents, self).install(cache)
+        self.installs += 1
+
+    def rename(self, old_name, new_name):
+        self._cache.on_rename(old_name, new_name)
+
+    def delete(self, name):
+        self._cache.on_delete(name)
+
+    def open_scene(self):
+        self._cache.clear()
+
+
+class StubResolver(object):
+    def __init__(self):
+        self.calls = list()
+
+    def __call__(self, name):
+        self.calls.append(name)
+        return "path:{}".format(name)
+
+
+@pytest.fixture
+def cache():
+    return KDagCache(StubEvents())
+
+
+def test_kdagcache_hit_rate(cache):
+    resolver = StubResolver()
+
+    for _ in range(4):
+        assert cache.get("|rig|arm_ctrl", resolver) == "path:|rig|arm_ctrl"
+
+    assert resolver.calls == ["|rig|arm_ctrl"]
+    assert cache.hit_rate() == pytest.approx(0.75)
+    assert cache.statistics()["hits"] == 3
+
+    cache.reset_statistics()
+    assert cache.hit_rate() == 0.0
+
+
+def test_kdagcache_installs_events_on_first_get(cache):
+    assert not cache.is_valid()
+    cache.get("arm_ctrl", StubResolver())
+    cache.get("leg_ctrl", StubResolver())
+    assert cache.is_valid()
+    assert cache.events().installs == 1
+
+
+def test_kdagcache_rename(cache):
+    resolver = StubResolver()
+    for name in ("|rig|arm_ctrl", "arm_ctrl", "ns:arm_ctrl", "hand_ctrl", "leg_ctrl"):
+        cache.get(name, resolver)
+
+    cache.events().rename("arm_ctrl", "hand_ctrl")
+    assert sorted(cache._entries) == ["leg_ctrl"]
+
+    # Renaming a parent drops the full paths below it.
+    cache.get("|rig|leg_ctrl", resolver)
+    cache.events().rename("rig", "root")
+    assert "|rig|leg_ctrl" not in cache
+    assert "leg_ctrl" in cache
+
+
+def test_kdagcache_delete_and_scene_open(cache):
+    resolver = StubResolver()
+    cache.get("arm_ctrl", resolver)
+    cache.get("leg_ctrl", resolver)
+
+    cache.events().delete("arm_ctrl")
+    assert "arm_ctrl" not in cache
+    assert cache.get("arm_ctrl", resolver) == "path:arm_ctrl"
+    assert resolver.calls == ["arm_ctrl", "leg_ctrl", "arm_ctrl"]
+
+    cache.events().open_scene()
+    assert len(cache) == 0
+    assert cache.statistics()["invalidations"] == 3
+
+
+def test_kdagcache_resolver_error_is_not_cached(cache):
+    def resolver(name):
+        raise RuntimeError("No object matches name.")
+
+    with pytest.raises(RuntimeError):
+        cache.get("missing", resolver)
+
+    assert "missing" not in cache
+
+
+def test_kdagcache_set_events(cache):
+    cache.get("arm_ctrl", StubResolver())
+    events = StubEvents()
+    cache.set_events(events)
+    assert not cache.is_valid()
+    assert len(cache) == 0
+
+    with pytest.raises(TypeError):
+        cache.set_events(object())
@@ -0,0 +1,66 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KEuler, KMatrix4
+
+# Python Modules
+import pytest
+
+
+ORDERS = [KEuler.XYZ, KEuler.YZX, KEuler.ZXY, KEuler.XZY, KEuler.YXZ, KEuler.ZYX]
+
+
+def test_keuler_to_matrix_xyz():
+    # Maya's XYZ rotation matrix, row vectors: Rx * Ry * Rz
+    matrix = KEuler(10.0, 20.0, 30.0).to_matrix()
+    assert list(matrix[0][:3]) == pytest.approx([0.813797681, 0.469846310, -0.342020143])
+    assert list(matrix[1][:3]) == pytest.approx([-0.440969611, 0.882564119, 0.163175911])
+    assert list(matrix[2][:3]) == pytest.approx([0.378522306, 0.018028311, 0.925416578])
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_keuler_matrix_round_trip(order):
+    euler = KEuler(35.0, -60.0, 20.0, order)
+    result = KEuler.from_matrix(euler.to_matrix(), order)
+    assert result.order == order
+    assert result.as_list() == pytest.approx(euler.as_list())
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_keuler_gimbal_lock(order):
+    rotation = [30.0, 30.0, 30.0]
+    rotation[KEuler.ORDER_AXES[order][1]] = 90.0
+    matrix = KEuler(rotation[0], rotation[1], rotation[2], order).to_matrix()
+
+    # The angles can differ but the rotation must be the same
+    result = KEuler.from_matrix(matrix, order).to_matrix()
+    assert list(result.data()) == pytest.approx(list(matrix.data()), abs=1e-9)
+
+
+def test_keuler_from_scaled_matrix():
+    scale = KMatrix4.from_xform([2.0, 0.0, 0.0, 0.0, 0.0, 3.0, 0.0, 0.0, 0.0, 0.0, 4.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+    matrix = scale * KEuler(10.0, 20.0, 30.0).to_matrix()
+    assert KEuler.from_matrix(matrix).as_list() == pytest.approx([10.0, 20.0, 30.0])
+
+
+def test_keuler_reorder():
+    euler = KEuler(10.0, 20.0, 30.0, KEuler.XYZ)
+    reordered = euler.reorder(KEuler.ZYX)
+    assert list(reordered.to_matrix().data()) == pytest.approx(list(euler.to_matrix().data()))
+    assert reordered.reorder(KEuler.XYZ).as_list() == pytest.approx(euler.as_list())
+
+
+@pytest.mark.parametrize("has_numpy", [True, False], ids=["numpy", "python"])
+@pytest.mark.parametrize("order", ORDERS)
+def test_keuler_batch(monkeypatch, has_numpy, order):
+    if has_numpy and not KEuler.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KEuler, "HAS_NUMPY", has_numpy)
+    rotations = [10.0, 20.0, 30.0, -45.0, 60.0, 80.0, 0.0, 0.0, 0.0]
+    xforms = KEuler.rotations_to_xforms(rotations, order)
+    result = KEuler.xforms_to_rotations(xforms, order)
+
+    flat_xforms = list(xforms.ravel()) if has_numpy else list(xforms)
+    flat_result = list(result.ravel()) if has_numpy else list(result)
+    assert flat_xforms[16:32] == pytest.approx(list(KEuler(-45.0, 60.0, 80.0, order).to_matrix().data()))
+    assert flat_result == pytest.approx(rotations)
@@ -0,0 +1,62 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KInbetween
+
+# Python Modules
+from array import array
+import pytest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def has_numpy(request, monkeypatch):
+    if request.param and numpy is None:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KInbetween, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def test_kinbetween_get_neighbours():
+    times = [1.0, 5.0, 10.0, 20.0]
+    assert KInbetween.get_neighbours(times, 7.0) == (1, 2)
+    assert KInbetween.get_neighbours(times, 5.0) == (0, 2)
+    assert KInbetween.get_neighbours(times, 1.0) == (-1, 1)
+    assert KInbetween.get_neighbours(times, 20.0) == (2, -1)
+    assert KInbetween.get_neighbours(times, 0.0) == (-1, 0)
+    assert KInbetween.get_neighbours(times, 25.0) == (3, -1)
+    assert KInbetween.get_neighbours(list(), 1.0) == (-1, -1)
+
+
+def test_kinbetween_blend(has_numpy):
+    inbetween = KInbetween([0.0, 10.0, -4.0], [1.0, 20.0, 4.0])
+    assert len(inbetween) == 3
+    assert list(inbetween.blend(0.0)) == [0.0, 10.0, -4.0]
+    assert list(inbetween.blend(1.0)) == [1.0, 20.0, 4.0]
+    assert list(inbetween.blend(0.25)) == pytest.approx([0.25, 12.5, -2.0])
+
+    # Weights outside 0.0 to 1.0 overshoot.
+    assert list(inbetween.blend(1.5)) == pytest.approx([1.5, 25.0, 8.0])
+    assert list(inbetween.next_values()) == [1.0, 20.0, 4.0]
+
+
+def test_kinbetween_blend_out(has_numpy):
+    inbetween = KInbetween([0.0, 10.0], [2.0, 30.0])
+    out = numpy.zeros(2) if has_numpy else array("d", [0.0, 0.0])
+    assert inbetween.blend(0.5, out=out) is out
+    assert list(out) == [1.0, 20.0]
+
+    buffer = inbetween.new_buffer()
+    assert list(buffer) == [0.0, 0.0]
+    assert list(inbetween.blend(1.0, out=buffer)) == [2.0, 30.0]
+
+
+def test_kinbetween_invalid():
+    assert not KInbetween().is_valid()
+
+    with pytest.raises(ValueError):
+        KInbetween([0.0], [1.0, 2.0])
@@ -0,0 +1,102 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import (KInbetween, KInbetweenProfile, KOvershootProfile, KEaseProfile, KSpringProfile,
+                      KTangentProfile)
+
+# Python Modules
+import pytest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def has_numpy(request, monkeypatch):
+    if request.param and numpy is None:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KInbetween, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def test_kinbetweenprofile_linear():
+    profile = KInbetweenProfile()
+    assert len(profile.table()) == profile.samples() + 1
+    assert profile.table() is profile.table()
+    assert profile.lookup(0.3) == pytest.approx(0.3)
+    assert profile.lookup(-1.0) == 0.0
+    assert profile.lookup(2.0) == 1.0
+    assert profile.presets(5) == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_kinbetweenprofile_overshoot():
+    profile = KOvershootProfile(-2.0, 2.0)
+    assert profile.presets(5) == pytest.approx([-2.0, -1.0, 0.0, 1.0, 2.0])
+
+
+def test_kinbetweenprofile_ease():
+    profile = KEaseProfile(samples=1000)
+    assert profile.lookup(0.0) == 0.0
+    assert profile.lookup(0.5) == pytest.approx(0.5)
+    assert profile.lookup(1.0) == 1.0
+    assert profile.lookup(0.25) == pytest.approx(0.125, abs=1e-4)
+    assert KEaseProfile(ease_out=False).lookup(0.5) == pytest.approx(0.25, abs=1e-4)
+    assert KEaseProfile(ease_in=False).lookup(0.5) == pytest.approx(0.75, abs=1e-4)
+
+
+def test_kinbetweenprofile_spring():
+    profile = KSpringProfile()
+    weights = profile.presets(101)
+    assert weights[0] == pytest.approx(0.0)
+    assert weights[-1] == pytest.approx(1.0)
+    assert max(weights) > 1.0
+
+    # A whole number of undamped oscillations ends where it starts, it can't be scaled onto the next key.
+    with pytest.raises(ValueError):
+        KSpringProfile(2.0, 0.0)
+
+    with pytest.raises(ValueError):
+        KSpringProfile(1.5, -1.0)
+
+    assert KSpringProfile(1.5, 0.0).presets(3)[-1] == pytest.approx(1.0)
+
+
+def test_kinbetweenprofile_lookup_uses_table():
+    class CountingProfile(KInbetweenProfile):
+        calls = 0
+
+        def evaluate(self, position):
+            CountingProfile.calls += 1
+            return position
+
+    profile = CountingProfile(samples=8)
+
+    for position in range(100):
+        profile.lookup(position / 100.0)
+
+    assert CountingProfile.calls == 9
+
+
+def test_kinbetweenprofile_blend(has_numpy):
+    inbetween = KInbetween([0.0, 10.0], [4.0, 20.0])
+    assert list(KOvershootProfile(-1.0, 2.0).blend(inbetween, 1.0)) == pytest.approx([8.0, 30.0])
+
+
+def test_kinbetweenprofile_tangent(has_numpy):
+    # Without tangents the Hermite eases in and out.
+    inbetween = KInbetween([0.0], [1.0])
+    profile = KTangentProfile(samples=1000)
+    assert list(profile.blend(inbetween, 0.5)) == pytest.approx([0.5])
+    assert list(profile.blend(inbetween, 0.25)) == pytest.approx([0.15625], abs=1e-5)
+
+    # Linear tangents follow the line between the keys.
+    inbetween = KInbetween([0.0, 2.0], [1.0, 4.0], [1.0, 2.0], [1.0, 2.0])
+    assert inbetween.has_tangents()
+    assert list(profile.blend(inbetween, 0.25)) == pytest.approx([0.25, 2.5], abs=1e-5)
+
+    # Flat tangents on the previous key, a slope of 3 on the next one.
+    inbetween = KInbetween([0.0], [1.0], [0.0], [3.0])
+    h00, h10, h01, h11 = KTangentProfile.get_basis(0.5)
+    assert list(profile.blend(inbetween, 0.5)) == pytest.approx([h01 + 3.0 * h11], abs=1e-5)
@@ -0,0 +1,124 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KAnimCurve, KKeyReducer
+
+# Python Modules
+import math
+import pytest
+
+
+def _bake(function, count=100):
+    return KAnimCurve.from_keys([float(frame) for frame in range(count)], [function(frame) for frame in range(count)])
+
+
+def _error(curve, reduced):
+    return max(abs(reduced.evaluate(time) - value) for time, value in zip(curve.times(), curve.values()))
+
+
+@pytest.mark.parametrize("method", [KKeyReducer.METHOD_LINEAR, KKeyReducer.METHOD_TANGENT], ids=["linear", "tangent"])
+def test_kkeyreducer_reduce(method):
+    curve = _bake(lambda frame: math.sin(frame * 0.1) * 10.0)
+    reducer = KKeyReducer(method=method)
+
+    for tolerance in (0.1, 0.01, 0.001):
+        reduced = reducer.reduce(curve, tolerance)
+        assert 2 < len(reduced) < len(curve)
+        assert _error(curve, reduced) <= tolerance + 1e-9
+        assert reduced.times()[0] == 0.0
+        assert reduced.times()[-1] == 99.0
+
+
+def test_kkeyreducer_tangent_fit_is_smaller():
+    curve = _bake(lambda frame: math.sin(frame * 0.1) * 10.0)
+    linear = KKeyReducer(method=KKeyReducer.METHOD_LINEAR).reduce(curve, 0.01)
+    tangent = KKeyReducer(method=KKeyReducer.METHOD_TANGENT).reduce(curve, 0.01)
+    assert len(tangent) < len(linear)
+
+
+def test_kkeyreducer_step():
+    curve = KAnimCurve.from_keys(list(range(6)), [0.0, 0.0, 1.0, 1.0, 1.0, 1.0], KAnimCurve.TANGENT_STEP)
+    reduced = KKeyReducer().reduce(curve)
+    assert list(reduced.times()) == [0.0, 2.0, 5.0]
+    assert [reduced.evaluate(time) for time in range(6)] == [0.0, 0.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_kkeyreducer_step_next():
+    # Jumps to the value of the next key right after a key, the key at 1 can't go.
+    curve = KAnimCurve.from_keys([0.0, 1.0, 2.0], [0.0, 0.0, 1.0], KAnimCurve.TANGENT_STEP_NEXT)
+    reduced = KKeyReducer().reduce(curve)
+    assert list(reduced.times()) == [0.0, 1.0, 2.0]
+
+    curve = KAnimCurve.from_keys(list(range(6)), [0.0, 1.0, 1.0, 1.0, 2.0, 2.0], KAnimCurve.TANGENT_STEP_NEXT)
+    reduced = KKeyReducer().reduce(curve)
+    assert list(reduced.times()) == [0.0, 3.0, 5.0]
+
+    for time in (0.0, 0.5, 1.0, 2.5, 3.0, 3.5, 4.0, 5.0):
+        assert reduced.evaluate(time) == curve.evaluate(time)
+
+
+@pytest.mark.parametrize("method", [KKeyReducer.METHOD_LINEAR, KKeyReducer.METHOD_TANGENT], ids=["linear", "tangent"])
+def test_kkeyreducer_mixed(method):
+    reducer = KKeyReducer(method=method)
+
+    # The out type of the last key has no segment.
+    curve = _bake(lambda frame: math.sin(frame * 0.1) * 10.0)
+    count = len(reducer.reduce(curve, 0.01))
+    curve.columns()["out_types"][-1] = KAnimCurve.TANGENT_STEP
+    reduced = reducer.reduce(curve, 0.01)
+    assert len(reduced) == count < len(curve)
+    assert _error(curve, reduced) <= 0.01 + 1e-9
+
+    curve = _bake(lambda frame: math.sin(frame * 0.1) * 10.0)
+
+    for index in range(30, 60):
+        curve.columns()["values"][index] = float(index // 10)
+        curve.columns()["out_types"][index] = KAnimCurve.TANGENT_STEP
+
+    reduced = reducer.reduce(curve, 0.01)
+    assert len(reduced) < len(curve)
+    assert {30.0, 40.0, 50.0, 60.0} <= set(reduced.times())
+    assert _error(curve, reduced) <= 0.01 + 1e-9
+    assert [reduced.evaluate(frame + 0.5) for frame in range(30, 59)] == [float(frame // 10) for frame in range(30, 59)]
+
+
+def test_kkeyreducer_weighted():
+    curve = _bake(lambda frame: math.sin(frame * 0.1) * 10.0)
+    curve.set_weighted(True)
+
+    for name in ("in_weights", "out_weights"):
+        weights = curve.columns()[name]
+
+        for index in range(len(weights)):
+            weights[index] = 0.5
+
+    reduced = KKeyReducer().reduce(curve, 0.01)
+    assert reduced.is_weighted()
+    assert list(reduced.columns()["out_weights"]) == [0.5] * len(reduced)
+    assert len(reduced) < len(curve)
+    assert _error(curve, reduced) <= 0.01 + 1e-9
+
+
+def test_kkeyreducer_tolerances():
+    reducer = KKeyReducer(0.5, 2.0, {"pCube1.translateY": 0.25, "scaleX": 0.125})
+    assert reducer.get_tolerance("pCube1.translateX") == 0.5
+    assert reducer.get_tolerance("pCube1.translateY") == 0.25
+    assert reducer.get_tolerance("pCube1.rotateZ") == pytest.approx(math.radians(2.0))
+    assert reducer.get_tolerance("pSphere1.scaleX") == 0.125
+
+    reducer.set_tolerance("rotateZ", 1.0)
+    assert reducer.get_tolerance("pCube1.rotateZ") == 1.0
+
+
+def test_kkeyreducer_reduce_curves():
+    # Same values, but radians are far more sensitive than centimeters.
+    curves = {"pCube1.translateX": _bake(lambda frame: math.sin(frame * 0.1) * 0.2),
+              "pCube1.rotateX": _bake(lambda frame: math.sin(frame * 0.1) * 0.2)}
+    reduced = KKeyReducer(0.01, 0.01, method=KKeyReducer.METHOD_LINEAR).reduce_curves(curves)
+    assert list(reduced) == list(curves)
+    assert len(reduced["pCube1.translateX"]) < len(reduced["pCube1.rotateX"])
+    assert _error(curves["pCube1.rotateX"], reduced["pCube1.rotateX"]) <= math.radians(0.01) + 1e-9
+
+
+def test_kkeyreducer_invalid():
+    with pytest.raises(ValueError):
+        KKeyReducer(method=3)
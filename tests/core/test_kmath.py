@@ -0,0 +1,26 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KMath
+
+# Python Modules
+import pytest
+
+
+def test_kmath_clamp():
+    assert KMath.clamp(1.5, 0.0, 1.0) == 1.0
+    assert KMath.set_range(0.25, 0.0, 1.0, -10.0, 10.0) == pytest.approx(-5.0)
+
+
+def test_kmath_get_linear_keys():
+    times = [0, 1, 2, 3, 4, 5, 6]
+    assert KMath.get_linear_keys(times, [0.0, 1.0, 2.0, 3.0, 3.0, 3.0, 0.0]) == [0, 3, 5, 6]
+    assert KMath.get_linear_keys(times, [1.0] * 7) == [0, 6]
+    assert KMath.get_linear_keys(times[:2], [0.0, 1.0]) == [0, 1]
+
+    # Keys within tolerance of the line are removed.
+    assert KMath.get_linear_keys(times[:3], [0.0, 0.5001, 1.0], tolerance=1e-3) == [0, 2]
+    assert KMath.get_linear_keys(times[:3], [0.0, 0.6, 1.0], tolerance=1e-3) == [0, 1, 2]
+
+    # A long straight run with a single corner.
+    values = [float(min(frame, 5000)) for frame in range(10000)]
+    assert KMath.get_linear_keys(list(range(10000)), values) == [0, 5000, 9999]
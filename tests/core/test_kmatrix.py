@@ -0,0 +1,263 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KEuler, KMatrix, KMatrix4, KMatrix4Array, KMatrixLU
+
+# Python Modules
+import math
+import pytest
+
+
+def _assert_matrix_almost_equal(a, b, tolerance=1e-9):
+    for row_a, row_b in zip(a, b):
+        for value_a, value_b in zip(row_a, row_b):
+            assert abs(value_a - value_b) < tolerance
+
+
+def test_kmatrix_determinant():
+    assert KMatrix.get_matrix_deternminant([[4.0, 3.0], [6.0, 3.0]]) == pytest.approx(-6.0)
+    assert KMatrix.get_matrix_deternminant([[2.0, 0.0, 1.0], [1.0, 3.0, 2.0], [1.0, 1.0, 2.0]]) == pytest.approx(6.0)
+
+
+def test_kmatrix_determinant_singular():
+    assert KMatrix.get_matrix_deternminant([[1.0, 2.0], [2.0, 4.0]]) == 0.0
+
+
+def test_kmatrix_inverse():
+    matrix = [[0.0, 2.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 4.0, 0.0], [1.0, 2.0, 3.0, 1.0]]
+    inverse = KMatrix.get_matrix_inverse(matrix)
+    _assert_matrix_almost_equal(KMatrix.multiply_matrix(matrix, inverse), KMatrix.get_identity_matrix(4))
+
+
+def test_kmatrix_determinant_badly_scaled():
+    lu = KMatrixLU([[1e6, 0.0], [0.0, 1e-7]])
+    assert not lu.is_singular()
+    assert lu.determinant() == pytest.approx(0.1)
+    _assert_matrix_almost_equal(lu.inverse(), [[1e-6, 0.0], [0.0, 1e7]])
+    assert KMatrixLU([[1e6, 2e6], [1e-7, 2e-7]]).is_singular()
+
+
+def test_kmatrix_inverse_singular():
+    with pytest.raises(ZeroDivisionError):
+        KMatrix.get_matrix_inverse([[1.0, 2.0], [2.0, 4.0]])
+
+
+def test_kmatrix_lu_reuse():
+    lu = KMatrix.get_matrix_lu([[2.0, 1.0], [1.0, 3.0]])
+    assert isinstance(lu, KMatrixLU)
+    assert lu.determinant() == pytest.approx(5.0)
+    assert lu.solve([3.0, 5.0]) == pytest.approx([0.8, 1.4])
+    _assert_matrix_almost_equal(lu.solve([[3.0, 1.0], [5.0, 0.0]]), [[0.8, 0.6], [1.4, -0.2]])
+
+
+def test_kmatrix_lu_not_square():
+    with pytest.raises(ArithmeticError):
+        KMatrixLU([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+
+def _trs_matrix(angle, scale, translation):
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    matrix = KMatrix4()
+    matrix.set_data([[cos * scale[0], sin * scale[0], 0.0, 0.0],
+                     [-sin * scale[1], cos * scale[1], 0.0, 0.0],
+                     [0.0, 0.0, scale[2], 0.0],
+                     [translation[0], translation[1], translation[2], 1.0]])
+    return matrix
+
+
+def test_kmatrix4_inverse_mode():
+    assert KMatrix4.get_inverse_mode(_trs_matrix(0.7, (1.0, 1.0, 1.0), (1.0, 2.0, 3.0)).data()) == KMatrix4.INVERSE_RIGID
+    assert KMatrix4.get_inverse_mode(_trs_matrix(0.7, (2.0, 3.0, 0.5), (1.0, 2.0, 3.0)).data()) == KMatrix4.INVERSE_AFFINE
+
+    sheared = KMatrix4()
+    sheared.set(0, 1, 0.5)
+    assert KMatrix4.get_inverse_mode(sheared.data()) == KMatrix4.INVERSE_GENERAL
+
+    projective = KMatrix4()
+    projective.set(2, 3, 1.0)
+    assert KMatrix4.get_inverse_mode(projective.data()) == KMatrix4.INVERSE_GENERAL
+
+
+@pytest.mark.parametrize("scale, shear", [(1.0, 0.0009), (1000.0, 0.5), (1.0, 1e-7)])
+def test_kmatrix4_inverse_near_shear(scale, shear):
+    matrix = _trs_matrix(0.7, (scale, scale, scale), (1.0, 2.0, 3.0))
+    matrix.set(1, 0, matrix.get(1, 0) + shear)
+    assert KMatrix4.get_inverse_mode(matrix.data()) == KMatrix4.INVERSE_GENERAL
+
+    identity = (matrix * matrix.inverse()).as_list()
+    _assert_matrix_almost_equal(identity, KMatrix4.get_raw_origin(), 1e-12)
+
+
+@pytest.mark.parametrize("mode, scale", [(KMatrix4.INVERSE_AFFINE, (2.0, 3.0, 0.5)),
+                                         (KMatrix4.INVERSE_RIGID, (1.0, 1.0, 1.0)),
+                                         (KMatrix4.INVERSE_AUTO, (2.0, 3.0, 0.5))])
+def test_kmatrix4_inverse_affine(mode, scale):
+    matrix = _trs_matrix(0.7, scale, (1.0, 2.0, 3.0))
+    expected = matrix.inverse(mode=KMatrix4.INVERSE_GENERAL)
+    _assert_matrix_almost_equal(matrix.inverse(mode=mode).as_list(), expected.as_list())
+
+
+def test_kmatrix4_inverse_out():
+    matrix = _trs_matrix(0.7, (2.0, 3.0, 0.5), (1.0, 2.0, 3.0))
+    expected = matrix.inverse(mode=KMatrix4.INVERSE_GENERAL)
+
+    out = KMatrix4()
+    assert matrix.inverse(out=out) is out
+    _assert_matrix_almost_equal(out.as_list(), expected.as_list())
+
+    # Inverting in place
+    matrix.inverse(out=matrix)
+    _assert_matrix_almost_equal(matrix.as_list(), expected.as_list())
+
+
+def test_kmatrix4_storage():
+    matrix = KMatrix4.from_xform([float(x) for x in range(16)])
+    assert not hasattr(matrix, "__dict__")
+    assert sorted(matrix.as_dict()) == ["_columns", "_data", "_rows"]
+    assert matrix[1][2] == 6.0
+    assert matrix[3, 0] == 12.0
+
+    # Row and xform views write into the matrix storage
+    matrix[1][2] = -1.0
+    matrix.xform_view()[0] = -2.0
+    assert matrix.get(1, 2) == -1.0
+    assert matrix.as_xform()[0] == -2.0
+    assert matrix.as_list()[1] == [4.0, 5.0, -1.0, 7.0]
+
+
+def test_kmatrix4_from_xform_no_copy():
+    xform = KMatrix4.IDENTITY[:]
+    matrix = KMatrix4.from_xform(xform, copy=False)
+    xform[12] = 5.0
+    assert matrix[3][0] == 5.0
+    assert KMatrix4.from_xform(xform)[3][0] == 5.0
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def kmatrix4array_backend(request, monkeypatch):
+    if request.param and not KMatrix4Array.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KMatrix4Array, "HAS_NUMPY", request.param)
+    monkeypatch.setattr(KEuler, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def test_kmatrix4array_multiply_inverse(kmatrix4array_backend):
+    matrices = [_trs_matrix(0.1 * i, (1.0 + i, 2.0, 3.0), (i, 2.0 * i, 3.0)) for i in range(5)]
+    parent = _trs_matrix(0.3, (1.0, 1.0, 1.0), (1.0, 1.0, 1.0))
+    stack = KMatrix4Array.from_matrices(matrices)
+
+    for result, matrix in zip((stack * parent).as_matrices(), matrices):
+        _assert_matrix_almost_equal(result.as_list(), (matrix * parent).as_list())
+
+    for result, matrix in zip(stack.inverse(), matrices):
+        _assert_matrix_almost_equal(result.as_list(), matrix.inverse().as_list())
+
+
+def test_kmatrix4array_multiply_empty(kmatrix4array_backend):
+    stack = KMatrix4Array.from_matrices([_trs_matrix(0.1, (1.0, 2.0, 3.0), (1.0, 2.0, 3.0))])
+    assert len(KMatrix4Array() * KMatrix4()) == 0
+    assert len(KMatrix4Array() * stack) == 0
+    assert len(stack * KMatrix4Array()) == 0
+
+
+def test_kmatrix4array_inverse_singular(kmatrix4array_backend):
+    matrices = [_trs_matrix(0.1, (1.0, 2.0, 3.0), (1.0, 2.0, 3.0)), _trs_matrix(0.2, (1.0, 0.0, 1.0), (0.0, 0.0, 0.0))]
+
+    with pytest.raises(ZeroDivisionError):
+        KMatrix4Array.from_matrices(matrices).inverse()
+
+
+def test_kmatrix4array_xforms(kmatrix4array_backend):
+    xforms = [float(x) for x in range(32)]
+    stack = KMatrix4Array.from_xforms(xforms)
+    assert len(stack) == 2
+    assert list(stack.as_xforms()) == xforms
+    assert stack.transpose()[1].as_list() == [list(row) for row in zip(*stack[1].as_list())]
+
+
+def test_kmatrix4array_decompose(kmatrix4array_backend):
+    stack = KMatrix4Array.from_matrices([_trs_matrix(math.radians(30.0), (2.0, 3.0, 4.0), (1.0, 2.0, 3.0))])
+    translations, eulers, scales = [values.ravel() if kmatrix4array_backend else values
+                                    for values in stack.decompose()]
+    assert list(translations) == pytest.approx([1.0, 2.0, 3.0])
+    assert list(eulers) == pytest.approx([0.0, 0.0, 30.0])
+    assert list(scales) == pytest.approx([2.0, 3.0, 4.0])
+
+
+def _sheared_matrix(scale, shear, angle, translation):
+    # scale * shear * rotation about Z, the order Maya composes a transform in.
+    sx, sy, sz = scale
+    xy, xz, yz = shear
+    c, s = math.cos(angle), math.sin(angle)
+    scale_shear = [[sx, 0.0, 0.0], [sy * xy, sy, 0.0], [sz * xz, sz * yz, sz]]
+    rotation = [[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]]
+    rows = KMatrix.multiply_matrix(scale_shear, rotation)
+    return KMatrix4.from_xform([value for row in rows for value in row + [0.0]] + list(translation) + [1.0])
+
+
+def test_kmatrix4_decompose_xform_shear():
+    matrix = _sheared_matrix((2.0, 3.0, 4.0), (0.5, -0.25, 0.75), math.radians(30.0), (1.0, 2.0, 3.0))
+    values = KMatrix4.decompose_xform(matrix.data())
+    assert isinstance(values, tuple)
+    assert list(values) == pytest.approx([1.0, 2.0, 3.0, 0.0, 0.0, 30.0, 2.0, 3.0, 4.0, 0.5, -0.25, 0.75])
+
+    out = [0.0] * 12
+    assert matrix.decompose_values(out=out) is out
+    assert out == pytest.approx(list(values))
+
+
+def test_kmatrix4_decompose_xform_mirrored():
+    matrix = _sheared_matrix((-2.0, 3.0, 4.0), (0.5, 0.25, 0.0), math.radians(-45.0), (0.0, 0.0, 0.0))
+    values = KMatrix4.decompose_xform(matrix.data())
+    assert list(values[3:]) == pytest.approx([0.0, 0.0, -45.0, -2.0, 3.0, 4.0, 0.5, 0.25, 0.0])
+
+    translation, euler, scale = matrix.decompose()
+    assert scale.as_list() == pytest.approx([-2.0, 3.0, 4.0])
+    assert euler.as_list() == pytest.approx([0.0, 0.0, -45.0])
+
+
+def test_kmatrix4array_decompose_shear(kmatrix4array_backend):
+    matrices = [_sheared_matrix((2.0, 3.0, 4.0), (0.5, -0.25, 0.75), math.radians(30.0), (1.0, 2.0, 3.0)),
+                _sheared_matrix((-2.0, 1.0, 1.0), (0.5, 0.25, 0.0), math.radians(-45.0), (0.0, 0.0, 0.0))]
+    stack = KMatrix4Array.from_matrices(matrices)
+    results = [list(values.ravel() if kmatrix4array_backend else values) for values in stack.decompose(shear=True)]
+
+    for index, matrix in enumerate(matrices):
+        expected = KMatrix4.decompose_xform(matrix.data())
+        for column, result in enumerate(results):
+            assert result[index * 3:index * 3 + 3] == pytest.approx(expected[column * 3:column * 3 + 3])
+
+
+def test_kmatrix4_multiply_chain():
+    a = _trs_matrix(0.3, (1.0, 2.0, 3.0), (1.0, 2.0, 3.0))
+    b = _trs_matrix(-0.2, (0.5, 1.0, 1.0), (-1.0, 0.0, 2.0))
+    c = _trs_matrix(1.1, (1.0, 1.0, 2.0), (0.0, 4.0, 0.0))
+    expected = KMatrix.multiply_matrix(KMatrix.multiply_matrix(a.as_list(), b.as_list()), c.as_list())
+
+    _assert_matrix_almost_equal((a * b * c).as_list(), expected)
+    _assert_matrix_almost_equal(KMatrix4.chain(a, b, c).as_list(), expected)
+
+    out = KMatrix4()
+    assert KMatrix4.chain(a, b, c, out=out) is out
+    _assert_matrix_almost_equal(out.as_list(), expected)
+
+    # The output can be any of the inputs
+    KMatrix4.chain(a, b, c, out=c)
+    _assert_matrix_almost_equal(c.as_list(), expected)
+
+
+def test_kmatrix4_multiply_in_place():
+    a = _trs_matrix(0.3, (1.0, 2.0, 3.0), (1.0, 2.0, 3.0))
+    b = _trs_matrix(-0.2, (0.5, 1.0, 1.0), (-1.0, 0.0, 2.0))
+    expected = KMatrix.multiply_matrix(a.as_list(), b.as_list())
+
+    out = KMatrix4()
+    assert a.multiply_into(b, out) is out
+    _assert_matrix_almost_equal(out.as_list(), expected)
+
+    storage = a.data()
+    a *= b
+    assert a.data() is storage
+    _assert_matrix_almost_equal(a.as_list(), expected)
@@ -0,0 +1,63 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KEuler, KQuaternion
+
+# Python Modules
+import pytest
+
+
+def test_kquaternion_axis_angle_matrix():
+    # 90 degrees around Z, Maya row vectors: X goes to Y
+    quaternion = KQuaternion.from_axis_angle((0.0, 0.0, 1.0), 90.0)
+    assert list(quaternion.as_matrix()[0][:3]) == pytest.approx([0.0, 1.0, 0.0], abs=1e-12)
+    assert quaternion.as_list() == pytest.approx(KQuaternion.from_euler(KEuler(0.0, 0.0, 90.0)).as_list())
+
+
+@pytest.mark.parametrize("order", [KEuler.XYZ, KEuler.ZXY, KEuler.YXZ])
+def test_kquaternion_euler_round_trip(order):
+    euler = KEuler(35.0, -60.0, 20.0, order)
+    assert KQuaternion.from_euler(euler).as_euler(order).as_list() == pytest.approx(euler.as_list())
+
+
+def test_kquaternion_multiply_matches_matrix():
+    a = KQuaternion.from_euler(KEuler(10.0, 20.0, 30.0))
+    b = KQuaternion.from_euler(KEuler(-40.0, 15.0, 70.0))
+    expected = a.as_matrix() * b.as_matrix()
+    assert list((a * b).as_matrix().data()) == pytest.approx(list(expected.data()), abs=1e-12)
+
+
+def test_kquaternion_slerp():
+    a = KQuaternion()
+    b = KQuaternion.from_axis_angle((0.0, 1.0, 0.0), 90.0)
+    assert KQuaternion.slerp(a, b, 0.5).as_euler().as_list() == pytest.approx([0.0, 45.0, 0.0])
+    assert KQuaternion.lerp(a, b, 0.5).as_euler().as_list() == pytest.approx([0.0, 45.0, 0.0])
+
+    # Shortest path, -b is the same rotation
+    assert KQuaternion.slerp(a, -b, 0.5).as_euler().as_list() == pytest.approx([0.0, 45.0, 0.0])
+
+
+@pytest.mark.parametrize("has_numpy", [True, False], ids=["numpy", "python"])
+def test_kquaternion_slerp_array(monkeypatch, has_numpy):
+    if has_numpy and not KQuaternion.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KQuaternion, "HAS_NUMPY", has_numpy)
+    a = [KQuaternion(), KQuaternion.from_axis_angle((1.0, 0.0, 0.0), 30.0)]
+    b = [KQuaternion.from_axis_angle((0.0, 1.0, 0.0), 90.0), KQuaternion.from_axis_angle((0.0, 0.0, 1.0), 60.0)]
+    weights = [0.25, 0.5]
+
+    result = KQuaternion.slerp_array([v for q in a for v in q], [v for q in b for v in q], weights)
+    result = list(result.ravel()) if has_numpy else list(result)
+
+    for index in range(2):
+        expected = KQuaternion.slerp(a[index], b[index], weights[index])
+        assert result[index * 4:index * 4 + 4] == pytest.approx(expected.as_list())
+
+
+def test_kquaternion_decompose():
+    matrix = KEuler(10.0, 20.0, 30.0).to_matrix()
+    matrix.set(3, 0, 5.0)
+    translation, rotation, scale = matrix.decompose(quaternion=True)
+    assert isinstance(rotation, KQuaternion)
+    assert rotation.as_euler().as_list() == pytest.approx([10.0, 20.0, 30.0])
+    assert list(translation) == pytest.approx([5.0, 0.0, 0.0])
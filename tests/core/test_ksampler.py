@@ -0,0 +1,93 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KMatrix4Array, KMatrixSampler, KSamplerEvaluator
+
+# Python Modules
+from array import array
+import pytest
+
+
+class StubEvaluator(KSamplerEvaluator):
+    """ Returns a matrix translated by (frame, transform index, 0).
+    """
+    def __init__(self):
+        self.contexts = list()
+        self.reads = 0
+
+    def get_context(self, frame):
+        self.contexts.append(frame)
+        return frame
+
+    def read(self, transform, attribute, context, out):
+        assert attribute == KMatrixSampler.WORLD_MATRIX
+        self.reads += 1
+
+        for index in range(16):
+            out[index] = 1.0 if index % 5 == 0 else 0.0
+
+        out[12] = context
+        out[13] = transform
+        return
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def sampler_backend(request, monkeypatch):
+    if request.param and not KMatrixSampler.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KMatrixSampler, "HAS_NUMPY", request.param)
+    monkeypatch.setattr(KMatrix4Array, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def test_ksampler_get_frames():
+    assert KMatrixSampler.get_frames(1, 4) == [1, 2, 3, 4]
+    assert KMatrixSampler.get_frames(0.0, 1.0, 0.25) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    with pytest.raises(ValueError):
+        KMatrixSampler.get_frames(0, 10, 0)
+
+
+def test_ksampler_sample(sampler_backend):
+    evaluator = StubEvaluator()
+    sampler = KMatrixSampler([0, 1, 2], evaluator=evaluator)
+    result = sampler.sample(10, 13)
+
+    # One context per frame, one read per transform and frame.
+    assert evaluator.contexts == [10, 11, 12, 13]
+    assert evaluator.reads == 12
+
+    if sampler_backend:
+        assert result.shape == (4, 3, 16)
+        assert list(result[2, 1, 12:14]) == [12.0, 1.0]
+    else:
+        assert len(result) == 4 * 3 * 16
+        offset = (2 * 3 + 1) * 16
+        assert list(result[offset + 12:offset + 14]) == [12.0, 1.0]
+
+
+def test_ksampler_sample_out():
+    sampler = KMatrixSampler([0, 1], evaluator=StubEvaluator())
+    out = array("d", [0.0]) * 64
+    assert sampler.sample(1, 2, out=out) is out
+    assert out[16 * 3 + 12] == 2.0
+
+    with pytest.raises(ValueError):
+        sampler.sample(1, 3, out=out)
+
+
+def test_ksampler_sample_stack(sampler_backend):
+    sampler = KMatrixSampler([0, 1], evaluator=StubEvaluator())
+    stack = sampler.sample_stack(5, 7)
+    assert isinstance(stack, KMatrix4Array)
+    assert len(stack) == 6
+    assert stack[2 * 2 + 1].as_xform()[12:14] == [7.0, 1.0]
+
+
+def test_ksampler_incomplete_evaluator():
+    class IncompleteEvaluator(KSamplerEvaluator):
+        def get_context(self, frame):
+            return frame
+
+    with pytest.raises(TypeError):
+        IncompleteEvaluator()
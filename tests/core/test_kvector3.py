@@ -0,0 +1,80 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KVector3, KVector3Array
+
+# Python Modules
+import pytest
+
+
+def test_kvector3_slots():
+    vector = KVector3(1, 2, 3)
+    assert not hasattr(vector, "__dict__")
+    assert vector[0] == 1.0 and vector[-1] == 3.0
+    assert repr(vector) == "KVector3(1.0, 2.0, 3.0)"
+    assert vector.as_dict() == {"x": 1.0, "y": 2.0, "z": 3.0}
+
+
+def test_kvector3_operators():
+    vector = KVector3(1.0, 2.0, 3.0)
+    assert (vector + KVector3(1.0, 1.0, 1.0)).as_list() == [2.0, 3.0, 4.0]
+    assert (vector - [1.0, 1.0, 1.0]).as_list() == [0.0, 1.0, 2.0]
+    assert (vector * 2).as_list() == [2.0, 4.0, 6.0]
+    assert (2.0 * vector).as_list() == [2.0, 4.0, 6.0]
+    assert (vector / 2.0).as_list() == [0.5, 1.0, 1.5]
+
+
+def test_kvector3_in_place():
+    vector = KVector3(1.0, 2.0, 3.0)
+    result = vector
+    vector += KVector3(1.0, 1.0, 1.0)
+    vector -= (0.5, 0.5, 0.5)
+    vector *= 2.0
+    assert vector is result
+    assert vector.as_list() == [3.0, 5.0, 7.0]
+
+
+def test_kvector3_products():
+    x = KVector3(1.0, 0.0, 0.0)
+    y = KVector3(0.0, 1.0, 0.0)
+    assert x.dot(y) == 0.0
+    assert x.cross(y).as_list() == [0.0, 0.0, 1.0]
+    assert x.angle(y) == pytest.approx(90.0)
+    assert KVector3(3.0, 0.0, 4.0).normal().as_list() == pytest.approx([0.6, 0.0, 0.8])
+    assert KVector3.lerp(x, y, 0.5).as_list() == [0.5, 0.5, 0.0]
+
+
+@pytest.mark.parametrize("has_numpy", [True, False], ids=["numpy", "python"])
+def test_kvector3array(monkeypatch, has_numpy):
+    if has_numpy and not KVector3Array.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KVector3Array, "HAS_NUMPY", has_numpy)
+    vectors = KVector3Array.from_vectors([(1.0, 0.0, 0.0), (0.0, 3.0, 4.0)])
+
+    assert [v.as_list() for v in vectors + KVector3(1.0, 1.0, 1.0)] == [[2.0, 1.0, 1.0], [1.0, 4.0, 5.0]]
+    assert list(vectors.lengths()) == pytest.approx([1.0, 5.0])
+    assert list(vectors.dot((0.0, 1.0, 0.0))) == pytest.approx([0.0, 3.0])
+    assert vectors.cross((0.0, 0.0, 1.0))[0].as_list() == pytest.approx([0.0, -1.0, 0.0])
+
+    vectors *= 2.0
+    vectors.normalize()
+    assert list(vectors.as_values()) == pytest.approx([1.0, 0.0, 0.0, 0.0, 0.6, 0.8])
+
+
+@pytest.mark.parametrize("has_numpy", [True, False], ids=["numpy", "python"])
+def test_kvector3array_in_place(monkeypatch, has_numpy):
+    if has_numpy and not KVector3Array.HAS_NUMPY:
+        pytest.skip("NumPy is not available.")
+
+    monkeypatch.setattr(KVector3Array, "HAS_NUMPY", has_numpy)
+    vectors = KVector3Array.from_vectors([(1.0, 0.0, 0.0), (0.0, 3.0, 4.0)])
+    data = vectors.data()
+
+    vectors += KVector3(1.0, 2.0, 3.0)
+    vectors -= 1.0
+    assert vectors.data() is data
+    assert list(vectors.as_values()) == pytest.approx([1.0, 1.0, 2.0, 0.0, 4.0, 6.0])
+
+    assert [v.as_list() for v in KVector3(1.0, 1.0, 1.0) - vectors] == [[0.0, 0.0, -1.0], [1.0, -3.0, -5.0]]
+    assert [v.as_list() for v in 1.0 - vectors] == [[0.0, 0.0, -1.0], [1.0, -3.0, -5.0]]
+    assert [v.as_list() for v in KVector3(1.0, 1.0, 1.0) + vectors] == [[2.0, 2.0, 3.0], [1.0, 5.0, 7.0]]
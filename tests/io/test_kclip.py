@@ -0,0 +1,131 @@
+# :coding: utf-8
+# Project Modules
+from kid.core import KAnimCurve
+from kid.io import Kclip, KClipCurves
+
+# Python Modules
+import mmap
+import pytest
+
+
+def _curves():
+    weighted = KAnimCurve.from_keys([1.0, 5.0, 12.0], [0.0, 2.5, -1.0])
+    weighted.set_weighted(True)
+    weighted.set_infinity(KAnimCurve.INFINITY_LINEAR, KAnimCurve.INFINITY_CYCLE)
+    weighted.columns()["breakdowns"][1] = 1
+
+    return {"pCube1.translateX": weighted,
+            "pCube1.rotateY": KAnimCurve.from_keys([0.0, 10.0], [1.0, 2.0], KAnimCurve.TANGENT_STEP),
+            "pSphere1.translateX": KAnimCurve.from_keys([3.0], [4.0]),
+            "curve1": KAnimCurve()}
+
+
+def test_kclip_round_trip(tmp_path):
+    path = str(tmp_path / "clip.kclip")
+    curves = _curves()
+    Kclip.write(path, curves)
+
+    clip = Kclip.read(path)
+    assert isinstance(clip.data, KClipCurves)
+    assert list(clip.data) == list(curves)
+
+    for target, curve in curves.items():
+        loaded = clip.data[target]
+        assert loaded.columns() == curve.columns()
+        assert loaded.is_weighted() == curve.is_weighted()
+        assert (loaded.pre_infinity(), loaded.post_infinity()) == (curve.pre_infinity(), curve.post_infinity())
+
+    assert clip.root.extension == ".kclip"
+    clip.data.close()
+
+
+def test_kclip_lazy(tmp_path):
+    path = str(tmp_path / "clip.kclip")
+    Kclip.write(path, _curves())
+
+    clip = Kclip.read(path)
+    assert clip.data.loaded() == 0
+    assert clip.data["pCube1.rotateY"].evaluate(5.0) == 1.0
+    assert clip.data.loaded() == 1
+    assert clip.data["pCube1.rotateY"] is clip.data["pCube1.rotateY"]
+
+    # Closing only releases the map, the loaded curves stay usable.
+    with clip.data as curves:
+        assert curves.is_valid()
+
+    assert not curves.is_valid()
+    assert clip.data.loaded() == 1
+    assert clip.data["pCube1.rotateY"].evaluate(5.0) == 1.0
+
+    with pytest.raises(ValueError):
+        clip.data["pCube1.translateX"]
+
+    with pytest.raises(KeyError):
+        clip.data["pCube2.translateX"]
+
+    clip = Kclip.read(path)
+
+    with clip.data as curves:
+        curves.load_all()
+
+    assert clip.data.loaded() == 4
+    assert len(clip.data["pCube1.translateX"]) == 3
+
+
+def test_kclip_string_table(tmp_path):
+    path = str(tmp_path / "clip.kclip")
+    curves = dict(("pCube1.attribute{}".format(index), KAnimCurve.from_keys([0.0], [0.0])) for index in range(3))
+    Kclip.write(path, curves)
+
+    with open(path, "rb") as stream:
+        assert stream.read().count(b"pCube1") == 1
+
+
+def test_kclip_invalid(tmp_path):
+    path = tmp_path / "clip.kclip"
+    path.write_bytes(b"NOPE" + b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        Kclip.read(str(path))
+
+    data = bytearray(Kclip.HEADER.pack(Kclip.MAGIC, Kclip.VERSION + 1, 0, 0, 0, 0, 0, 0, 0))
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        Kclip.read(str(path))
+
+
+def test_kclip_invalid_closes_map(tmp_path, monkeypatch):
+    closed = list()
+
+    class RecordingMap(mmap.mmap):
+        def close(self):
+            closed.append(self)
+            super(RecordingMap, self).close()
+
+    monkeypatch.setattr(mmap, "mmap", RecordingMap)
+    path = tmp_path / "clip.kclip"
+
+    # Shorter than the header, nothing is mapped.
+    path.write_bytes(b"KCLP")
+
+    with pytest.raises(ValueError):
+        Kclip.read(str(path))
+
+    assert not closed
+
+    path.write_bytes(b"NOPE" + b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        Kclip.read(str(path))
+
+    assert len(closed) == 1
+
+    # A curve index past the end of the file.
+    path.write_bytes(Kclip.HEADER.pack(Kclip.MAGIC, Kclip.VERSION, 0, 10, 0, 0, Kclip.HEADER.size,
+                                       Kclip.HEADER.size + 4, 0))
+
+    with pytest.raises(ValueError):
+        Kclip.read(str(path))
+
+    assert len(closed) == 2